@@ -369,17 +369,14 @@ def decide_next_optimisation_node(state):
         app, f"{ROOT_DIR}/article-harmonisation/docs/images/article_rewriting_flow.png"
     )
 
-    # Declaring directories
-    EXTRACTED_TEXT_DIRECTORY = (
-        f"{ROOT_DIR}/content-optimization/data/02_intermediate/all_extracted_text/"
-    )
-
-    # Declaring title of the articles here. Currently only 2 articles are used and this section is declared at the start, which is bound to change with further developments.
-    # ARTICLE1_TITLE = "Diabetic Foot Ulcer_ Symp_1437648.txt"
-    # ARTICLE2_TITLE = "Diabetic Foot Care_1437355.txt"
-
-    ARTICLE1_TITLE = "diseases-and-conditions/Rubella_1437892.txt"  # metric required to determine which prompt to use
-    ARTICLE2_TITLE = "live-healthy-articles/How Dangerous Is Rubella__1445577.txt"
+    # Declaring the IDs of the articles here; their extracted text is in the `all_extracted_text` dataset
+    # of the `data_processing` pipeline, keyed by article ID. Currently only 2 articles are used and
+    # this section is declared at the start, which is bound to change with further developments.
+    # ARTICLE1_ID = 1437648  # Diabetic Foot Ulcer: Symptoms
+    # ARTICLE2_ID = 1437355  # Diabetic Foot Care
+
+    ARTICLE1_ID = 1437892  # Rubella; metric required to determine which prompt to use
+    ARTICLE2_ID = 1445577  # How Dangerous Is Rubella?
 
     # Here are pairs of articles that are highly correlated, based on the neo_4j_clustered_data excel sheet
     ARTICLE_HARMONISATION_PAIRS = [
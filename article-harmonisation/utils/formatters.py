@@ -9,11 +9,13 @@
 
 CONTENT_BODY = "extracted_content_body"
 EXTRACTED_HEADERS = "extracted_headers"
+SECTIONS = "sections"
 ARTICLE_TITLE = "title"
 KEY_PARQUET_INFO = [
     ARTICLE_TITLE,
     "article_category_names",
     EXTRACTED_HEADERS,
+    SECTIONS,
     CONTENT_BODY,
 ]
 TO_REMOVE = ["", " "]
@@ -23,32 +25,47 @@
 
 
 def concat_headers_to_content(articles: list):
+    """Splits the content of each article into its sections, each prefixed with "Keypoint: " and its header.
+
+    The sections are sliced from the content at the offsets in the `sections` column of the extracted data,
+    so repeated headers are handled and the content is not searched for the headers.
+
+    Args:
+        articles: a list of the titles of the articles to split
+
+    Returns:
+        a list with the content before the first header and the sections of each article, without the
+        empty sections
+    """
     final_configured_articles = []
     # for loop iterating through each
     for article_title in EXTRACTED_ARTICLE_TITLES:
         if article_title.as_py() in articles:
             idx = EXTRACTED_ARTICLE_TITLES.index(article_title)
-            article_headers = list(table[EXTRACTED_HEADERS][idx])
-            article_content = str(table[CONTENT_BODY][idx])
-            split_content = []
-
-            # Stores strings where Keypoint: + header for easy checks afterwards
-            header_store = []
-
-            for header_details in article_headers:
-                header = header_details[0].as_py()
-                if not split_content:
-                    split_content.extend(article_content.split(header))
-                else:
-                    last_content = split_content.pop()
-                    split_content.extend(last_content.split(header))
-                split_content[-1] = "Keypoint: " + header + "\n" + split_content[-1][1:]
-                header_store.append("Keypoint: " + header)
-            for new_content in split_content:
-                # checking if there are empty strings in split_content
-                if new_content in TO_REMOVE or new_content.strip() in header_store:
-                    print("yep")
-                    split_content.pop(split_content.index(new_content))
+            article_content = table[CONTENT_BODY][idx].as_py() or ""
+            article_sections = table[SECTIONS][idx].as_py() or []
+
+            # Content before the first header
+            first_start = (
+                article_sections[0]["start"]
+                if article_sections
+                else len(article_content)
+            )
+            split_content = [article_content[:first_start]]
+
+            for section in article_sections:
+                header = section["header"]
+                # Skip the header and the whitespace after it
+                section_content = article_content[
+                    section["content_start"] : section["end"]
+                ]
+                # Drops the sections without content
+                if section_content.strip():
+                    split_content.append("Keypoint: " + header + "\n" + section_content)
+
+            split_content = [
+                content for content in split_content if content not in TO_REMOVE
+            ]
             final_configured_articles.append(split_content)
 
     return final_configured_articles
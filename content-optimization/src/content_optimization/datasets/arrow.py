@@ -0,0 +1,146 @@
+from collections.abc import Iterable
+from itertools import chain
+from pathlib import PurePosixPath
+from typing import Any, Callable, Union
+
+import fsspec
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from kedro.io import AbstractDataset
+from kedro.io.core import get_filepath_str, get_protocol_and_path
+
+# File with the schema of the dataset, including the partition columns
+# NOTE: Files prefixed with "_" are not read as data files by `pyarrow.dataset`
+SCHEMA_FILENAME = "_common_metadata"
+
+
+class HivePartitionedDataset(
+    AbstractDataset[
+        Union[pd.DataFrame, pa.Table, Callable[[], Iterable[pa.Table]]], ds.Dataset
+    ]
+):
+    def __init__(
+        self,
+        path: str,
+        partitioning: list[str] = ["content_category"],
+        save_args: dict[str, Any] = {},
+        fs_args: dict[str, Any] = {},
+    ):
+        """
+        A constructor method for initializing the HivePartitionedDataset object.
+
+        A directory of Parquet files partitioned in the Hive layout by the given columns,
+        e.g. `content_category=medications/part-0.parquet`. Loading returns a lazy
+        `pyarrow.dataset.Dataset`, so that nodes can push column projections and row filters
+        down into the Parquet scan, e.g.
+        `dataset.to_table(columns=[...], filter=pc.field("content_category") == "medications")`
+        only reads the row groups of a single content category.
+
+        Parameters:
+            path (str): The path to the directory of the dataset.
+            partitioning (list[str], optional): The columns to partition by.
+                Defaults to ["content_category"].
+            save_args (dict[str, Any], optional): Arguments to `pyarrow.dataset.write_dataset`,
+                e.g. `max_rows_per_group`. Defaults to {}.
+            fs_args (dict[str, Any], optional): Arguments to the filesystem. Defaults to {}.
+        """
+        # parse the path and protocol (e.g. file, http, s3, etc.)
+        protocol, path = get_protocol_and_path(path)
+        self._protocol = protocol
+        self._path = PurePosixPath(path)
+        self._partitioning = partitioning
+        self._save_args = save_args
+        self._fs = fsspec.filesystem(self._protocol, **fs_args)
+
+    def _load(self) -> ds.Dataset:
+        """
+        Loads the dataset lazily. No data is read until the dataset is scanned.
+
+        Returns:
+            ds.Dataset: The dataset with the columns in the order they were saved in.
+        """
+        load_path = get_filepath_str(self._path, self._protocol)
+        schema = pq.read_schema(f"{load_path}/{SCHEMA_FILENAME}", filesystem=self._fs)
+
+        return ds.dataset(
+            load_path,
+            schema=schema,
+            format="parquet",
+            partitioning=self._hive_partitioning(schema),
+            filesystem=self._fs,
+        )
+
+    def _save(
+        self, data: Union[pd.DataFrame, pa.Table, Callable[[], Iterable[pa.Table]]]
+    ) -> None:
+        """
+        Saves the data to the dataset, replacing any existing data.
+
+        Args:
+            data (Union[pd.DataFrame, pa.Table, Callable[[], Iterable[pa.Table]]]): A DataFrame,
+                an Arrow table, or a callable that returns the stream of Arrow tables to save.
+                All tables in the stream must have the same schema.
+        """
+        if isinstance(data, pd.DataFrame):
+            tables = iter([pa.Table.from_pandas(data, preserve_index=False)])
+        elif isinstance(data, pa.Table):
+            tables = iter([data])
+        else:
+            tables = iter(data())
+
+        # The schema of the first table is needed up front to stream the rest
+        first_table = next(tables)
+        schema = first_table.schema
+
+        save_path = get_filepath_str(self._path, self._protocol)
+        if self._fs.exists(save_path):
+            self._fs.rm(save_path, recursive=True)
+
+        batches = (
+            batch
+            for table in chain([first_table], tables)
+            for batch in table.to_batches()
+        )
+        ds.write_dataset(
+            batches,
+            save_path,
+            schema=schema,
+            format="parquet",
+            partitioning=self._hive_partitioning(schema),
+            filesystem=self._fs,
+            preserve_order=True,
+            **self._save_args,
+        )
+
+        pq.write_metadata(schema, f"{save_path}/{SCHEMA_FILENAME}", filesystem=self._fs)
+
+    def _hive_partitioning(self, schema: pa.Schema) -> ds.Partitioning:
+        """
+        Creates the Hive partitioning of the dataset.
+
+        Args:
+            schema (pa.Schema): The schema of the dataset.
+
+        Returns:
+            ds.Partitioning: The Hive partitioning by the partition columns.
+        """
+        return ds.partitioning(
+            pa.schema([schema.field(name) for name in self._partitioning]),
+            flavor="hive",
+        )
+
+    def _exists(self) -> bool:
+        """Returns whether the schema file of the dataset exists."""
+        load_path = get_filepath_str(self._path, self._protocol)
+        return self._fs.exists(f"{load_path}/{SCHEMA_FILENAME}")
+
+    def _describe(self) -> dict[str, Any]:
+        """Returns a dict that describes the attributes of the dataset."""
+        return dict(
+            path=self._path,
+            partitioning=self._partitioning,
+            save_args=self._save_args,
+            protocol=self._protocol,
+        )
@@ -0,0 +1,174 @@
+import hashlib
+import io
+import logging
+import re
+from pathlib import PurePosixPath
+from typing import Any
+
+import fsspec
+import pandas as pd
+from kedro.io import AbstractDataset, DatasetError
+from kedro.io.core import get_filepath_str, get_protocol_and_path
+
+# Set up logger in excel.py
+# Edit conf/logging.yml to see changes
+logger = logging.getLogger(__name__)
+
+# Size of the blocks read to compute the checksum of an Excel file
+CHUNK_SIZE = 1024 * 1024
+
+
+class ParquetCachedExcelDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    def __init__(
+        self,
+        filepath: str,
+        cache_dir: str,
+        load_args: dict[str, Any] = {},
+        fs_args: dict[str, Any] = {},
+        cache_fs_args: dict[str, Any] = {},
+    ):
+        """
+        A constructor method for initializing the ParquetCachedExcelDataset object.
+
+        A read-only Excel dataset that converts the Excel file to a Parquet file once.
+        The Parquet file is keyed by the SHA-256 checksum of the Excel file, so later
+        loads of an unchanged Excel file read the Parquet file instead of parsing the
+        Excel file again. The values of columns of mixed types are converted to strings,
+        as Arrow columns have a single type. See `to_string_columns`.
+
+        Parameters:
+            filepath (str): The path to the Excel file.
+            cache_dir (str): The directory of the cached Parquet files, which may have another
+                protocol than the Excel file, e.g. `s3://bucket/cache` for a local Excel file.
+            load_args (dict[str, Any], optional): Arguments to `pandas.read_excel`, e.g.
+                `engine: calamine` for a faster reader (requires `python-calamine`).
+                Defaults to {}.
+            fs_args (dict[str, Any], optional): Arguments to the filesystem. Defaults to {}.
+            cache_fs_args (dict[str, Any], optional): Arguments to the filesystem of the cache
+                directory if its protocol differs from the Excel file's. Defaults to {}.
+        """
+        # parse the path and protocol (e.g. file, http, s3, etc.)
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._load_args = load_args
+        self._fs = fsspec.filesystem(self._protocol, **fs_args)
+
+        # The cached Parquet files are read and written with the filesystem of the cache directory
+        cache_protocol, cache_path = get_protocol_and_path(cache_dir)
+        self._cache_protocol = cache_protocol
+        self._cache_dir = PurePosixPath(cache_path)
+        self._cache_fs = (
+            self._fs
+            if cache_protocol == protocol
+            else fsspec.filesystem(cache_protocol, **cache_fs_args)
+        )
+
+    def _checksum(self, load_path: str) -> str:
+        """
+        Computes the SHA-256 checksum of the Excel file in blocks of `CHUNK_SIZE` bytes.
+
+        Args:
+            load_path (str): The path to the Excel file.
+
+        Returns:
+            str: The hex digest of the checksum.
+        """
+        checksum = hashlib.sha256()
+        with self._fs.open(load_path, mode="rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                checksum.update(chunk)
+
+        return checksum.hexdigest()
+
+    def _load(self) -> pd.DataFrame:
+        """
+        Loads the Excel file from its cached Parquet file, converting it on a cache miss.
+
+        Returns:
+            pd.DataFrame: The data in the Excel file.
+        """
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        stem = self._filepath.stem
+        cache_path = get_filepath_str(
+            self._cache_dir / f"{stem}_{self._checksum(load_path)[:16]}.parquet",
+            self._cache_protocol,
+        )
+
+        if self._cache_fs.exists(cache_path):
+            with self._cache_fs.open(cache_path, mode="rb") as f:
+                return pd.read_parquet(f)
+
+        logger.info(f"Converting `{self._filepath.name}` to Parquet")
+        with self._fs.open(load_path, mode="rb") as f:
+            df = pd.read_excel(io.BytesIO(f.read()), **self._load_args)
+
+        buffer = io.BytesIO()
+        to_string_columns(df).to_parquet(buffer, index=False)
+
+        # Remove the cached Parquet files of previous versions of the Excel file
+        stale_pattern = re.compile(rf"{re.escape(stem)}_[0-9a-f]{{16}}\.parquet")
+        for stale_path in self._cache_fs.glob(
+            get_filepath_str(
+                self._cache_dir / f"{stem}_*.parquet", self._cache_protocol
+            )
+        ):
+            if stale_pattern.fullmatch(PurePosixPath(stale_path).name):
+                self._cache_fs.rm(stale_path)
+
+        self._cache_fs.makedirs(
+            get_filepath_str(self._cache_dir, self._cache_protocol), exist_ok=True
+        )
+        with self._cache_fs.open(cache_path, mode="wb") as f:
+            f.write(buffer.getvalue())
+
+        # Load from the Parquet file so that the data is identical on a cache hit
+        return pd.read_parquet(io.BytesIO(buffer.getvalue()))
+
+    def _save(self, data: pd.DataFrame) -> None:
+        """
+        Raises an error as the raw Excel exports are read-only.
+
+        Args:
+            data (pd.DataFrame): The data to save.
+
+        Raises:
+            DatasetError: Always.
+        """
+        raise DatasetError(f"`{self.__class__.__name__}` is a read-only dataset")
+
+    def _exists(self) -> bool:
+        """Returns whether the Excel file exists."""
+        return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
+
+    def _describe(self) -> dict[str, Any]:
+        """Returns a dict that describes the attributes of the dataset."""
+        return dict(
+            filepath=self._filepath,
+            cache_dir=self._cache_dir,
+            load_args=self._load_args,
+            protocol=self._protocol,
+            cache_protocol=self._cache_protocol,
+        )
+
+
+def to_string_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the values of the `object` columns of mixed types to strings, e.g. a column of
+    keywords with a number, which cannot be converted to Arrow. Null values are kept.
+
+    Args:
+        df (pd.DataFrame): The DataFrame read from the Excel file.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the columns of mixed types as `object` columns of
+            strings and null values, i.e. text columns. See `convert_string_columns`.
+    """
+    for column in df.columns:
+        if df[column].dtype == object and pd.api.types.infer_dtype(df[column]) in (
+            "mixed",
+            "mixed-integer",
+        ):
+            df[column] = df[column].astype("string").astype(object)
+
+    return df
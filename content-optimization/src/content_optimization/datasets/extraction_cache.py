@@ -0,0 +1,72 @@
+from pathlib import PurePosixPath
+from typing import Any
+
+import fsspec
+import pandas as pd
+from kedro.io import AbstractDataset
+from kedro.io.core import get_filepath_str, get_protocol_and_path
+
+
+class ExtractionCacheDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    def __init__(
+        self,
+        filepath: str,
+        columns: list[str] = ["key", "result", "last_used"],
+        fs_args: dict[str, Any] = {},
+    ):
+        """
+        A constructor method for initializing the ExtractionCacheDataset object.
+
+        The cache is stored as a Parquet file. Unlike `pandas.ParquetDataset`, loading
+        a cache that does not exist yet returns an empty DataFrame, so the first run
+        starts with a cold cache instead of failing.
+
+        Parameters:
+            filepath (str): The path to the Parquet file.
+            columns (list[str], optional): The columns of the cache. Defaults to
+                ["key", "result", "last_used"].
+            fs_args (dict[str, Any], optional): Arguments to the filesystem. Defaults to {}.
+        """
+        # parse the path and protocol (e.g. file, http, s3, etc.)
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._columns = columns
+        self._fs = fsspec.filesystem(self._protocol, **fs_args)
+
+    def _load(self) -> pd.DataFrame:
+        """
+        Loads the cache from the Parquet file.
+
+        Returns:
+            pd.DataFrame: The cache entries, or an empty DataFrame if the file does not exist.
+        """
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        if not self._fs.exists(load_path):
+            return pd.DataFrame(columns=self._columns)
+
+        with self._fs.open(load_path, mode="rb") as f:
+            return pd.read_parquet(f)
+
+    def _save(self, data: pd.DataFrame) -> None:
+        """
+        Saves the cache entries to the Parquet file.
+
+        Args:
+            data (pd.DataFrame): The cache entries to save.
+
+        Returns:
+            None
+        """
+        save_path = get_filepath_str(self._filepath, self._protocol)
+        self._fs.makedirs(str(self._filepath.parent), exist_ok=True)
+        with self._fs.open(save_path, mode="wb") as f:
+            data.to_parquet(f, index=False)
+
+    def _exists(self) -> bool:
+        """Returns whether the Parquet file exists."""
+        return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
+
+    def _describe(self) -> dict[str, Any]:
+        """Returns a dict that describes the attributes of the dataset."""
+        return dict(filepath=self._filepath, protocol=self._protocol)
@@ -0,0 +1,260 @@
+import os
+from collections.abc import Iterable
+from pathlib import PurePosixPath
+from typing import Any, Callable, Union
+
+import fsspec
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from kedro.io import AbstractDataset, AbstractVersionedDataset, DatasetError
+from kedro.io.core import Version, get_filepath_str, get_protocol_and_path
+from kedro.utils import load_obj
+
+
+class StreamingParquetDataset(
+    AbstractVersionedDataset[
+        Union[pd.DataFrame, pa.Table, Callable[[], Iterable[pa.Table]]], pd.DataFrame
+    ]
+):
+    def __init__(
+        self,
+        filepath: str,
+        load_args: dict[str, Any] = {},
+        save_args: dict[str, Any] = {},
+        fs_args: dict[str, Any] = {},
+        version: Version | None = None,
+    ):
+        """
+        A constructor method for initializing the StreamingParquetDataset object.
+
+        A Parquet dataset that saves a stream of Arrow tables into a single Parquet file,
+        one table at a time, so that only one table is held in memory while saving.
+
+        Parameters:
+            filepath (str): The path to the Parquet file.
+            load_args (dict[str, Any], optional): Arguments to `pandas.read_parquet`. Defaults to {}.
+            save_args (dict[str, Any], optional): Arguments to `pyarrow.parquet.ParquetWriter`,
+                e.g. `compression`. Defaults to {}.
+            fs_args (dict[str, Any], optional): Arguments to the filesystem. Defaults to {}.
+            version (Version | None, optional): The version of the dataset. Defaults to None.
+        """
+        # parse the path and protocol (e.g. file, http, s3, etc.)
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._load_args = load_args
+        self._save_args = save_args
+        self._fs = fsspec.filesystem(self._protocol, **fs_args)
+
+        super().__init__(
+            filepath=PurePosixPath(path),
+            version=version,
+            exists_function=self._fs.exists,
+            glob_function=self._fs.glob,
+        )
+
+    def _load(self) -> pd.DataFrame:
+        """
+        Loads the Parquet file as a DataFrame.
+
+        Returns:
+            pd.DataFrame: The data in the Parquet file.
+        """
+        load_path = get_filepath_str(self._get_load_path(), self._protocol)
+        with self._fs.open(load_path, mode="rb") as f:
+            return pd.read_parquet(f, **self._load_args)
+
+    def _save(
+        self, data: Union[pd.DataFrame, pa.Table, Callable[[], Iterable[pa.Table]]]
+    ) -> None:
+        """
+        Saves the data to the Parquet file, writing one row group per table.
+
+        Args:
+            data (Union[pd.DataFrame, pa.Table, Callable[[], Iterable[pa.Table]]]): A DataFrame,
+                an Arrow table, or a callable that returns the stream of Arrow tables to save.
+                All tables in the stream must have the same schema.
+
+        Raises:
+            DatasetError: If the stream is empty.
+        """
+        if isinstance(data, pd.DataFrame):
+            tables = [pa.Table.from_pandas(data, preserve_index=False)]
+        elif isinstance(data, pa.Table):
+            tables = [data]
+        else:
+            tables = data()
+
+        # Using get_filepath_str ensures that the protocol and path are appended correctly for different filesystems
+        save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        self._fs.makedirs(os.path.dirname(save_path), exist_ok=True)
+
+        writer = None
+        with self._fs.open(save_path, mode="wb") as f:
+            try:
+                for table in tables:
+                    if writer is None:
+                        writer = pq.ParquetWriter(f, table.schema, **self._save_args)
+                    writer.write_table(table)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+        if writer is None:
+            self._fs.rm(save_path)
+            raise DatasetError(f"No tables to save to '{save_path}'")
+
+    def _describe(self) -> dict[str, Any]:
+        """Returns a dict that describes the attributes of the dataset."""
+        return dict(
+            filepath=self._filepath,
+            version=self._version,
+            protocol=self._protocol,
+            load_args=self._load_args,
+            save_args=self._save_args,
+        )
+
+
+class TypedParquetDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    def __init__(
+        self,
+        filepath: str,
+        column_types: str,
+        save_args: dict[str, Any] = {},
+        fs_args: dict[str, Any] = {},
+    ):
+        """
+        A constructor method for initializing the TypedParquetDataset object.
+
+        A Parquet dataset that enforces explicit Arrow types for the given columns when
+        saving, e.g. `list<struct<text, url>>` instead of the types inferred from Python
+        objects. On load, these columns are backed by `pd.ArrowDtype`, so that the nested
+        data is not converted to Python objects.
+
+        Parameters:
+            filepath (str): The path to the Parquet file.
+            column_types (str): The import path of a dictionary that maps column names to
+                Arrow types, e.g. `content_optimization.pipelines.data_processing.schemas.EXTRACTED_COLUMN_TYPES`.
+            save_args (dict[str, Any], optional): Arguments to `pyarrow.parquet.write_table`,
+                e.g. `compression`. Defaults to {}.
+            fs_args (dict[str, Any], optional): Arguments to the filesystem. Defaults to {}.
+        """
+        # parse the path and protocol (e.g. file, http, s3, etc.)
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._column_types_path = column_types
+        self._column_types = load_obj(column_types)
+        self._save_args = save_args
+        self._fs = fsspec.filesystem(self._protocol, **fs_args)
+
+    def _load(self) -> pd.DataFrame:
+        """
+        Loads the Parquet file as a DataFrame with the typed columns as `pd.ArrowDtype`.
+
+        Returns:
+            pd.DataFrame: The data in the Parquet file.
+        """
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        with self._fs.open(load_path, mode="rb") as f:
+            table = pq.read_table(f)
+
+        # The types are read from the file, as Parquet may rename the list item fields
+        arrow_dtypes = {
+            table.schema.field(column).type: pd.ArrowDtype(
+                table.schema.field(column).type
+            )
+            for column in self._column_types
+            if column in table.column_names
+        }
+        return table.to_pandas(types_mapper=arrow_dtypes.get)
+
+    def load_schema(self) -> pa.Schema:
+        """
+        Loads the Arrow schema of the Parquet file from its metadata, without reading the data.
+
+        Returns:
+            pa.Schema: The schema of the loaded DataFrame, i.e. `pa.Schema.from_pandas(load())`.
+        """
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        with self._fs.open(load_path, mode="rb") as f:
+            schema = pq.read_schema(f)
+
+        # Large strings, e.g. of `string[pyarrow]` columns, are loaded as `object` or
+        # `string` columns, unless they are typed columns
+        return pa.schema(
+            (
+                field.with_type(pa.string())
+                if pa.types.is_large_string(field.type)
+                and field.name not in self._column_types
+                else field
+            )
+            for field in schema
+        )
+
+    def _save(self, data: pd.DataFrame) -> None:
+        """
+        Saves the DataFrame to the Parquet file with the typed columns.
+
+        Args:
+            data (pd.DataFrame): The DataFrame to save.
+        """
+        table = to_typed_table(data, self._column_types)
+
+        save_path = get_filepath_str(self._filepath, self._protocol)
+        self._fs.makedirs(str(self._filepath.parent), exist_ok=True)
+        with self._fs.open(save_path, mode="wb") as f:
+            pq.write_table(table, f, **self._save_args)
+
+    def _exists(self) -> bool:
+        """Returns whether the Parquet file exists."""
+        return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
+
+    def _describe(self) -> dict[str, Any]:
+        """Returns a dict that describes the attributes of the dataset."""
+        return dict(
+            filepath=self._filepath,
+            column_types=self._column_types_path,
+            save_args=self._save_args,
+            protocol=self._protocol,
+        )
+
+
+def to_typed_table(df: pd.DataFrame, column_types: dict[str, pa.DataType]) -> pa.Table:
+    """
+    Converts a DataFrame to an Arrow table with explicit types for the given columns.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to convert.
+        column_types (dict[str, pa.DataType]): The Arrow types of the columns. Columns
+            not in the DataFrame are ignored, and other columns have inferred types.
+
+    Returns:
+        pa.Table: The Arrow table with the columns in the same order as the DataFrame.
+    """
+    typed_columns = [column for column in df.columns if column in column_types]
+    table = pa.Table.from_pandas(df.drop(columns=typed_columns), preserve_index=False)
+
+    for column in typed_columns:
+        arrow_type = column_types[column]
+        if isinstance(df[column].dtype, pd.ArrowDtype):
+            array = pa.chunked_array(pa.array(df[column])).cast(arrow_type)
+        else:
+            values = df[column].tolist()
+            if pa.types.is_struct(arrow_type.value_type):
+                # Records are stored as tuples, which Arrow would read as key-value pairs
+                values = [
+                    (
+                        None
+                        if value is None
+                        else [
+                            record if isinstance(record, dict) else tuple(record)
+                            for record in value
+                        ]
+                    )
+                    for value in values
+                ]
+            array = pa.array(values, type=arrow_type, from_pandas=True)
+        table = table.append_column(pa.field(column, arrow_type), array)
+
+    return table.select([str(column) for column in df.columns])
@@ -0,0 +1,451 @@
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import PurePosixPath
+from typing import Any, Optional, Union
+
+import fsspec
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from kedro.io import AbstractDataset
+from kedro.io.core import get_filepath_str, get_protocol_and_path
+
+# Layout of a packed text file:
+#
+#   MAGIC | text 1 | text 2 | ... | index | FOOTER
+#
+# The texts are UTF-8 encoded and concatenated. The index is an Arrow IPC stream with
+# the id, file path, offset and length of every text, sorted by id. The footer holds the
+# offset and length of the index, so that the index is read without scanning the texts.
+MAGIC = b"COTEXT01"
+FOOTER = struct.Struct("<QQ8s")  # index offset, index length, MAGIC
+INDEX_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("path", pa.string()),
+        ("offset", pa.uint64()),
+        ("length", pa.uint64()),
+    ]
+)
+
+
+class PackedTextStore(Mapping[int, str]):
+    def __init__(self, buffer: Union[bytes, mmap.mmap], index: pa.Table):
+        """
+        A constructor method for initializing the PackedTextStore object.
+
+        A read-only mapping of article IDs to texts backed by a packed text file. Only the
+        index is read up front; each text is decoded from the buffer when it is accessed,
+        so looking up an article does not read the other texts.
+
+        Parameters:
+            buffer (Union[bytes, mmap.mmap]): The contents of the packed text file, memory
+                mapped for local files.
+            index (pa.Table): The index of the texts with the `INDEX_SCHEMA`, sorted by id.
+        """
+        self._buffer = buffer
+        self._index = index
+        self._ids = index["id"].to_numpy()
+        self._offsets = index["offset"].to_numpy()
+        self._lengths = index["length"].to_numpy()
+
+    @classmethod
+    def from_buffer(cls, buffer: Union[bytes, mmap.mmap]) -> "PackedTextStore":
+        """
+        Creates the store from the contents of a packed text file.
+
+        Args:
+            buffer (Union[bytes, mmap.mmap]): The contents of the packed text file.
+
+        Returns:
+            PackedTextStore: The store of the texts in the file.
+
+        Raises:
+            ValueError: If the buffer is not a packed text file.
+        """
+        return cls(buffer, _read_index(buffer))
+
+    @property
+    def index(self) -> pa.Table:
+        """Returns the index of the texts, i.e. their id, path, offset and length."""
+        return self._index
+
+    def __getitem__(self, article_id: int) -> str:
+        """
+        Gets the text of an article by binary search over the sorted ids.
+
+        Args:
+            article_id (int): The ID of the article.
+
+        Returns:
+            str: The text of the article.
+
+        Raises:
+            KeyError: If the article is not in the store.
+        """
+        position = np.searchsorted(self._ids, article_id)
+        if position == len(self._ids) or self._ids[position] != article_id:
+            raise KeyError(article_id)
+
+        start = int(self._offsets[position])
+        end = start + int(self._lengths[position])
+
+        return self._buffer[start:end].decode("utf-8")
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterates over the article IDs in ascending order."""
+        return iter(self._ids.tolist())
+
+    def __len__(self) -> int:
+        """Returns the number of texts in the store."""
+        return len(self._ids)
+
+    def path(self, article_id: int) -> str:
+        """
+        Gets the file path of an article when exported as loose files.
+
+        Args:
+            article_id (int): The ID of the article.
+
+        Returns:
+            str: The path relative to the export directory, e.g.
+                `medications/Paracetamol_1437892`, without the `.txt` suffix.
+
+        Raises:
+            KeyError: If the article is not in the store.
+        """
+        position = np.searchsorted(self._ids, article_id)
+        if position == len(self._ids) or self._ids[position] != article_id:
+            raise KeyError(article_id)
+
+        return self._index["path"][int(position)].as_py()
+
+    def export(
+        self,
+        path: str,
+        filename_suffix: str = ".txt",
+        fs_args: dict[str, Any] = {},
+    ) -> None:
+        """
+        Exports the texts to loose text files, e.g. for manual inspection.
+
+        Args:
+            path (str): The directory to export the texts to. Each text is written to
+                `<path>/<content_category>/<title>_<id><filename_suffix>`.
+            filename_suffix (str, optional): The suffix of the text files. Defaults to ".txt".
+            fs_args (dict[str, Any], optional): Arguments to the filesystem. Defaults to {}.
+        """
+        texts = (
+            (file_path, self[article_id])
+            for article_id, file_path in zip(
+                self._ids.tolist(), self._index["path"].to_pylist()
+            )
+        )
+        _export_texts(texts, path, filename_suffix, fs_args)
+
+    def close(self) -> None:
+        """Closes the memory map of the packed text file, if any."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "PackedTextStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class PackedTextDataset(
+    AbstractDataset[Mapping[int, tuple[str, str]], PackedTextStore]
+):
+    def __init__(
+        self,
+        filepath: str,
+        export_path: Optional[str] = None,
+        fs_args: dict[str, Any] = {},
+    ):
+        """
+        A constructor method for initializing the PackedTextDataset object.
+
+        The texts of all articles are packed into a single file instead of one text file
+        per article, and loaded as a `PackedTextStore` that looks up the text of an
+        article by its ID. Local files are memory mapped, so only the texts that are
+        accessed are read from disk.
+
+        The first save of the dataset replaces the file and later saves of the same
+        dataset append to it, so that a generator node can save the texts of each content
+        category as soon as it is processed. An article saved again replaces its
+        previous text.
+
+        Parameters:
+            filepath (str): The path to the packed text file.
+            export_path (Optional[str], optional): The directory to also export the saved
+                texts to as loose text files, e.g. for manual inspection. Defaults to None,
+                which does not export the texts.
+            fs_args (dict[str, Any], optional): Arguments to the filesystem. Defaults to {}.
+        """
+        # parse the path and protocol (e.g. file, http, s3, etc.)
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._export_path = export_path
+        self._fs_args = fs_args
+        self._fs = fsspec.filesystem(self._protocol, **fs_args)
+        self._saved = False
+
+    def _load(self) -> PackedTextStore:
+        """
+        Loads the packed text file.
+
+        Returns:
+            PackedTextStore: The store of the texts keyed by article ID.
+        """
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        if self._protocol != "file":
+            return PackedTextStore.from_buffer(self._fs.cat_file(load_path))
+
+        with open(load_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return PackedTextStore.from_buffer(buffer)
+
+    def _save(self, data: Mapping[int, tuple[str, str]]) -> None:
+        """
+        Saves the texts to the packed text file.
+
+        Args:
+            data (Mapping[int, tuple[str, str]]): A dictionary mapping the article IDs to
+                the file path of their text when exported and the text itself.
+        """
+        save_path = get_filepath_str(self._filepath, self._protocol)
+        self._fs.makedirs(str(self._filepath.parent), exist_ok=True)
+
+        previous_index = None
+        if self._saved and self._fs.exists(save_path):
+            previous_index, data_end = self._read_previous_index(save_path)
+
+        if previous_index is None:
+            with self._fs.open(save_path, mode="wb") as f:
+                f.write(MAGIC)
+                index = _write_texts(f, data, len(MAGIC))
+                _write_index(f, index)
+        elif self._protocol == "file":
+            self._append_local(save_path, data, previous_index, data_end)
+        else:
+            # Most remote filesystems cannot write in place
+            previous_texts = self._fs.cat_file(save_path, start=0, end=data_end)
+            with self._fs.open(save_path, mode="wb") as f:
+                f.write(previous_texts)
+                index = _write_texts(f, data, data_end)
+                _write_index(f, _merge_index(previous_index, index))
+
+        self._saved = True
+
+        if self._export_path is not None:
+            _export_texts(data.values(), self._export_path, ".txt", self._fs_args)
+
+    def _append_local(
+        self,
+        save_path: str,
+        data: Mapping[int, tuple[str, str]],
+        previous_index: pa.Table,
+        data_end: int,
+    ) -> None:
+        """
+        Appends the texts to a copy of the local packed text file, which then replaces it.
+
+        The index of the copy is overwritten with the new texts and the merged index, and the
+        copy only replaces the file once it is complete. An error or a crash in between leaves
+        the previous file intact, and stores memory mapping the previous file are unaffected.
+
+        Args:
+            save_path (str): The path to the packed text file.
+            data (Mapping[int, tuple[str, str]]): The file path and the text of each article ID.
+            previous_index (pa.Table): The index of the existing texts.
+            data_end (int): The offset where the existing texts end.
+        """
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f".{self._filepath.name}.", dir=str(self._filepath.parent)
+        )
+        os.close(fd)
+        try:
+            # Copies the permissions of the file as well
+            shutil.copy(save_path, temp_path)
+            with open(temp_path, mode="r+b") as f:
+                f.seek(data_end)
+                f.truncate()
+                index = _write_texts(f, data, data_end)
+                _write_index(f, _merge_index(previous_index, index))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, save_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def _read_previous_index(self, save_path: str) -> tuple[pa.Table, int]:
+        """
+        Reads the index of the existing packed text file.
+
+        Args:
+            save_path (str): The path to the packed text file.
+
+        Returns:
+            tuple[pa.Table, int]: The index and the offset where the texts end.
+        """
+        size = self._fs.size(save_path)
+        footer = self._fs.cat_file(save_path, start=size - FOOTER.size, end=size)
+        index_offset, index_length, _ = _unpack_footer(footer)
+        index_bytes = self._fs.cat_file(
+            save_path, start=index_offset, end=index_offset + index_length
+        )
+
+        return pa.ipc.open_stream(index_bytes).read_all(), index_offset
+
+    def _exists(self) -> bool:
+        """Returns whether the packed text file exists."""
+        return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
+
+    def _describe(self) -> dict[str, Any]:
+        """Returns a dict that describes the attributes of the dataset."""
+        return dict(
+            filepath=self._filepath,
+            export_path=self._export_path,
+            protocol=self._protocol,
+        )
+
+
+def _write_texts(f: Any, data: Mapping[int, tuple[str, str]], offset: int) -> pa.Table:
+    """
+    Writes the texts to the packed text file.
+
+    Args:
+        f (Any): The file object, positioned at `offset`.
+        data (Mapping[int, tuple[str, str]]): The file path and the text of each article ID.
+        offset (int): The offset of the first text in the file.
+
+    Returns:
+        pa.Table: The index of the written texts, sorted by id.
+    """
+    ids, paths, offsets, lengths = [], [], [], []
+    for article_id, (file_path, text) in data.items():
+        encoded = (text or "").encode("utf-8")
+        f.write(encoded)
+        ids.append(article_id)
+        paths.append(file_path)
+        offsets.append(offset)
+        lengths.append(len(encoded))
+        offset += len(encoded)
+
+    index = pa.table([ids, paths, offsets, lengths], schema=INDEX_SCHEMA)
+
+    return index.sort_by("id")
+
+
+def _write_index(f: Any, index: pa.Table) -> None:
+    """
+    Writes the index and the footer at the end of the packed text file.
+
+    Args:
+        f (Any): The file object, positioned after the last text.
+        index (pa.Table): The index of the texts, sorted by id.
+    """
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, INDEX_SCHEMA) as writer:
+        writer.write_table(index)
+    index_bytes = sink.getvalue().to_pybytes()
+
+    index_offset = f.tell()
+    f.write(index_bytes)
+    f.write(FOOTER.pack(index_offset, len(index_bytes), MAGIC))
+
+
+def _merge_index(previous_index: pa.Table, index: pa.Table) -> pa.Table:
+    """
+    Merges the index of the newly saved texts into the index of the existing texts.
+
+    Args:
+        previous_index (pa.Table): The index of the existing texts.
+        index (pa.Table): The index of the newly saved texts, which take precedence.
+
+    Returns:
+        pa.Table: The merged index, sorted by id.
+    """
+    is_replaced = pc.is_in(previous_index["id"], value_set=index["id"])
+    previous_index = previous_index.filter(pc.invert(is_replaced))
+
+    return pa.concat_tables([previous_index, index]).sort_by("id")
+
+
+def _export_texts(
+    texts: Iterable[tuple[str, Optional[str]]],
+    path: str,
+    filename_suffix: str,
+    fs_args: dict[str, Any],
+) -> None:
+    """
+    Writes texts to loose text files.
+
+    Args:
+        texts (Iterable[tuple[str, Optional[str]]]): The file path and the text of each article.
+        path (str): The directory to write the text files to.
+        filename_suffix (str): The suffix of the text files.
+        fs_args (dict[str, Any]): Arguments to the filesystem.
+    """
+    protocol, export_path = get_protocol_and_path(path)
+    fs = fsspec.filesystem(protocol, **fs_args)
+    export_path = PurePosixPath(export_path)
+
+    for file_path, text in texts:
+        text_path = export_path / f"{file_path}{filename_suffix}"
+        fs.makedirs(str(text_path.parent), exist_ok=True)
+        fs.pipe_file(
+            get_filepath_str(text_path, protocol), (text or "").encode("utf-8")
+        )
+
+
+def _read_index(buffer: Union[bytes, mmap.mmap]) -> pa.Table:
+    """
+    Reads the index of a packed text file.
+
+    Args:
+        buffer (Union[bytes, mmap.mmap]): The contents of the packed text file.
+
+    Returns:
+        pa.Table: The index of the texts, sorted by id.
+
+    Raises:
+        ValueError: If the buffer is not a packed text file.
+    """
+    if len(buffer) < len(MAGIC) + FOOTER.size or buffer[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not a packed text file")
+
+    index_offset, index_length, _ = _unpack_footer(buffer[-FOOTER.size :])
+    # Copy the index out of the buffer, so that the memory map can be closed
+    index_bytes = buffer[index_offset : index_offset + index_length]
+
+    return pa.ipc.open_stream(index_bytes).read_all()
+
+
+def _unpack_footer(footer: bytes) -> tuple[int, int, bytes]:
+    """
+    Unpacks the footer of a packed text file.
+
+    Args:
+        footer (bytes): The last `FOOTER.size` bytes of the file.
+
+    Returns:
+        tuple[int, int, bytes]: The offset and length of the index, and the magic bytes.
+
+    Raises:
+        ValueError: If the footer does not end with the magic bytes.
+    """
+    index_offset, index_length, magic = FOOTER.unpack(footer)
+    if magic != MAGIC:
+        raise ValueError("Not a packed text file")
+
+    return index_offset, index_length, magic
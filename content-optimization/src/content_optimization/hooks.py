@@ -0,0 +1,332 @@
+"""
+Project hooks. Registered in `settings.py`.
+"""
+
+import logging
+import os
+import sys
+import time
+from typing import Any, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from kedro.framework.hooks import hook_impl
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # Not available on Windows, where the memory usage is not recorded
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Environment variable that enables the instrumentation, e.g. `NODE_METRICS=1 kedro run`
+NODE_METRICS_ENV_VAR = "NODE_METRICS"
+
+# Dataset in `catalog.yml` that the metrics are saved to
+NODE_METRICS_DATASET = "node_metrics"
+
+NODE_METRICS_COLUMNS = [
+    "node",
+    "wall_time_s",
+    "cpu_time_s",
+    "peak_rss_delta_mb",
+    "input_rows",
+    "output_rows",
+    "bytes_read",
+    "bytes_written",
+]
+
+
+class NodeInstrumentationHooks:
+    def __init__(
+        self,
+        env_var: str = NODE_METRICS_ENV_VAR,
+        dataset_name: str = NODE_METRICS_DATASET,
+    ):
+        """
+        A constructor method for initializing the NodeInstrumentationHooks object.
+
+        Records the wall time, CPU time, peak memory, row counts and bytes read and
+        written of every node of a `kedro run`, and saves them to the `dataset_name`
+        dataset after the run. The instrumentation is disabled unless the `env_var`
+        environment variable is set to "1" or "true".
+
+        The time and memory of a node are measured from the loading of its first input
+        to the saving of its last output, so that the I/O of the node and the chunks of
+        generator nodes are included. The CPU time includes the worker processes of the
+        node once they have exited, e.g. a `ProcessPoolExecutor` shut down by the node.
+        The bytes read and written are the sizes of the files of the input and output
+        datasets, e.g. every partition of a `PartitionedDataset`.
+
+        NOTE: The metrics of nodes run by the `ParallelRunner` are not recorded, as its
+        nodes run in other processes.
+
+        Parameters:
+            env_var (str, optional): The environment variable that enables the
+                instrumentation. Defaults to `NODE_METRICS_ENV_VAR`.
+            dataset_name (str, optional): The dataset to save the metrics to. Defaults to
+                `NODE_METRICS_DATASET`.
+        """
+        self._env_var = env_var
+        self._dataset_name = dataset_name
+        self._enabled = False
+        self._catalog = None
+        self._metrics = {}  # node name -> metrics, in the order the nodes ran
+
+    @hook_impl
+    def before_pipeline_run(
+        self, run_params: dict[str, Any], pipeline: Pipeline, catalog: DataCatalog
+    ) -> None:
+        """Enables the instrumentation for the run if the environment variable is set."""
+        self._enabled = os.environ.get(self._env_var, "").lower() in ("1", "true")
+        self._catalog = catalog
+        self._metrics = {}
+
+    @hook_impl
+    def before_dataset_loaded(self, dataset_name: str, node: Node) -> None:
+        """Starts measuring the node before its first input is loaded."""
+        if self._enabled:
+            self._start(node)
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name: str, data: Any, node: Node) -> None:
+        """Counts the rows and bytes of an input of the node."""
+        if not self._enabled:
+            return
+        metrics = self._metrics[node.name]
+        metrics["input_rows"] = _add(metrics["input_rows"], _count_rows(data))
+        metrics["inputs"].add(dataset_name)
+        self._update(node)
+
+    @hook_impl
+    def before_node_run(self, node: Node) -> None:
+        """Starts measuring the node if it has no inputs."""
+        if self._enabled:
+            self._start(node)
+
+    @hook_impl
+    def after_node_run(self, node: Node) -> None:
+        """Measures the node after it has run."""
+        if self._enabled:
+            self._update(node)
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name: str, data: Any, node: Node) -> None:
+        """Counts the rows of an output, or of a chunk of an output, of the node."""
+        if not self._enabled:
+            return
+        metrics = self._metrics[node.name]
+        metrics["output_rows"] = _add(metrics["output_rows"], _count_rows(data))
+        metrics["outputs"].add(dataset_name)
+        self._update(node)
+
+    @hook_impl
+    def after_pipeline_run(
+        self,
+        run_params: dict[str, Any],
+        run_result: dict[str, Any],
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+    ) -> None:
+        """Saves the metrics of the nodes after the run."""
+        if self._enabled:
+            self._save(catalog)
+
+    @hook_impl
+    def on_pipeline_error(
+        self,
+        error: Exception,
+        run_params: dict[str, Any],
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+    ) -> None:
+        """Saves the metrics of the nodes that ran before the error."""
+        if self._enabled:
+            self._save(catalog)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Converts the metrics of the nodes to a DataFrame.
+
+        Returns:
+            pd.DataFrame: The metrics of every node in the order the nodes ran, with the
+                `NODE_METRICS_COLUMNS`.
+        """
+        rows = []
+        for node_name, metrics in self._metrics.items():
+            rss = metrics["rss"]
+            rows.append(
+                {
+                    "node": node_name,
+                    "wall_time_s": metrics["wall_time"][1] - metrics["wall_time"][0],
+                    "cpu_time_s": metrics["cpu_time"][1] - metrics["cpu_time"][0],
+                    "peak_rss_delta_mb": None if rss is None else rss[1] - rss[0],
+                    "input_rows": metrics["input_rows"],
+                    "output_rows": metrics["output_rows"],
+                    "bytes_read": self._dataset_sizes(metrics["inputs"]),
+                    "bytes_written": self._dataset_sizes(metrics["outputs"]),
+                }
+            )
+
+        return pd.DataFrame(rows, columns=NODE_METRICS_COLUMNS)
+
+    def _start(self, node: Node) -> None:
+        """
+        Starts measuring a node, unless it has been started already.
+
+        Args:
+            node (Node): The node.
+        """
+        if node.name in self._metrics:
+            return
+        wall_time, cpu_time, rss = time.perf_counter(), _cpu_time(), _peak_rss_mb()
+        self._metrics[node.name] = {
+            "wall_time": [wall_time, wall_time],
+            "cpu_time": [cpu_time, cpu_time],
+            "rss": None if rss is None else [rss, rss],
+            "input_rows": None,
+            "output_rows": None,
+            "inputs": set(),
+            "outputs": set(),
+        }
+
+    def _update(self, node: Node) -> None:
+        """
+        Measures the time and memory of a node up to now.
+
+        Args:
+            node (Node): The node.
+        """
+        metrics = self._metrics[node.name]
+        metrics["wall_time"][1] = time.perf_counter()
+        metrics["cpu_time"][1] = _cpu_time()
+        if metrics["rss"] is not None:
+            metrics["rss"][1] = _peak_rss_mb()
+
+    def _dataset_sizes(self, dataset_names: set[str]) -> Optional[int]:
+        """
+        Sums the sizes of the files of datasets.
+
+        Args:
+            dataset_names (set[str]): The names of the datasets.
+
+        Returns:
+            Optional[int]: The size of the files in bytes, or None if none of the datasets
+                are stored in files, e.g. parameters and `MemoryDataset`.
+        """
+        sizes = [_dataset_size(self._catalog, name) for name in sorted(dataset_names)]
+        sizes = [size for size in sizes if size is not None]
+
+        return sum(sizes) if sizes else None
+
+    def _save(self, catalog: DataCatalog) -> None:
+        """
+        Logs the slowest nodes and saves the metrics to the metrics dataset.
+
+        Args:
+            catalog (DataCatalog): The catalog of the run.
+        """
+        metrics = self.to_frame()
+        if metrics.empty:
+            return
+
+        slowest = metrics.nlargest(5, "wall_time_s")
+        logger.info(
+            "Slowest nodes:\n"
+            + slowest.to_string(index=False, float_format=lambda x: f"{x:.2f}")
+        )
+
+        if self._dataset_name in catalog.list():
+            catalog.save(self._dataset_name, metrics)
+
+
+def _cpu_time() -> float:
+    """Returns the CPU time of the process and of its exited child processes in seconds."""
+    cpu_time = time.process_time()
+    if resource is not None:
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu_time += children.ru_utime + children.ru_stime
+
+    return cpu_time
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Returns the peak resident set size of the process in MB, or None on Windows."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # `ru_maxrss` is in bytes on macOS and in kilobytes on Linux
+    return max_rss / 1024**2 if sys.platform == "darwin" else max_rss / 1024
+
+
+def _count_rows(data: Any) -> Optional[int]:
+    """
+    Counts the rows of the data of a dataset.
+
+    Args:
+        data (Any): The data, e.g. a DataFrame, an Arrow table or the partitions of a
+            `PartitionedDataset`.
+
+    Returns:
+        Optional[int]: The number of rows, or None if the data has no rows, e.g. the
+            parameters, or the partitions are loaded lazily.
+    """
+    if isinstance(data, pd.DataFrame):
+        return len(data)
+    if isinstance(data, (pa.Table, pa.RecordBatch)):
+        return data.num_rows
+    if isinstance(data, ds.Dataset):
+        return data.count_rows()
+    if isinstance(data, dict):
+        counts = [_count_rows(value) for value in data.values()]
+        counts = [count for count in counts if count is not None]
+        return sum(counts) if counts else None
+
+    return None
+
+
+def _add(total: Optional[int], count: Optional[int]) -> Optional[int]:
+    """Adds a row count to a total, where None means that there are no rows to count."""
+    if count is None:
+        return total
+
+    return count if total is None else total + count
+
+
+def _dataset_size(catalog: DataCatalog, dataset_name: str) -> Optional[int]:
+    """
+    Gets the size of the files of a dataset.
+
+    The path of file-based datasets, including the `PartitionedDataset` and the latest
+    version of versioned datasets, is found from the attributes of the dataset.
+
+    Args:
+        catalog (DataCatalog): The catalog of the run.
+        dataset_name (str): The name of the dataset.
+
+    Returns:
+        Optional[int]: The size of the file or directory of the dataset in bytes, or None
+            if the dataset is not stored in files.
+    """
+    try:
+        dataset = catalog._get_dataset(dataset_name)
+    except Exception:
+        return None
+
+    fs = getattr(dataset, "_fs", None) or getattr(dataset, "_filesystem", None)
+    path = getattr(dataset, "_filepath", None) or getattr(dataset, "_path", None)
+    if fs is None or path is None:
+        return None
+
+    try:
+        if getattr(dataset, "_version", None) is not None:
+            path = dataset._get_load_path()
+        return fs.du(str(path))
+    except Exception:
+        # e.g. the dataset has not been saved yet
+        return None
@@ -2,6 +2,9 @@
 
 from typing import Dict
 
+from content_optimization.pipelines.data_processing.pipeline import (
+    create_streaming_pipeline,
+)
 from kedro.framework.project import find_pipelines
 from kedro.pipeline import Pipeline
 
@@ -14,4 +17,7 @@ def register_pipelines() -> Dict[str, Pipeline]:
     """
     pipelines = find_pipelines()
     pipelines["__default__"] = sum(pipelines.values())
+    # Alternative to `data_processing` that writes the same outputs, so it is not part of
+    # the default pipeline. Run it with `kedro run --pipeline data_processing_streaming`
+    pipelines["data_processing_streaming"] = create_streaming_pipeline()
     return pipelines
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import logging
+import time
+from dataclasses import asdict
+from typing import Optional
+
+import pandas as pd
+from content_optimization.pipelines.data_processing.extractor import (
+    EXTRACTOR_VERSION,
+    ExtractionResult,
+)
+
+# Set up logger in cache.py
+# Edit conf/logging.yml to see changes
+logger = logging.getLogger(__name__)
+
+# Columns of the extraction cache stored in `data/02_intermediate`
+CACHE_COLUMNS = ["key", "result", "last_used"]
+
+# Fields of `ExtractionResult` that are stored as lists of tuples
+TUPLE_FIELDS = ("extracted_links", "extracted_headers", "extracted_images", "sections")
+
+
+class ExtractionCache:
+    """
+    A persistent cache of the data extracted from the HTML content of articles.
+
+    Each entry is keyed by a hash of the HTML content, the parser backend and
+    `EXTRACTOR_VERSION`, so a change to the extractor invalidates all entries.
+    Entries are evicted by least recent use when the cache exceeds its size limits.
+
+    Attributes:
+        hits (int): The number of lookups found in the cache.
+        misses (int): The number of lookups not found in the cache.
+    """
+
+    def __init__(self, cache: Optional[pd.DataFrame] = None) -> None:
+        """
+        Initializes the ExtractionCache with the given cache entries.
+
+        Args:
+            cache (Optional[pd.DataFrame]): The cache entries with the columns in
+                `CACHE_COLUMNS`. Defaults to None, which initializes an empty cache.
+        """
+        self._entries = {}
+        self._last_used = {}
+        self._now = time.time()
+        self.hits = 0
+        self.misses = 0
+
+        if cache is not None and not cache.empty:
+            self._entries = dict(zip(cache["key"], cache["result"]))
+            self._last_used = dict(zip(cache["key"], cache["last_used"]))
+
+    @staticmethod
+    def make_key(html_content: str, parser: str) -> str:
+        """
+        Creates the cache key of an HTML content.
+
+        Args:
+            html_content (str): The HTML content of the article.
+            parser (str): The parser backend used by the `HTMLExtractor`.
+
+        Returns:
+            str: The SHA-256 hex digest of the extractor version, parser and HTML content.
+        """
+        stamp = f"{EXTRACTOR_VERSION}:{parser}:".encode()
+        return hashlib.sha256(stamp + html_content.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ExtractionResult]:
+        """
+        Gets the cached extraction result for the given key.
+
+        Args:
+            key (str): The cache key of the HTML content.
+
+        Returns:
+            Optional[ExtractionResult]: The cached extraction result or None on a miss.
+        """
+        payload = self._entries.get(key)
+        if payload is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._last_used[key] = self._now
+
+        result = json.loads(payload)
+        for field in TUPLE_FIELDS:
+            result[field] = [tuple(record) for record in result[field]]
+
+        return ExtractionResult(**result)
+
+    def put(self, key: str, result: ExtractionResult) -> None:
+        """
+        Stores the extraction result in the cache.
+
+        Args:
+            key (str): The cache key of the HTML content.
+            result (ExtractionResult): The extraction result to be stored.
+        """
+        self._entries[key] = json.dumps(asdict(result))
+        self._last_used[key] = self._now
+
+    def to_frame(
+        self, max_entries: Optional[int] = None, max_size_mb: Optional[float] = None
+    ) -> pd.DataFrame:
+        """
+        Converts the cache to a DataFrame, evicting the least recently used entries
+        beyond the given limits.
+
+        Args:
+            max_entries (Optional[int]): The maximum number of entries. Defaults to None (no limit).
+            max_size_mb (Optional[float]): The maximum size of the cached results in megabytes.
+                Defaults to None (no limit).
+
+        Returns:
+            pd.DataFrame: The cache entries with the columns in `CACHE_COLUMNS`.
+        """
+        cache = pd.DataFrame(
+            {
+                "key": list(self._entries.keys()),
+                "result": list(self._entries.values()),
+                "last_used": [self._last_used[key] for key in self._entries],
+            },
+            columns=CACHE_COLUMNS,
+        )
+        # Most recently used entries first
+        cache = cache.sort_values(
+            "last_used", ascending=False, kind="stable"
+        ).reset_index(drop=True)
+
+        keep = pd.Series(True, index=cache.index)
+        if max_entries is not None:
+            keep &= cache.index < max_entries
+        if max_size_mb is not None:
+            keep &= cache["result"].str.len().cumsum() <= max_size_mb * 1024**2
+
+        num_evicted = int((~keep).sum())
+        if num_evicted > 0:
+            logger.info(f"Extraction Cache - Evicted {num_evicted} entries")
+
+        return cache[keep].reset_index(drop=True)
+
+    def log_stats(self) -> None:
+        """Logs the hit and miss statistics of the cache."""
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups if lookups else 0.0
+        logger.info(
+            f"Extraction Cache - {self.hits} hits, {self.misses} misses "
+            f"({hit_rate:.1%} hit rate) out of {lookups} articles"
+        )
@@ -1,15 +1,199 @@
 import logging
 import re
 import string
+import time
 import unicodedata
-from typing import Optional
-
-from bs4 import BeautifulSoup, NavigableString, PageElement
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+from typing import Any, Optional
+
+import pyarrow as pa
+from bs4 import BeautifulSoup, NavigableString, PageElement, Tag
+from content_optimization.pipelines.data_processing.parsers import build_soup
+from content_optimization.pipelines.data_processing.tables import (
+    ParsedTable,
+    parse_table,
+)
 
 # Set up logger in extractor.py
 # Edit conf/logging.yml to see changes
 logger = logging.getLogger(__name__)
 
+HEADER_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+# Characters replaced before the Unicode normalization in `HTMLExtractor.clean_text`
+# NOTE: Characters without an ASCII decomposition are dropped, so the zero-width space
+# and the line and paragraph separators are deleted rather than replaced
+TRANSLATION_TABLE = str.maketrans(
+    {
+        "\u2013": "-",  # dash
+        "\xa0": " ",  # non-breaking space
+        "\u200b": None,  # zero-width space
+        "\u2028": None,  # line separator
+        "\u2029": None,  # paragraph separator
+    }
+)
+
+# Texts up to this length are memoised, as short fragments (e.g. "Read these next:",
+# table headers) recur across articles
+MEMO_MAX_LENGTH = 128
+MEMO_MAX_SIZE = 8192
+
+# Version stamp of the extraction logic, used to invalidate the extraction cache
+# NOTE: Bump this whenever a change to `HTMLExtractor` changes the extracted data
+EXTRACTOR_VERSION = "4"
+
+# Stages of `HTMLExtractor` timed by `ExtractionMetrics`, keyed by the method of each stage
+# NOTE: `_process_table` runs once per table, so its durations add up over the tables
+METRICS_STAGES = {
+    "preprocess_html": "preprocess_html",
+    "_collect_elements": "collect_elements",
+    "_process_table": "process_tables",
+    "_extract_related_sections": "extract_related_sections",
+    "_extract_links": "extract_links",
+    "_extract_headers": "extract_headers",
+    "_extract_img_links_and_alt_text": "extract_images",
+    "_extract_text": "extract_text",
+}
+
+# Counts recorded by `ExtractionMetrics`
+METRICS_COUNTS = [
+    "dom_nodes",
+    "tables",
+    "images",
+    "links",
+    "headers",
+    "fragments",
+    "cleaned_fragments",
+]
+
+
+@dataclass
+class ExtractionResult:
+    """
+    A container for all the data extracted from the HTML content of an article.
+
+    Attributes:
+        has_table (bool): Whether the HTML content contains a table.
+        has_image (bool): Whether the HTML content contains an image.
+        related_sections (list[str]): The "Related:" sections and "Read these next:" items.
+        extracted_tables (Optional[list[list[list[str]]]]): The processed tables.
+        extracted_raw_html_tables (Optional[list[str]]): The tables in HTML format.
+        extracted_links (list[tuple[str, str]]): The text and URL of each link.
+        extracted_headers (list[tuple[str, str]]): The text and tag name of each header.
+        extracted_images (list[tuple[str, str]]): The alternate text and URL of each image.
+        extracted_content_body (str): The main content extracted from the HTML content.
+        sections (list[tuple[str, str, int, int, int]]): The header, tag name, start offset,
+            content start offset and end offset of each section of `extracted_content_body`.
+            See `HTMLExtractor.extract_sections`.
+    """
+
+    has_table: bool
+    has_image: bool
+    related_sections: list[str]
+    extracted_tables: Optional[list[list[list[str]]]]
+    extracted_raw_html_tables: Optional[list[str]]
+    extracted_links: list[tuple[str, str]]
+    extracted_headers: list[tuple[str, str]]
+    extracted_images: list[tuple[str, str]]
+    extracted_content_body: str
+    sections: list[tuple[str, str, int, int, int]]
+
+
+@dataclass
+class ExtractionMetrics:
+    """
+    The metrics of the extraction of an article, collected by the `HTMLExtractor` when enabled.
+
+    Attributes:
+        dom_nodes (int): The number of tags in the tree after preprocessing.
+        tables (int): The number of tables.
+        images (int): The number of images.
+        links (int): The number of links.
+        headers (int): The number of headers.
+        fragments (int): The number of text fragments before they are cleaned up.
+        cleaned_fragments (int): The number of text fragments after they are cleaned up.
+        durations (dict[str, float]): The duration in seconds of every stage in `METRICS_STAGES`.
+    """
+
+    dom_nodes: int = 0
+    tables: int = 0
+    images: int = 0
+    links: int = 0
+    headers: int = 0
+    fragments: int = 0
+    cleaned_fragments: int = 0
+    durations: dict[str, float] = field(default_factory=dict)
+
+    def timed(self, stage: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wraps a function so that its duration is added to the duration of a stage.
+
+        Args:
+            stage (str): The name of the stage.
+            func (Callable[..., Any]): The function of the stage.
+
+        Returns:
+            Callable[..., Any]: The timed function.
+        """
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.durations[stage] = (
+                    self.durations.get(stage, 0.0) + time.perf_counter() - start
+                )
+
+        return wrapper
+
+
+class _HeaderFragment(str):
+    """
+    A content fragment that contains headers, as a `str` that remembers where the headers are.
+
+    Concatenating a header fragment with a plain string or another header fragment, on either
+    side, returns a header fragment with the positions of all their headers shifted accordingly.
+    So the headers survive the merging of fragments in `_extract_text_elements` and
+    `_clean_up_fragments`, e.g. of a short header with the next header, and their offsets in
+    the extracted content body can be found without searching for their text.
+
+    Attributes:
+        headers (list[tuple[str, str, int]]): The cleaned text, the tag name (e.g. "h2") and the
+            position within the fragment of each header, in order.
+    """
+
+    def __new__(
+        cls,
+        text: str,
+        level: Optional[str] = None,
+        headers: Optional[list[tuple[str, str, int]]] = None,
+    ):
+        fragment = super().__new__(cls, text)
+        fragment.headers = [(text, level, 0)] if headers is None else headers
+        return fragment
+
+    def __add__(self, other: str) -> "_HeaderFragment":
+        headers = list(self.headers)
+        if isinstance(other, _HeaderFragment):
+            headers += [
+                (header, level, len(self) + offset)
+                for header, level, offset in other.headers
+            ]
+        return _HeaderFragment(str.__add__(self, other), headers=headers)
+
+    def __radd__(self, other: str) -> "_HeaderFragment":
+        return _HeaderFragment(
+            other + str(self),
+            headers=[
+                (header, level, len(other) + offset)
+                for header, level, offset in self.headers
+            ],
+        )
+
 
 class HTMLExtractor:
     """
@@ -24,29 +208,57 @@ class HTMLExtractor:
     """
 
     def __init__(
-        self, content_name: str, content_category: str, full_url: str, html_content: str
+        self,
+        content_name: str,
+        content_category: str,
+        full_url: str,
+        html_content: str,
+        parser: str = "html.parser",
+        collect_metrics: bool = False,
     ) -> None:
         """
         Initializes the HTMLExtractor with the given HTML content.
 
+        If `collect_metrics` is True, the stages in `METRICS_STAGES` are timed and the
+        elements of the tree are counted in `metrics`. Otherwise, `metrics` is None and
+        no method is wrapped, so the extraction does not pay for the metrics.
+
         Args:
             content_name (str): The name of the article
             content_category (str): The category of the article
             full_url (str): The URL of the article
             html_content (str): The HTML content to be processed.
+            parser (str): The parser backend used to build the tree. Must be one of
+                "html.parser", "lxml" or "lexbor". Defaults to "html.parser".
+            collect_metrics (bool): Whether to collect the `ExtractionMetrics` of the article.
+                Defaults to False.
         """
         logger.debug(
-            f"Text Extraction - Extracting `{content_name}` within `{content_category}`. Link to article - `{full_url}`"
+            "Text Extraction - Extracting `%s` within `%s`. Link to article - `%s`",
+            content_name,
+            content_category,
+            full_url,
         )
 
         self.content_name = content_name
         self.content_category = content_category
         self.url = full_url
-        self.soup = self.preprocess_html(html_content)
+        self.metrics = None
+        self._result = None
+        self._tables = None
+
+        if collect_metrics:
+            self.metrics = ExtractionMetrics()
+            # Shadow the methods of the stages with timed methods of this instance only
+            for method, stage in METRICS_STAGES.items():
+                setattr(self, method, self.metrics.timed(stage, getattr(self, method)))
+
+        self.soup = self.preprocess_html(html_content, parser)
 
-        # Check how many direct children the HTML content has for debugging purposes
-        num_children = len(list(self.soup.children))
-        logger.debug(f"Text Extraction - {num_children} children detected")
+        if self.metrics is not None:
+            self.metrics.dom_nodes = sum(
+                1 for element in self.soup.descendants if isinstance(element, Tag)
+            )
 
     @classmethod
     def clean_text(cls, text: str) -> str:
@@ -64,39 +276,40 @@ def clean_text(cls, text: str) -> str:
         Note:
             This method is being used in all extractor methods.
         """
-        # Replace dash in unicode
-        text = text.replace("\u2013", "-")  # Replace dashes
+        if len(text) <= MEMO_MAX_LENGTH:
+            return _clean_short_text(text)
 
-        # Normalize Unicode characters
-        text = unicodedata.normalize("NFKD", text)
-        # Use ASCII encoding to handle special symbols e.g. copyright \xa9
-        text = text.encode("ascii", "ignore").decode("utf-8")
+        return _clean_text(text)
 
-        # Replace common problematic characters
-        text = text.replace("\xa0", " ")  # non-breaking space
-        text = text.replace("\u200b", "")  # zero-width space
-        text = text.replace("\u2028", "\n")  # line separator
-        text = text.replace("\u2029", "\n")  # paragraph separator
-        text = text.replace("_x000D_", "")  # Carriage return
+    @classmethod
+    def clean_texts(cls, texts: list[str]) -> list[str]:
+        """
+        Cleans a batch of texts. See `clean_text`.
 
-        # Replace multiple whitespace with single space
-        text = re.sub(r"\s+", " ", text)
+        Args:
+            texts (list[str]): The input texts to be cleaned.
 
-        return text.strip()
+        Returns:
+            list[str]: The cleaned texts, in the same order.
+        """
+        return [cls.clean_text(text) for text in texts]
 
     @classmethod
-    def preprocess_html(cls, html_content: str) -> BeautifulSoup:
+    def preprocess_html(
+        cls, html_content: str, parser: str = "html.parser"
+    ) -> BeautifulSoup:
         """
         Preprocesses the given HTML content by replacing all <br>
         tags with newline characters.
 
         Args:
             html_content (str): The HTML content to be preprocessed.
+            parser (str): The parser backend. Defaults to "html.parser".
 
         Returns:
             BeautifulSoup: The preprocessed HTML content as a BeautifulSoup object.
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = build_soup(html_content, parser)
 
         # Find all <br> tags and replace them with newline
         # NOTE: These logs are commented out as it is only used during development
@@ -111,6 +324,87 @@ def preprocess_html(cls, html_content: str) -> BeautifulSoup:
 
         return soup
 
+    def extract_all(self) -> ExtractionResult:
+        """
+        Extracts all the data from the HTML content with a single traversal of the tree.
+
+        The tree is traversed once to collect the tables, images, links, headers and
+        candidates for related sections, from which all the data is derived. The main
+        content is extracted last as it modifies the tree. The result is cached, so
+        subsequent calls (and the individual extractor methods) do not traverse the
+        tree again.
+
+        Returns:
+            ExtractionResult: All the data extracted from the HTML content.
+        """
+        if self._result is not None:
+            return self._result
+
+        tables, images, links, headers, paragraphs_and_lists = self._collect_elements()
+        if self.metrics is not None:
+            self.metrics.tables = len(tables)
+            self.metrics.images = len(images)
+            self.metrics.links = len(links)
+            self.metrics.headers = len(headers)
+
+        # Each table is parsed and serialised in a single pass over its elements
+        self._tables = [self._process_table(table) for table in tables]
+        processed_tables = [table.to_list() for table in self._tables]
+        raw_html_tables = [table.raw_html for table in self._tables]
+
+        related_sections = self._extract_related_sections(paragraphs_and_lists)
+        extracted_links = self._extract_links(links)
+        extracted_headers = self._extract_headers(headers)
+        extracted_images = self._extract_img_links_and_alt_text(images)
+
+        # The main content is extracted last as it modifies the tree
+        extracted_content_body, sections = self._extract_text(tables)
+
+        self._result = ExtractionResult(
+            has_table=len(tables) > 0,
+            has_image=len(images) > 0,
+            related_sections=related_sections,
+            extracted_tables=processed_tables if processed_tables else None,
+            extracted_raw_html_tables=raw_html_tables if raw_html_tables else None,
+            extracted_links=extracted_links,
+            extracted_headers=extracted_headers,
+            extracted_images=extracted_images,
+            extracted_content_body=extracted_content_body,
+            sections=sections,
+        )
+
+        return self._result
+
+    def _collect_elements(
+        self,
+    ) -> tuple[list[Tag], list[Tag], list[Tag], list[Tag], list[Tag]]:
+        """
+        Collects the elements that the data is extracted from in a single traversal of the tree.
+
+        Returns:
+            tuple[list[Tag], list[Tag], list[Tag], list[Tag], list[Tag]]: The tables, images,
+                links, headers, and paragraphs and unordered lists in document order.
+        """
+        tables, images, links, headers, paragraphs_and_lists = [], [], [], [], []
+
+        # Collect all relevant elements in document order
+        for element in self.soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            name = element.name
+            if name == "table":
+                tables.append(element)
+            elif name == "img":
+                images.append(element)
+            elif name == "a":
+                links.append(element)
+            elif name in HEADER_TAGS:
+                headers.append(element)
+            elif name in ("p", "ul"):
+                paragraphs_and_lists.append(element)
+
+        return tables, images, links, headers, paragraphs_and_lists
+
     def extract_text(self) -> str:
         """
         Extracts the main content from the HTML content.
@@ -118,6 +412,45 @@ def extract_text(self) -> str:
         Returns:
             str: The main content body extracted from the HTML content.
 
+        Note:
+            This is a view over the result of `extract_all`.
+        """
+        return self.extract_all().extracted_content_body
+
+    def extract_sections(self) -> list[tuple[str, str, int, int, int]]:
+        """
+        Extracts the sections of the main content.
+
+        Every h1 to h6 header in the main content starts a section, which ends where the next
+        section starts or at the end of the main content, regardless of the level of the next
+        header. So `extracted_content_body[start:end]` is the header followed by its content,
+        `extracted_content_body[content_start:end]` is its content only, and the content before
+        the first header is `extracted_content_body[:start]` of the first section.
+
+        Returns:
+            list[tuple[str, str, int, int, int]]: The header, tag name (e.g. "h2"), start offset,
+                content start offset and end offset of each section in `extracted_content_body`,
+                in document order. The content starts at the first non-whitespace character
+                after the header, or at the end offset if the section has no content.
+
+        Note:
+            This is a view over the result of `extract_all`.
+        """
+        return self.extract_all().sections
+
+    def _extract_text(
+        self, tables: list[Tag]
+    ) -> tuple[str, list[tuple[str, str, int, int, int]]]:
+        """
+        Extracts the main content and its sections from the HTML content.
+
+        Args:
+            tables (list[Tag]): All the tables in the HTML content, to be removed from the tree.
+
+        Returns:
+            tuple[str, list[tuple[str, str, int, int, int]]]: The main content body extracted from
+                the HTML content and its sections. See `extract_sections`.
+
         Note:
             This function unwraps the HTML content if it is contained in a <div>.
             It then removes tables and extracts the main content by iterating over the tags in the soup.
@@ -144,9 +477,14 @@ def extract_text(self) -> str:
             self.soup.div.unwrap()
 
         # Remove all tables from the HTML text
-        for table in self.soup.find_all("table"):
+        for table in tables:
             table.extract()
-            logger.debug(f"Text Extraction - Removing table from {self.content_name}")
+        if tables:
+            logger.debug(
+                "Text Extraction - Removed %d tables from %s",
+                len(tables),
+                self.content_name,
+            )
 
         # Extract the main content
         content = []
@@ -177,13 +515,74 @@ def extract_text(self) -> str:
 
         # Clean up content fragments
         cleaned_content = self._clean_up_fragments(content)
+        if self.metrics is not None:
+            self.metrics.fragments = len(content)
+            self.metrics.cleaned_fragments = len(cleaned_content)
 
         # Replace double newlines with single newlines and strip whitespace
-        extracted_content_body = (
-            "\n".join(cleaned_content).replace("\n\n", "\n").strip()
+        joined_content = "\n".join(cleaned_content)
+        replaced_content = joined_content.replace("\n\n", "\n")
+        extracted_content_body = replaced_content.strip()
+
+        sections = self._locate_sections(
+            cleaned_content, joined_content, replaced_content
         )
 
-        return extracted_content_body
+        return extracted_content_body, sections
+
+    @staticmethod
+    def _locate_sections(
+        cleaned_content: list[str], joined_content: str, replaced_content: str
+    ) -> list[tuple[str, str, int, int, int]]:
+        """
+        Locates the headers of the cleaned content fragments in the extracted content body.
+
+        The offset of each header in the joined fragments is known from the lengths of the
+        fragments before it, and is shifted by the double newlines replaced and the whitespace
+        stripped before it. The double newlines are counted once, between consecutive headers.
+
+        Args:
+            cleaned_content (list[str]): The cleaned content fragments.
+            joined_content (str): The fragments joined by newlines.
+            replaced_content (str): The joined content with its double newlines replaced,
+                i.e. the extracted content body before its whitespace is stripped.
+
+        Returns:
+            list[tuple[str, str, int, int, int]]: The sections of the extracted content body.
+                See `extract_sections`.
+        """
+        starts = []
+        position = 0
+        for fragment in cleaned_content:
+            if isinstance(fragment, _HeaderFragment):
+                for header, level, offset in fragment.headers:
+                    starts.append((header, level, position + offset))
+            position += len(fragment) + 1
+
+        sections = []
+        stripped_content = replaced_content.strip()
+        leading_whitespace = len(replaced_content) - len(replaced_content.lstrip())
+        replaced = 0
+        previous = 0
+        for header, level, start in starts:
+            # A header never starts with a newline, so no double newline spans its start
+            replaced += joined_content.count("\n\n", previous, start)
+            previous = start
+            offset = start - replaced - leading_whitespace
+            if sections:
+                sections[-1][4] = offset
+            sections.append([header, level, offset, None, None])
+
+        for section in sections:
+            if section[4] is None:
+                section[4] = len(stripped_content)
+            # The content starts after the header and the whitespace after it, which may be
+            # a newline, a space or nothing, e.g. if the header was merged with the next text
+            header_end = min(section[2] + len(section[0]), section[4])
+            content = stripped_content[header_end : section[4]]
+            section[3] = header_end + len(content) - len(content.lstrip())
+
+        return [tuple(section) for section in sections]
 
     def _clean_up_fragments(self, content: list[str], threshold: int = 5) -> list[str]:
         """
@@ -250,7 +649,7 @@ def _extract_text_elements(self, tag: PageElement, content: list[str]) -> None:
         if tag.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
             # Provide paragraphing between key headers
             content.append("\n")
-            content.append(self.clean_text(tag.text))
+            content.append(_HeaderFragment(self.clean_text(tag.text), tag.name))
 
         # For texts with strong importance
         elif tag.name == "strong":
@@ -317,7 +716,9 @@ def _extract_text_elements(self, tag: PageElement, content: list[str]) -> None:
                 "support-group-and-others",
             ]:
                 logger.debug(
-                    f"Text Extraction - Tag {tag.name} not handled within {self._extract_text_elements.__name__}: {cleaned_text[:25]}"
+                    "Text Extraction - Tag %s not handled within _extract_text_elements: %s",
+                    tag.name,
+                    cleaned_text[:25],
                 )
 
     def _extract_text_from_strong(self, tag: PageElement, content: list[str]) -> None:
@@ -379,7 +780,10 @@ def _extract_text_from_strong(self, tag: PageElement, content: list[str]) -> Non
                     cleaned_text = self.clean_text(child.text)
                     if cleaned_text != "":
                         logger.debug(
-                            f"Text Extraction - Tag {child.name} not handled within {tag.name}: {cleaned_text[:25]}"
+                            "Text Extraction - Tag %s not handled within %s: %s",
+                            child.name,
+                            tag.name,
+                            cleaned_text[:25],
                         )
 
     def _extract_text_from_p(self, tag: PageElement, content: list[str]) -> None:
@@ -463,7 +867,10 @@ def _extract_text_from_p(self, tag: PageElement, content: list[str]) -> None:
                     cleaned_text = self.clean_text(child.text)
                     if cleaned_text != "":
                         logger.debug(
-                            f"Text Extraction - Tag {child.name} not handled within {tag.name}: {cleaned_text[:25]}"
+                            "Text Extraction - Tag %s not handled within %s: %s",
+                            child.name,
+                            tag.name,
+                            cleaned_text[:25],
                         )
         return
 
@@ -502,7 +909,10 @@ def _extract_text_from_em(self, tag: PageElement, content: list[str]) -> None:
             # Monitor for missed edge cases
             elif cleaned_text != "":
                 logger.debug(
-                    f"Text Extraction - Tag {child.name} not handled within {tag.name}: {cleaned_text[:25]}"
+                    "Text Extraction - Tag %s not handled within %s: %s",
+                    child.name,
+                    tag.name,
+                    cleaned_text[:25],
                 )
 
     def _extract_text_from_ul(self, tag: PageElement, content: list[str]) -> None:
@@ -574,7 +984,10 @@ def _extract_text_from_ul(self, tag: PageElement, content: list[str]) -> None:
                 cleaned_text = self.clean_text(child.text)
                 if cleaned_text != "":
                     logger.debug(
-                        f"Text Extraction - Tag {child.name} not handled within {tag.name}: {cleaned_text[:25]}"
+                        "Text Extraction - Tag %s not handled within %s: %s",
+                        child.name,
+                        tag.name,
+                        cleaned_text[:25],
                     )
 
         content.append("\n")
@@ -625,7 +1038,10 @@ def _extract_text_from_ol(self, tag: PageElement, content: list[str]) -> None:
                 cleaned_text = self.clean_text(child.text)
                 if cleaned_text != "":
                     logger.debug(
-                        f"Text Extraction - Tag {child.name} not handled within {tag.name}: {cleaned_text[:25]}"
+                        "Text Extraction - Tag %s not handled within %s: %s",
+                        child.name,
+                        tag.name,
+                        cleaned_text[:25],
                     )
 
         content.append("\n")
@@ -671,7 +1087,10 @@ def _extract_text_from_container(
                     cleaned_text = self.clean_text(child.text)
                     if cleaned_text != "":
                         logger.debug(
-                            f"Text Extraction - Tag {child.name} not handled within {tag.name}: {cleaned_text[:25]}"
+                            "Text Extraction - Tag %s not handled within %s: %s",
+                            child.name,
+                            tag.name,
+                            cleaned_text[:25],
                         )
             # Continue extracting text for other elements
             else:
@@ -683,12 +1102,11 @@ def check_for_table(self) -> bool:
 
         Returns:
             bool: True if at least one table tag is found, False otherwise.
-        """
-        # Find all table tags
-        tables = self.soup.find_all("table")
 
-        # Return True if at least one table is found, False otherwise
-        return len(tables) > 0
+        Note:
+            This is a view over the result of `extract_all`.
+        """
+        return self.extract_all().has_table
 
     def check_for_image(self) -> bool:
         """
@@ -696,24 +1114,38 @@ def check_for_image(self) -> bool:
 
         Returns:
             bool: True if at least one img tag is found, False otherwise.
-        """
-        # Find all img tags
-        images = self.soup.find_all("img")
 
-        # Return True if at least one image is found, False otherwise
-        return len(images) > 0
+        Note:
+            This is a view over the result of `extract_all`.
+        """
+        return self.extract_all().has_image
 
     def extract_related_sections(self) -> list[str]:
         """
         Extracts "Related:" sections and "Read these next:" items from the HTML content.
 
+        Returns:
+            list[str]: A list of related sections and "Read these next:" items.
+
+        Note:
+            This is a view over the result of `extract_all`.
+        """
+        return self.extract_all().related_sections
+
+    def _extract_related_sections(self, tags: list[Tag]) -> list[str]:
+        """
+        Extracts "Related:" sections and "Read these next:" items from the given tags.
+
+        Args:
+            tags (list[Tag]): All the p and ul tags in the HTML content in document order.
+
         Returns:
             list[str]: A list of related sections and "Read these next:" items.
         """
         related_sections = []
         read_these_next_ul = None
         # Extract "Related:" sections and "Read these next:" items
-        for tag in self.soup.find_all(["p", "ul"]):
+        for tag in tags:
             if tag.name == "p" and tag.find("strong"):
                 cleaned_text = self.clean_text(tag.text)
                 if "Related:" in cleaned_text:
@@ -733,13 +1165,11 @@ def extract_tables(self) -> Optional[list[list[list[str]]]]:
         Returns:
             list[list[list[str]]]: A list of processed tables, where each table is represented
                 as a list of rows, and each row is a list of cell values.
-        """
-        tables = []
-        for table in self.soup.find_all("table"):
-            processed_table = self._process_table(table)
-            tables.append(processed_table)
 
-        return tables if tables else None
+        Note:
+            This is a view over the result of `extract_all`.
+        """
+        return self.extract_all().extracted_tables
 
     def extract_raw_html_tables(self) -> Optional[list[str]]:
         """
@@ -747,54 +1177,63 @@ def extract_raw_html_tables(self) -> Optional[list[str]]:
 
         Returns:
             list[str]: A list of tables in HTML format.
+
+        Note:
+            This is a view over the result of `extract_all`.
+        """
+        return self.extract_all().extracted_raw_html_tables
+
+    def extract_arrow_tables(self) -> Optional[list[Optional[pa.Table]]]:
         """
-        tables = []
-        for table in self.soup.find_all("table"):
-            tables.append(str(table))
+        Extract all tables from the HTML content as Arrow tables.
 
-        return tables if tables else None
+        Returns:
+            Optional[list[Optional[pa.Table]]]: A list of tables, where each table has a string
+                column per column of the table, named by its header. Empty tables are None.
+
+        Note:
+            This is a view over the tables parsed by `extract_all`.
+        """
+        self.extract_all()
+        if not self._tables:
+            return None
+        return [table.to_arrow() for table in self._tables]
 
-    def _process_table(self, table_html: PageElement) -> list[list[str]]:
+    def _process_table(self, table_html: Tag) -> ParsedTable:
         """
-        Process a single HTML table and convert it to a list of lists.
+        Process a single HTML table into a rectangular grid and its HTML.
 
-        Note: This method does not account for rowspan and colspan attributes.
+        Cells with a `rowspan` or `colspan` attribute are repeated in every row and
+        column they span. See `parse_table`.
 
         Args:
-            table_html (PageElement): The BeautifulSoup element representing the HTML table.
+            table_html (Tag): The BeautifulSoup element representing the HTML table.
 
         Returns:
-            list[list[str]]: A list of rows, where each row is a list of cell values.
-            Returns None if the table is empty.
+            ParsedTable: The header and rows of the table, and the table in HTML format.
         """
-        # Note: Does not account for rowspan and colspan in processing the table
-        table = []
-
-        # Skip empty tables - Empty table in All You Need to Know About Childhood Immunisations
-        if table_html.find_all("tr") == []:
-            return None
-        # Process table headers
-        headers = [
-            self.clean_text(header.get_text())
-            for header in table_html.find_all("tr")[0]
-        ]
-        # Remove empty headers
-        headers = list(filter(lambda k: " " in k, headers))
-        # Append headers
-        table.append(headers)
-
-        # Process table rows
-        for row in table_html.find_all("tr")[1:]:
-            cols = row.find_all("td")
-            cols = [self.clean_text(ele.get_text()) for ele in cols]
-            table.append(cols)
-
-        return table
+        return parse_table(table_html, self.clean_text)
 
     def extract_links(self) -> list[tuple[str, str]]:
         """
         Extracts the title and URL from all the anchor tags in the HTML content.
 
+        Returns:
+            list[tuple[str, str]]:
+                A list of tuples containing the title and URL of each anchor tag.
+
+        Note:
+            This is a view over the result of `extract_all`.
+        """
+        return self.extract_all().extracted_links
+
+    def _extract_links(self, links: list[Tag]) -> list[tuple[str, str]]:
+        """
+        Extracts the title and URL from the given anchor tags.
+
+        Args:
+            links (list[Tag]): All the anchor tags in the HTML content in document order.
+
         Returns:
             list[tuple[str, str]]:
                 A list of tuples containing the title and URL of each anchor tag.
@@ -805,7 +1244,7 @@ def extract_links(self) -> list[tuple[str, str]]:
         extracted_links = []
 
         # Extract title/text and links from anchor tags
-        for link in self.soup.find_all("a"):
+        for link in links:
             url = link.get("href")
             # Skip incorrectly formatted urls or footnotes
             if url is None or re.search(r"#footnote\w+", url):
@@ -830,6 +1269,23 @@ def extract_headers(self) -> list[tuple[str, str]]:
         """
         Extracts the headers from the HTML content.
 
+        Returns:
+            list[tuple[str, str]]:
+                A list of tuples containing the text and tag name of
+                each header found in the HTML content.
+
+        Note:
+            This is a view over the result of `extract_all`.
+        """
+        return self.extract_all().extracted_headers
+
+    def _extract_headers(self, headers: list[Tag]) -> list[tuple[str, str]]:
+        """
+        Extracts the text and tag name of the given headers.
+
+        Args:
+            headers (list[Tag]): All the h1 to h6 tags in the HTML content in document order.
+
         Returns:
             list[tuple[str, str]]:
                 A list of tuples containing the text and tag name of
@@ -837,7 +1293,7 @@ def extract_headers(self) -> list[tuple[str, str]]:
         """
         extracted_headers = []
 
-        for title in self.soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
+        for title in headers:
             tag = title.name
             text = self.clean_text(title.get_text())
             record = text, tag
@@ -849,13 +1305,31 @@ def extract_img_links_and_alt_text(self) -> list[tuple[str, str]]:
         """
         Extracts the url and alternate text from images
 
+        Returns:
+            list[tuple[str, str]]:
+                A list of tuples containing the image url and alternate text
+
+        Note:
+            This is a view over the result of `extract_all`.
+        """
+        return self.extract_all().extracted_images
+
+    def _extract_img_links_and_alt_text(
+        self, images: list[Tag]
+    ) -> list[tuple[str, str]]:
+        """
+        Extracts the url and alternate text from the given images
+
+        Args:
+            images (list[Tag]): All the img tags in the HTML content in document order.
+
         Returns:
             list[tuple[str, str]]:
                 A list of tuples containing the image url and alternate text
         """
         # Note: In some articles, the img alternate text is the same as the header
         extracted_links_and_alt_text = []
-        for img in self.soup.find_all("img"):
+        for img in images:
             # NOTE: Attributes are treated as dictionaries
             # Get image link from src attribute
             image_url = img.get("src", None)
@@ -868,3 +1342,34 @@ def extract_img_links_and_alt_text(self) -> list[tuple[str, str]]:
 
         # Return unique elements
         return extracted_links_and_alt_text
+
+
+def _clean_text(text: str) -> str:
+    """
+    Cleans the given text. See `HTMLExtractor.clean_text`.
+
+    Args:
+        text (str): The input text to be cleaned.
+
+    Returns:
+        str: The cleaned text.
+    """
+    # Replace dashes and problematic characters in a single pass
+    text = text.translate(TRANSLATION_TABLE)
+
+    # ASCII text is unchanged by the normalization and encoding
+    if not text.isascii():
+        # Normalize Unicode characters
+        text = unicodedata.normalize("NFKD", text)
+        # Use ASCII encoding to handle special symbols e.g. copyright \xa9
+        text = text.encode("ascii", "ignore").decode("utf-8")
+
+    text = text.replace("_x000D_", "")  # Carriage return
+
+    # Replace multiple whitespace with single space
+    # NOTE: `str.split` splits on the same characters as `\s`, and is faster than `re.sub`
+    return " ".join(text.split())
+
+
+# Bounded memo of `_clean_text` for short, repeated fragments
+_clean_short_text = lru_cache(maxsize=MEMO_MAX_SIZE)(_clean_text)
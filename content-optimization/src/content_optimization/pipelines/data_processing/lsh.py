@@ -0,0 +1,142 @@
+from collections import defaultdict
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+# Mersenne prime and hash range of the universal hash functions (same as `datasketch`)
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def shingle_hashes(text: str, shingle_size: int = 5) -> np.ndarray:
+    """
+    Hashes the word shingles of a text.
+
+    Texts with fewer words than `shingle_size` are hashed as a single shingle.
+
+    Args:
+        text (str): The text to be shingled.
+        shingle_size (int): The number of words in a shingle. Defaults to 5.
+
+    Returns:
+        np.ndarray: The sorted unique 32-bit hashes of the shingles.
+    """
+    words = text.lower().split()
+    if len(words) == 0:
+        return np.empty(0, dtype=np.uint64)
+
+    shingles = [
+        " ".join(words[i : i + shingle_size])
+        for i in range(max(len(words) - shingle_size + 1, 1))
+    ]
+    # `hash_array` is deterministic across processes, unlike the built-in `hash`
+    hashes = pd.util.hash_array(np.array(shingles, dtype=object))
+
+    return np.unique(hashes & MAX_HASH)
+
+
+def minhash_signatures(
+    hashes: list[np.ndarray], num_perm: int = 128, seed: int = 1
+) -> np.ndarray:
+    """
+    Computes the MinHash signatures of the shingle hashes of every text.
+
+    Each permutation is simulated by a universal hash function `(a * x + b) % prime`.
+
+    Args:
+        hashes (list[np.ndarray]): The shingle hashes of every text. See `shingle_hashes`.
+        num_perm (int): The number of permutations. Defaults to 128.
+        seed (int): The seed of the permutations. Defaults to 1.
+
+    Returns:
+        np.ndarray: The signatures as an array of shape (number of texts, `num_perm`).
+    """
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+    b = rng.randint(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    signatures = np.full((len(hashes), num_perm), MAX_HASH, dtype=np.uint64)
+    for i, text_hashes in enumerate(hashes):
+        if len(text_hashes) == 0:
+            continue
+        # Overflow wraps around, which is acceptable for hashing
+        with np.errstate(over="ignore"):
+            permuted = (text_hashes[:, None] * a + b) % MERSENNE_PRIME & MAX_HASH
+        signatures[i] = permuted.min(axis=0)
+
+    return signatures
+
+
+def jaccard_similarity(x: np.ndarray, y: np.ndarray) -> float:
+    """
+    Computes the Jaccard similarity of two sets of sorted unique shingle hashes.
+
+    Args:
+        x (np.ndarray): The shingle hashes of the first text.
+        y (np.ndarray): The shingle hashes of the second text.
+
+    Returns:
+        float: The Jaccard similarity between 0 and 1.
+    """
+    intersection = len(np.intersect1d(x, y, assume_unique=True))
+    union = len(x) + len(y) - intersection
+
+    return intersection / union if union else 0.0
+
+
+def find_near_duplicates(
+    texts: list[str],
+    threshold: float = 0.9,
+    num_perm: int = 128,
+    bands: int = 16,
+    shingle_size: int = 5,
+    seed: int = 1,
+) -> list[tuple[int, int, float]]:
+    """
+    Finds the pairs of near-duplicate texts with MinHash and Locality Sensitive Hashing (LSH).
+
+    The MinHash signatures are split into `bands` bands. Texts that share a band in the same
+    bucket are candidate pairs, so only the candidates are compared instead of all pairs.
+    The exact Jaccard similarity of every candidate pair is then verified against `threshold`.
+
+    Args:
+        texts (list[str]): The texts to be compared.
+        threshold (float): The minimum Jaccard similarity of a near-duplicate pair. Defaults to 0.9.
+        num_perm (int): The number of permutations of the MinHash signatures. Defaults to 128.
+        bands (int): The number of LSH bands. Must be a divisor of `num_perm`. Defaults to 16.
+        shingle_size (int): The number of words in a shingle. Defaults to 5.
+        seed (int): The seed of the permutations. Defaults to 1.
+
+    Returns:
+        list[tuple[int, int, float]]: The sorted pairs of positions of the near-duplicate texts
+            and their Jaccard similarity, where the first position is less than the second.
+
+    Raises:
+        AssertionError: If `bands` is not a divisor of `num_perm`.
+    """
+    assert num_perm % bands == 0, "`bands` must be a divisor of `num_perm`"
+    rows = num_perm // bands
+
+    hashes = [shingle_hashes(text, shingle_size) for text in texts]
+    signatures = minhash_signatures(hashes, num_perm, seed)
+
+    candidates = set()
+    for band in range(bands):
+        buckets = defaultdict(list)
+        band_signatures = signatures[:, band * rows : (band + 1) * rows]
+        for i, band_signature in enumerate(band_signatures):
+            # Texts without shingles are never candidates
+            if len(hashes[i]) > 0:
+                buckets[band_signature.tobytes()].append(i)
+
+        for bucket in buckets.values():
+            candidates.update(combinations(bucket, 2))
+
+    pairs = []
+    for i, j in sorted(candidates):
+        similarity = jaccard_similarity(hashes[i], hashes[j])
+        if similarity >= threshold:
+            pairs.append((i, j, similarity))
+
+    return pairs
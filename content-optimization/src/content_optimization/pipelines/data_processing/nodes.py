@@ -3,29 +3,74 @@
 generated using Kedro 0.19.6
 """
 
+import logging
 import os
 import re
-from typing import Any, Callable
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import fields
+from itertools import islice
+from multiprocessing import get_context
+from typing import Any, Callable, Iterator, Optional
 
 import pandas as pd
-from content_optimization.pipelines.data_processing.extractor import HTMLExtractor
+import pyarrow as pa
+from content_optimization.pipelines.data_processing.cache import ExtractionCache
+from content_optimization.pipelines.data_processing.extractor import (
+    METRICS_COUNTS,
+    METRICS_STAGES,
+    ExtractionMetrics,
+    ExtractionResult,
+    HTMLExtractor,
+)
+from content_optimization.pipelines.data_processing.lsh import find_near_duplicates
+from content_optimization.pipelines.data_processing.overrides import (
+    REPORT_COLUMNS as OVERRIDES_REPORT_COLUMNS,
+)
+from content_optimization.pipelines.data_processing.overrides import Overrides
+from content_optimization.pipelines.data_processing.rules import REPORT_COLUMNS
+from content_optimization.pipelines.data_processing.streams import ReplayableTableStream
 from content_optimization.pipelines.data_processing.utils import (
-    add_content_body,
-    add_updated_urls,
+    compile_ia_mappings_table,
+    convert_string_columns,
     flag_articles_to_remove_after_extraction,
     flag_articles_to_remove_before_extraction,
     invert_ia_mappings,
     map_category_names,
     select_and_rename_columns,
+    strip_whitespace,
+    to_unified_table,
+    unify_schemas,
 )
 from tqdm import tqdm
 
+# Set up logger in nodes.py
+# Edit conf/logging.yml to see changes
+logger = logging.getLogger(__name__)
+
+# Columns of the `extraction_metrics` report, i.e. the totals of the `ExtractionMetrics`
+# of the extracted articles of every content category
+EXTRACTION_METRICS_COLUMNS = [
+    "content_category",
+    "articles",
+    *METRICS_COUNTS,
+    *[f"{stage}_s" for stage in METRICS_STAGES.values()],
+    "total_s",
+    "max_article_s",
+]
+
+# Engines of `standardize_columns`, `add_data` and `map_data`
+# NOTE: `polars` requires the `polars` package. See `polars_engine.py`
+ENGINES = ("pandas", "polars")
+
 
 def standardize_columns(
     all_contents: dict[str, Callable[[], Any]],
     columns_to_add_cfg: dict[str, list[str]],
     columns_to_keep_cfg: dict[str, list[str]],
     default_columns: list[str],
+    string_dtype: str = "object",
+    engine: str = "pandas",
 ) -> dict[str, pd.DataFrame]:
     """
     Standardizes the columns of multiple dataframes in a dictionary.
@@ -37,7 +82,7 @@ def standardize_columns(
     1. Get the content category from the filename.
     2. Load the dataframe using the provided partition function.
     3. Standardize the column names by selecting and renaming the columns.
-    4. Mark articles with no content or with dummy content in the `to_remove` column.
+    4. Convert the text columns to `string_dtype` and strip their whitespaces.
     5. Add the standardized dataframe to the `all_contents_standardized` dictionary.
 
     The function returns a dictionary mapping content categories to the standardized dataframes.
@@ -57,6 +102,14 @@ def standardize_columns(
         default_columns (list[str]):
             A list of default column names to rename the columns of the dataframes to.
 
+        string_dtype (str):
+            The dtype of the text columns, either "object" or "string[pyarrow]".
+            Defaults to "object". See `convert_string_columns`.
+
+        engine (str):
+            The engine that runs the steps, either "pandas" or "polars" to run them as
+            a Polars lazy query. Defaults to "pandas". See `polars_engine.py`.
+
     Returns:
         dict[str, pd.DataFrame]:
             A dictionary that contains the standardized dataframes stored as partitioned
@@ -69,269 +122,887 @@ def standardize_columns(
 
     for filename, partition_load_func in pbar:
         # Get content category from filename
-        content_category = re.sub(r"export-published-", "", filename.split("_")[0])
+        content_category = _get_content_category(filename)
         pbar.set_description(f"Standardizing: {content_category}")
 
         # Load partition data
         df = partition_load_func()
 
-        # Standardize column names
-        columns_to_add = columns_to_add_cfg.get(content_category, None)
-        columns_to_keep = columns_to_keep_cfg.get(content_category, None)
+        all_contents_standardized[content_category] = _standardize_partition(
+            df,
+            content_category,
+            columns_to_add_cfg,
+            columns_to_keep_cfg,
+            default_columns,
+            string_dtype,
+            engine,
+        )
+
+    _log_memory_usage("all_contents_standardized", all_contents_standardized)
+
+    return all_contents_standardized
+
+
+def _get_content_category(filename: str) -> str:
+    """
+    Gets the content category from the filename of a raw Excel export.
+
+    Args:
+        filename (str): The filename, e.g. "export-published-medications_2024".
+
+    Returns:
+        str: The content category, e.g. "medications".
+    """
+    return re.sub(r"export-published-", "", filename.split("_")[0])
+
+
+def _standardize_partition(
+    df: pd.DataFrame,
+    content_category: str,
+    columns_to_add_cfg: dict[str, list[str]],
+    columns_to_keep_cfg: dict[str, list[str]],
+    default_columns: list[str],
+    string_dtype: str,
+    engine: str = "pandas",
+) -> pd.DataFrame:
+    """
+    Standardizes the columns of a content category. See `standardize_columns`.
+
+    Args:
+        df (pd.DataFrame): The raw data of the content category.
+        content_category (str): The content category.
+        columns_to_add_cfg (dict[str, list[str]]): The column names to add of each content category.
+        columns_to_keep_cfg (dict[str, list[str]]): The column names to keep of each content category.
+        default_columns (list[str]): The default column names.
+        string_dtype (str): The dtype of the text columns.
+        engine (str): The engine that runs the steps.
+
+    Returns:
+        pd.DataFrame: The standardized data.
+
+    Raises:
+        AssertionError: If `engine` is not valid.
+    """
+    assert engine in ENGINES, "Invalid `engine`"
+
+    # Standardize column names
+    columns_to_add = columns_to_add_cfg.get(content_category, None)
+    columns_to_keep = columns_to_keep_cfg.get(content_category, None)
+
+    if engine == "polars":
+        # Imported here as `polars` is an optional dependency
+        from content_optimization.pipelines.data_processing import polars_engine
 
-        # Standardize columns
-        df = select_and_rename_columns(
-            df, columns_to_add, columns_to_keep, default_columns, content_category
+        return polars_engine.standardize_partition(
+            df,
+            columns_to_add,
+            columns_to_keep,
+            default_columns,
+            content_category,
+            string_dtype,
         )
 
-        # Strip all whitespaces across all strings in dataframe
-        # See: https://github.com/Wilsven/healthhub-content-optimization/issues/53
-        df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
+    # Standardize columns
+    df = select_and_rename_columns(
+        df, columns_to_add, columns_to_keep, default_columns, content_category
+    )
 
-        all_contents_standardized[content_category] = df
+    df = convert_string_columns(df, string_dtype)
 
-    return all_contents_standardized
+    # Strip all whitespaces across all strings in dataframe
+    # See: https://github.com/Wilsven/healthhub-content-optimization/issues/53
+    return strip_whitespace(df)
 
 
-def add_data(
-    all_contents_standardized: dict[str, Callable[[], Any]],
+def compile_overrides(
     missing_contents: dict[str, Callable[[], Any]],
     updated_urls: dict[str, dict[int, str]],
-) -> dict[str, Callable[[], Any]]:
+    whitelist: list[int],
+    blacklist: dict[int, str],
+) -> Overrides:
+    """
+    Compiles the curated overrides of the articles into keyed tables.
+
+    The missing contents are loaded and the overrides are compiled once per run, so that
+    `add_data` applies them to every content category as indexed joins.
+
+    Args:
+        missing_contents (dict[str, Callable[[], Any]]): A dictionary where keys are file paths and
+            values are functions that load the content of text files.
+        updated_urls (dict[str, dict[int, str]]): A dictionary where keys are content categories and
+            values are dictionaries mapping article IDs to updated URLs.
+        whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+        blacklist (dict[int, str]): The list of article IDs to remove. See https://bitly.cx/f8FIk.
+
+    Returns:
+        Overrides: The overrides with the `source` of each override. See `Overrides`.
+    """
+    overrides = Overrides.from_sources(
+        missing_contents, updated_urls, whitelist, blacklist
+    )
+    logger.info(
+        f"Compiled {len(overrides.contents)} missing contents, {len(overrides.urls)} updated URLs, "
+        f"{len(overrides.whitelist)} whitelisted and {len(overrides.blacklist)} blacklisted articles"
+    )
+
+    return overrides
+
+
+def add_data(
+    all_contents_standardized: dict[str, Callable[[], Any]],
+    overrides: Overrides,
+    string_dtype: str = "object",
+    engine: str = "pandas",
+) -> tuple[dict[str, Callable[[], Any]], pd.DataFrame]:
     """
     Process and add data to standardized content, incorporating missing contents and updated URLs.
 
     This function performs the following operations:
     1. Adds missing content from text files to correct Excel errors.
-    2. Adds content body to the dataframe for each content category.
-    3. Updates URLs in the dataframe.
-    4. Flags articles that should be removed before extraction.
+    2. Updates URLs in the dataframe.
+    3. Flags articles that should be removed before extraction.
 
     Args:
         all_contents_standardized (dict[str, Callable[[], Any]]): A dictionary where keys are content
             categories and values are functions that return dataframes of standardized content.
-        missing_contents (dict[str, Callable[[], Any]]): A dictionary where keys are file paths and
-            values are functions that load the content of text files.
-        updated_urls (dict[str, dict[int, str]]): A dictionary where keys are content categories and
-            values are dictionaries mapping index to updated URLs.
+        overrides (Overrides): The curated overrides of the articles. See `compile_overrides`.
+        string_dtype (str): The dtype of the text columns, either "object" or "string[pyarrow]".
+            Defaults to "object". See `convert_string_columns`.
+        engine (str): The engine that runs the operations, either "pandas" or "polars" to run
+            them as a Polars lazy query. Defaults to "pandas". See `polars_engine.py`.
 
     Returns:
-        dict[str, Callable[[], Any]]: A dictionary where keys are content categories and values are
-        functions that return processed dataframes with added data.
-
+        tuple[dict[str, Callable[[], Any]], pd.DataFrame]: A dictionary where keys are content
+            categories and values are functions that return processed dataframes with added data,
+            and a report of every override that matched an article with its `source`.
     """
-    excel_errors = {}
     all_contents_added = {}
-
-    # Fetch all txt files from 01_raw to correct the Excel error
-    for file_path, load_func in missing_contents.items():
-        text = load_func()
-        # Extract friendly url that is used as filename
-        friendly_url = file_path.split("/")[-1]
-        # Store in dictionary
-        excel_errors[friendly_url] = text
+    overrides_reports = []
 
     pbar = tqdm(all_contents_standardized.items())
 
     for content_category, partition_load_func in pbar:
         pbar.set_description(f"Adding: {content_category}")
-        df = partition_load_func()
+        df, overrides_report = _add_partition(
+            partition_load_func(), content_category, overrides, string_dtype, engine
+        )
+        overrides_reports.append(overrides_report)
 
-        # Add back contents that are previously indicated as excel errors into the `content_body` column
-        df = add_content_body(df, excel_errors)
+        all_contents_added[content_category] = df
 
-        # Add updated urls into the `full_url` column
-        urls_dict = updated_urls.get(content_category, {})
-        df = add_updated_urls(df, urls_dict)
+    _log_memory_usage("all_contents_added", all_contents_added)
 
-        # Mark articles with no content, was rejected by Excel due to a "Value
-        # exceeded maximum cell size" error or with dummy content in `to_remove` column
-        df = flag_articles_to_remove_before_extraction(df)
+    applied_overrides = pd.DataFrame(columns=OVERRIDES_REPORT_COLUMNS)
+    if overrides_reports:
+        applied_overrides = pd.concat(overrides_reports, ignore_index=True)
 
-        all_contents_added[content_category] = df
+    return all_contents_added, applied_overrides
 
-    return all_contents_added
+
+def _add_partition(
+    df: pd.DataFrame,
+    content_category: str,
+    overrides: Overrides,
+    string_dtype: str,
+    engine: str = "pandas",
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Adds the overrides to a content category and flags articles to remove before extraction.
+    See `add_data`.
+
+    Args:
+        df (pd.DataFrame): The standardized data of the content category.
+        content_category (str): The content category.
+        overrides (Overrides): The curated overrides of the articles.
+        string_dtype (str): The dtype of the text columns.
+        engine (str): The engine that runs the operations.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The data with added data, and the report of the
+            overrides that matched an article.
+
+    Raises:
+        AssertionError: If `engine` is not valid.
+    """
+    assert engine in ENGINES, "Invalid `engine`"
+
+    if engine == "polars":
+        # Imported here as `polars` is an optional dependency
+        from content_optimization.pipelines.data_processing import polars_engine
+
+        return polars_engine.add_partition(
+            df, content_category, overrides, string_dtype
+        )
+
+    df = convert_string_columns(df, string_dtype)
+
+    # Add back contents that are previously indicated as excel errors into the `content_body`
+    # column and updated urls into the `full_url` column
+    df, overrides_report = overrides.apply(df, content_category)
+
+    # Mark articles with no content, was rejected by Excel due to a "Value
+    # exceeded maximum cell size" error or with dummy content in `to_remove` column
+    df = flag_articles_to_remove_before_extraction(df)
+
+    return df, overrides_report
 
 
 def extract_data(
     all_contents_added: dict[str, Callable[[], Any]],
     word_count_cutoff: int,
-    whitelist: list[int],
-    blacklist: dict[int, str],
-) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
+    overrides: Overrides,
+    extraction_cfg: Optional[dict[str, Any]] = None,
+    extraction_cache: Optional[pd.DataFrame] = None,
+    string_dtype: str = "object",
+) -> tuple[
+    dict[str, pd.DataFrame],
+    dict[int, tuple[str, str]],
+    pd.DataFrame,
+    pd.DataFrame,
+    pd.DataFrame,
+]:
     """
     Extracts data from processed content and stores it in parquet files
-    and text files.
+    and a packed text file.
+
+    Articles whose HTML content is found in the extraction cache reuse the cached
+    extracted data and are not parsed again. Only cache misses are sent to the `HTMLExtractor`.
 
     Args:
         all_contents_added (dict[str, Callable[[], Any]]):
             A dictionary containing the standardized `partitions.PartitionedDataset` where the keys are the content
             categories and the values loads the standardized parquet data as `pandas.DataFrame`.
         word_count_cutoff (int): The minimum number of words in an article to be considered before flagging for removal.
-        whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
-        blacklist (dict[int, str]): The list of article IDs to remove. See https://bitly.cx/f8FIk.
+        overrides (Overrides): The curated overrides of the articles. The articles in its `whitelist` are kept,
+            and the articles in its `blacklist` are flagged for removal. See `compile_overrides`.
+        extraction_cfg (Optional[dict[str, Any]]): The `extraction` configuration in `parameters_data_processing.yml`.
+            The HTML content is parsed with the `parser` backend. If `parallel` is True, articles are sent in
+            chunks of `chunk_size` to a pool of `workers` processes. Defaults to None, which extracts the articles
+            serially with `html.parser`. The `cache` options enable the extraction cache and set its eviction limits.
+            If `metrics` is True, the `ExtractionMetrics` of every extracted article are collected.
+        extraction_cache (Optional[pd.DataFrame]): The extraction cache entries from the previous run. See
+            `ExtractionCache`. Defaults to None, which starts with an empty cache.
+        string_dtype (str): The dtype of the text columns, either "object" or "string[pyarrow]".
+            Defaults to "object". See `convert_string_columns`.
 
     Returns:
-        tuple[dict[str, pd.DataFrame], dict[str, str]]: A tuple containing two dictionaries. The first dictionary
-            contains the extracted data stored as partitioned parquet files, where the keys are the content categories
-            and the values are the corresponding dataframes.
-            The second dictionary contains the extracted text stored as partitioned text files, where the keys are the
-            file paths and the values are the extracted text.
+        tuple[dict[str, pd.DataFrame], dict[int, tuple[str, str]], pd.DataFrame, pd.DataFrame, pd.DataFrame]: A
+            tuple containing two dictionaries, the updated extraction cache, the report of the rules that flag
+            articles to remove after extraction and the report of the extraction metrics. The first dictionary contains the extracted data stored as partitioned parquet
+            files, where the keys are the content categories and the values are the corresponding dataframes.
+            The second dictionary contains the extracted text stored as a packed text file, where the keys are the
+            article IDs and the values are the file path of the text when exported and the extracted text.
+            The report contains the number of articles matched and flagged by each rule and its duration for
+            every content category. See `apply_rules`. The extraction metrics are totalled for every content
+            category with the `EXTRACTION_METRICS_COLUMNS`, and are empty unless `metrics` is enabled. Articles
+            found in the extraction cache are not extracted, so they are not counted.
     """
+    extraction_cfg = extraction_cfg or {}
+    parallel = extraction_cfg.get("parallel", False)
+    whitelist = overrides.whitelist.index
+    blacklist = overrides.blacklist["remove_type"]
+    cache_cfg = extraction_cfg.get("cache", {})
+    cache = (
+        ExtractionCache(extraction_cache) if cache_cfg.get("enabled", True) else None
+    )
+
     all_contents_extracted = {}  # to store as partitioned parquet files
-    all_extracted_text = {}  # to store as partitioned text files
+    all_extracted_text = {}  # to store as a packed text file
+    rules_reports = []
+    metrics_reports = []
+
+    # The process pool is shared across all content categories
+    executor_context = (
+        ProcessPoolExecutor(max_workers=extraction_cfg.get("workers"))
+        if parallel
+        else nullcontext()
+    )
+
+    with executor_context as executor:
+        pbar = tqdm(all_contents_added.items())
+
+        for content_category, partition_load_func in pbar:
+            pbar.set_description(f"Extracting: {content_category}")
+            # Load partition data
+            df, extracted_text, rules_report, metrics_report = (
+                _extract_and_flag_partition(
+                    partition_load_func(),
+                    content_category,
+                    word_count_cutoff,
+                    whitelist,
+                    blacklist,
+                    extraction_cfg,
+                    executor,
+                    cache,
+                    string_dtype,
+                )
+            )
+            all_extracted_text.update(extracted_text)
+            rules_reports.append(rules_report)
+            if metrics_report is not None:
+                metrics_reports.append(metrics_report)
+
+            # Store dataframes in a parquet file named `content_category`
+            all_contents_extracted[content_category] = df
+
+    _log_memory_usage("all_contents_extracted", all_contents_extracted)
+
+    rules_report = pd.DataFrame(columns=["content_category", *REPORT_COLUMNS])
+    if rules_reports:
+        rules_report = pd.concat(rules_reports, ignore_index=True)
+
+    metrics_report = pd.DataFrame(columns=EXTRACTION_METRICS_COLUMNS)
+    if metrics_reports:
+        metrics_report = pd.concat(metrics_reports, ignore_index=True)
+
+    if cache is None:
+        # Keep the previous cache untouched when the cache is disabled
+        return (
+            all_contents_extracted,
+            all_extracted_text,
+            extraction_cache,
+            rules_report,
+            metrics_report,
+        )
 
-    pbar = tqdm(all_contents_added.items())
+    cache.log_stats()
+    extraction_cache = cache.to_frame(
+        max_entries=cache_cfg.get("max_entries"),
+        max_size_mb=cache_cfg.get("max_size_mb"),
+    )
 
-    for content_category, partition_load_func in pbar:
-        pbar.set_description(f"Extracting: {content_category}")
-        # Load partition data
-        df = partition_load_func()
+    return (
+        all_contents_extracted,
+        all_extracted_text,
+        extraction_cache,
+        rules_report,
+        metrics_report,
+    )
 
-        # Initialise new columns in dataframe to store extracted data
-        df["has_table"] = False
-        df["has_image"] = False
-        df["related_sections"] = None
-        df["extracted_tables"] = None
-        df["extracted_raw_html_tables"] = None
-        df["extracted_links"] = None
-        df["extracted_headers"] = None
-        df["extracted_images"] = None
-        df["extracted_content_body"] = None
-
-        for index, row in df.iterrows():
-            # Skip extraction for those articles flagged for removal unless whitelisted
-            if row["to_remove"]:
-                # Check if the article is in the whitelist
-                if row["id"] not in whitelist:
-                    continue
-                else:
-                    # Whitelist article
-                    df.at[index, "to_remove"] = False
-
-            # Replace all forward slashes with hyphens to avoid saving as folders
-            title = re.sub(r"\/", "-", row["title"]).strip()
-
-            # Get the HTML content for extraction and relevant data for logging
-            content_name = row["content_name"]
-            full_url = row["full_url"]
-            html_content = row["content_body"]
-
-            # Extract text from HTML using the HTMLExtractor Class
-            extractor = HTMLExtractor(
-                content_name, content_category, full_url, html_content
-            )
-            has_table = extractor.check_for_table()
-            has_image = extractor.check_for_image()
-            related_sections = extractor.extract_related_sections()
-            extracted_tables = extractor.extract_tables()
-            extracted_raw_html_tables = extractor.extract_raw_html_tables()
-            extracted_links = extractor.extract_links()
-            extracted_headers = extractor.extract_headers()
-            extracted_img_alt_text = extractor.extract_img_links_and_alt_text()
-            extracted_content_body = extractor.extract_text()
-
-            # Store extracted data into the dataframe
-            df.at[index, "has_table"] = has_table
-            df.at[index, "has_image"] = has_image
-            df.at[index, "related_sections"] = related_sections
-            df.at[index, "extracted_tables"] = extracted_tables
-            df.at[index, "extracted_raw_html_tables"] = extracted_raw_html_tables
-            df.at[index, "extracted_links"] = extracted_links
-            df.at[index, "extracted_headers"] = extracted_headers
-            df.at[index, "extracted_images"] = extracted_img_alt_text
-            df.at[index, "extracted_content_body"] = extracted_content_body
-
-            # Substitute forbidden characters for filenames with _
-            title = re.sub(r'[<>:"/\\|?*]', "_", title)
-
-            # Truncate title to 25 characters and append the id
-            # See: https://github.com/Wilsven/healthhub-content-optimization/issues/42
-            title = title[:25] + f"_{row['id']}"
-
-            # Store text files in its own folder named `content_category`
-            all_extracted_text[os.path.join(content_category, title)] = (
-                extracted_content_body
+
+def _extract_and_flag_partition(
+    df: pd.DataFrame,
+    content_category: str,
+    word_count_cutoff: int,
+    whitelist: pd.Index,
+    blacklist: pd.Series,
+    extraction_cfg: dict[str, Any],
+    executor: Optional[Executor],
+    cache: Optional[ExtractionCache],
+    string_dtype: str,
+) -> tuple[
+    pd.DataFrame, dict[int, tuple[str, str]], pd.DataFrame, Optional[pd.DataFrame]
+]:
+    """
+    Extracts the data of a content category and flags articles to remove after extraction.
+    See `extract_data`.
+
+    Args:
+        df (pd.DataFrame): The added data of the content category.
+        content_category (str): The content category.
+        word_count_cutoff (int): The word count threshold for flagging articles.
+        whitelist (pd.Index): The article IDs to keep, i.e. the index of `Overrides.whitelist`.
+        blacklist (pd.Series): The `remove_type` of the article IDs to remove, i.e. the
+            `remove_type` column of `Overrides.blacklist`.
+        extraction_cfg (dict[str, Any]): The `extraction` configuration.
+        executor (Optional[Executor]): The executor to extract the articles with, or None.
+        cache (Optional[ExtractionCache]): The extraction cache, or None.
+        string_dtype (str): The dtype of the text columns.
+
+    Returns:
+        tuple[pd.DataFrame, dict[int, tuple[str, str]], pd.DataFrame, Optional[pd.DataFrame]]: The extracted
+            data, the extracted text keyed by article ID, the report of the rules with the `content_category`
+            column, and the report of the extraction metrics, or None if the metrics are disabled.
+    """
+    df = convert_string_columns(df, string_dtype)
+    metrics = [] if extraction_cfg.get("metrics", False) else None
+
+    df, extracted_text = extract_partition(
+        df,
+        content_category,
+        whitelist,
+        parser=extraction_cfg.get("parser", "html.parser"),
+        executor=executor,
+        chunk_size=extraction_cfg.get("chunk_size", 1),
+        cache=cache,
+        metrics=metrics,
+    )
+
+    # After extraction, we flag to remove articles with no content,
+    # duplicated content, duplicated URL or below word count cutoff
+    df, rules_report = flag_articles_to_remove_after_extraction(
+        df, word_count_cutoff, whitelist, blacklist
+    )
+    rules_report = rules_report.assign(content_category=content_category)[
+        ["content_category", *REPORT_COLUMNS]
+    ]
+
+    metrics_report = None
+    if metrics is not None:
+        metrics_report = _summarize_extraction_metrics(metrics, content_category)
+
+    # Convert the new text columns, e.g. `extracted_content_body`
+    return (
+        convert_string_columns(df, string_dtype),
+        extracted_text,
+        rules_report,
+        metrics_report,
+    )
+
+
+def _summarize_extraction_metrics(
+    metrics: list[ExtractionMetrics], content_category: str
+) -> pd.DataFrame:
+    """
+    Totals the extraction metrics of the articles of a content category.
+
+    Args:
+        metrics (list[ExtractionMetrics]): The metrics of every extracted article.
+        content_category (str): The content category.
+
+    Returns:
+        pd.DataFrame: A single row with the `EXTRACTION_METRICS_COLUMNS`.
+    """
+    row = {"content_category": content_category, "articles": len(metrics)}
+    for count in METRICS_COUNTS:
+        row[count] = sum(getattr(article, count) for article in metrics)
+
+    article_durations = [0.0] * len(metrics)
+    for stage in METRICS_STAGES.values():
+        durations = [article.durations.get(stage, 0.0) for article in metrics]
+        row[f"{stage}_s"] = sum(durations)
+        article_durations = [a + b for a, b in zip(article_durations, durations)]
+    row["total_s"] = sum(article_durations)
+    row["max_article_s"] = max(article_durations, default=0.0)
+
+    return pd.DataFrame([row], columns=EXTRACTION_METRICS_COLUMNS)
+
+
+def extract_partition(
+    df: pd.DataFrame,
+    content_category: str,
+    whitelist: list[int],
+    parser: str = "html.parser",
+    executor: Optional[Executor] = None,
+    chunk_size: int = 1,
+    cache: Optional[ExtractionCache] = None,
+    metrics: Optional[list[ExtractionMetrics]] = None,
+) -> tuple[pd.DataFrame, dict[int, tuple[str, str]]]:
+    """
+    Extracts data from the HTML content body of every article in a single content category.
+
+    The articles are extracted serially unless an `executor` is provided, in which case the
+    articles are sent to the executor in chunks of `chunk_size`. Results are collected in the
+    original order of the articles, so both modes produce the same output. If a `cache` is
+    provided, only the articles not found in the cache are extracted and the cache is updated
+    with their extracted data. If a `metrics` list is provided, the `ExtractionMetrics` of every
+    extracted article are appended to it.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing the articles of the content category.
+        content_category (str): The content category of the articles.
+        whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+        parser (str): The parser backend used by the `HTMLExtractor`. Defaults to "html.parser".
+        executor (Optional[Executor]): The executor to extract the articles with. Defaults to None.
+        chunk_size (int): The number of articles sent to a worker at a time. Defaults to 1.
+        cache (Optional[ExtractionCache]): The extraction cache. Defaults to None.
+        metrics (Optional[list[ExtractionMetrics]]): The list to collect the metrics of the extracted
+            articles in. Defaults to None, which does not collect them.
+
+    Returns:
+        tuple[pd.DataFrame, dict[int, tuple[str, str]]]: The DataFrame with the extracted data and
+            a dictionary mapping the article IDs to the file path of the extracted text when
+            exported and the extracted text.
+    """
+    extracted_text = {}
+
+    # Initialise new columns in dataframe to store extracted data
+    df["has_table"] = False
+    df["has_image"] = False
+    df["related_sections"] = None
+    df["extracted_tables"] = None
+    df["extracted_raw_html_tables"] = None
+    df["extracted_links"] = None
+    df["extracted_headers"] = None
+    df["extracted_images"] = None
+    df["extracted_content_body"] = None
+    df["sections"] = None
+
+    # Look up the whitelisted IDs in constant time
+    whitelist = set(whitelist)
+
+    indexes = []
+    articles = []
+    for index, row in df.iterrows():
+        # Skip extraction for those articles flagged for removal unless whitelisted
+        if row["to_remove"]:
+            # Check if the article is in the whitelist
+            if row["id"] not in whitelist:
+                continue
+            else:
+                # Whitelist article
+                df.at[index, "to_remove"] = False
+
+        # Get the HTML content for extraction and relevant data for logging
+        indexes.append(index)
+        articles.append(
+            (
+                row["content_name"],
+                content_category,
+                row["full_url"],
+                row["content_body"],
+                parser,
             )
+        )
 
-        # After extraction, we flag to remove articles with no content,
-        # duplicated content, duplicated URL or below word count cutoff
-        df = flag_articles_to_remove_after_extraction(
-            df, word_count_cutoff, whitelist, blacklist
+    results = [None] * len(articles)
+    keys = [None] * len(articles)
+    if cache is not None:
+        for i, article in enumerate(articles):
+            # Articles without HTML content are not cached
+            if isinstance(article[3], str):
+                keys[i] = cache.make_key(article[3], parser)
+                results[i] = cache.get(keys[i])
+
+    # Only extract the articles not found in the cache
+    misses = [i for i, result in enumerate(results) if result is None]
+    to_extract = [articles[i] for i in misses]
+    extract_func = (
+        _extract_article if metrics is None else _extract_article_with_metrics
+    )
+    if executor is None:
+        extracted = map(extract_func, to_extract)
+    else:
+        extracted = executor.map(extract_func, to_extract, chunksize=chunk_size)
+
+    for i, output in zip(misses, extracted):
+        result = output
+        if metrics is not None:
+            result, article_metrics = output
+            metrics.append(article_metrics)
+        results[i] = result
+        if cache is not None and keys[i] is not None:
+            cache.put(keys[i], result)
+
+    for index, result in zip(indexes, results):
+        # Store extracted data into the dataframe
+        for field in fields(result):
+            df.at[index, field.name] = getattr(result, field.name)
+
+        # Replace all forward slashes with hyphens to avoid saving as folders
+        title = re.sub(r"\/", "-", df.at[index, "title"]).strip()
+
+        # Substitute forbidden characters for filenames with _
+        title = re.sub(r'[<>:"/\\|?*]', "_", title)
+
+        # Truncate title to 25 characters and append the id
+        # See: https://github.com/Wilsven/healthhub-content-optimization/issues/42
+        title = title[:25] + f"_{df.at[index, 'id']}"
+
+        # Key the text by the id, and export it in its own folder named `content_category`
+        extracted_text[int(df.at[index, "id"])] = (
+            os.path.join(content_category, title),
+            result.extracted_content_body,
         )
 
-        # Store dataframes in a parquet file named `content_category`
-        all_contents_extracted[content_category] = df
+    return df, extracted_text
 
-    return all_contents_extracted, all_extracted_text
 
+def _extract_article(article: tuple[str, str, str, str, str]) -> ExtractionResult:
+    """
+    Extracts all data from the HTML content body of a single article.
 
-def map_data(
+    This is a module-level function so that it can be pickled and sent to worker processes.
+
+    Args:
+        article (tuple[str, str, str, str, str]): The content name, content category, full URL
+            and HTML content of the article and the parser backend.
+
+    Returns:
+        ExtractionResult: All the data extracted from the HTML content body of the article.
+    """
+    content_name, content_category, full_url, html_content, parser = article
+
+    # Extract text from HTML using the HTMLExtractor Class
+    extractor = HTMLExtractor(
+        content_name, content_category, full_url, html_content, parser
+    )
+
+    return extractor.extract_all()
+
+
+def _extract_article_with_metrics(
+    article: tuple[str, str, str, str, str],
+) -> tuple[ExtractionResult, ExtractionMetrics]:
+    """
+    Extracts all data from the HTML content body of a single article and collects its metrics.
+    See `_extract_article`.
+
+    Args:
+        article (tuple[str, str, str, str, str]): The content name, content category, full URL
+            and HTML content of the article and the parser backend.
+
+    Returns:
+        tuple[ExtractionResult, ExtractionMetrics]: All the data extracted from the HTML content
+            body of the article and the metrics of its extraction.
+    """
+    content_name, content_category, full_url, html_content, parser = article
+
+    extractor = HTMLExtractor(
+        content_name,
+        content_category,
+        full_url,
+        html_content,
+        parser,
+        collect_metrics=True,
+    )
+
+    return extractor.extract_all(), extractor.metrics
+
+
+def _log_memory_usage(dataset_name: str, partitions: dict[str, pd.DataFrame]) -> None:
+    """
+    Logs the total memory usage of the partitions of a dataset returned by a node.
+
+    Args:
+        dataset_name (str): The name of the dataset.
+        partitions (dict[str, pd.DataFrame]): The partitions of the dataset.
+    """
+    memory_usage = sum(df.memory_usage(deep=True).sum() for df in partitions.values())
+    logger.info(f"Memory usage of `{dataset_name}`: {memory_usage / 2**20:,.1f} MiB")
+
+
+def deduplicate_data(
     all_contents_extracted: dict[str, Callable[[], Any]],
-    l1_mappings: dict[str, dict[str, list[str]]],
-    l2_mappings: dict[str, dict[str, list[str]]],
-) -> dict[str, Callable[[], Any]]:
+    whitelist: list[int],
+    near_duplicates_cfg: dict[str, Any],
+    string_dtype: str = "object",
+) -> tuple[dict[str, pd.DataFrame], pd.DataFrame]:
     """
-    Map extracted content data to L1 and L2 Information Architecture (IA) categories.
+    Flags near-duplicate articles across all content categories for removal.
 
-    This function processes the extracted content data, applying L1 and L2 IA mappings for each content category.
-    It inverts the provided mappings, iterates through each content category, and applies the mappings
-    to the 'article_category_names' column in the dataframe.
+    Articles that are not flagged for removal are compared by the Jaccard similarity
+    of the word shingles of their extracted content body, using MinHash and LSH to find
+    the candidate pairs. For every near-duplicate pair, the article that comes later (in the
+    order of the content categories and articles) is flagged with the "Near Duplicate"
+    `remove_type`, unless it is whitelisted or its near duplicate was itself flagged.
 
     Args:
         all_contents_extracted (dict[str, Callable[[], Any]]): A dictionary where keys are
             content categories and values are functions that return dataframes of extracted content.
+        whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+        near_duplicates_cfg (dict[str, Any]): The `near_duplicates` configuration in
+            `parameters_data_processing.yml`. See `find_near_duplicates` for the options.
+        string_dtype (str): The dtype of the text columns, either "object" or "string[pyarrow]".
+            Defaults to "object". See `convert_string_columns`.
+
+    Returns:
+        tuple[dict[str, pd.DataFrame], pd.DataFrame]: A dictionary where keys are content categories
+            and values are the dataframes with the near duplicates flagged, and a report of all
+            near-duplicate pairs with their Jaccard similarity.
+    """
+    whitelist = set(whitelist)  # look up the whitelisted IDs in constant time
+    all_contents_deduplicated = {}
+    articles = []  # (content category, index) of the articles to compare
+    texts = []
+
+    pbar = tqdm(all_contents_extracted.items())
+
+    for content_category, partition_load_func in pbar:
+        pbar.set_description(f"Shingling: {content_category}")
+        # Load partition data
+        df = convert_string_columns(partition_load_func(), string_dtype)
+        all_contents_deduplicated[content_category] = df
+
+        # Ignore articles that were already flagged or without extracted content
+        df_keep = df[~df["to_remove"] & df["extracted_content_body"].notna()]
+        for index, text in df_keep["extracted_content_body"].items():
+            articles.append((content_category, index))
+            texts.append(text)
+
+    pairs = find_near_duplicates(texts, **near_duplicates_cfg)
+
+    report = []
+    flagged = set()
+    # Pairs are sorted, so the earlier article of a pair is always processed first
+    for i, j, similarity in pairs:
+        (category_i, index_i), (category_j, index_j) = articles[i], articles[j]
+        df_i = all_contents_deduplicated[category_i]
+        df_j = all_contents_deduplicated[category_j]
+
+        # Flag the later article only if the earlier article is kept
+        if i not in flagged and df_j.at[index_j, "id"] not in whitelist:
+            flagged.add(j)
+            df_j.at[index_j, "to_remove"] = True
+            df_j.at[index_j, "remove_type"] = "Near Duplicate"
+
+        report.append(
+            {
+                "id": df_i.at[index_i, "id"],
+                "title": df_i.at[index_i, "title"],
+                "content_category": category_i,
+                "near_duplicate_id": df_j.at[index_j, "id"],
+                "near_duplicate_title": df_j.at[index_j, "title"],
+                "near_duplicate_content_category": category_j,
+                "jaccard_similarity": round(similarity, 4),
+                "flagged": j in flagged,
+            }
+        )
+
+    logger.info(
+        f"Found {len(pairs)} near-duplicate pairs; flagged {len(flagged)} articles"
+    )
+    _log_memory_usage("all_contents_deduplicated", all_contents_deduplicated)
+
+    near_duplicate_pairs = pd.DataFrame(
+        report,
+        columns=[
+            "id",
+            "title",
+            "content_category",
+            "near_duplicate_id",
+            "near_duplicate_title",
+            "near_duplicate_content_category",
+            "jaccard_similarity",
+            "flagged",
+        ],
+    )
+
+    return all_contents_deduplicated, near_duplicate_pairs
+
+
+def compile_ia_mappings(
+    l1_mappings: dict[str, dict[str, list[str]]],
+    l2_mappings: dict[str, dict[str, list[str]]],
+) -> pd.DataFrame:
+    """
+    Compiles the L1 and L2 Information Architecture (IA) mappings into a single lookup table.
+
+    The mappings are inverted and compiled once per run, so that `map_data` can map
+    every content category with the same table.
+
+    Args:
         l1_mappings (dict[str, dict[str, list[str]]]): A dictionary of L1 category mappings.
             The outer key is the content category, inner key is the target (new) category,
             and the value is a list of source (old) categories.
         l2_mappings (dict[str, dict[str, list[str]]]): A dictionary of L2 category mappings,
             structured similarly to l1_mappings.
 
+    Returns:
+        pd.DataFrame: The IA mappings table indexed by content category and article category
+            name, with the `l1_mappings` and `l2_mappings` columns.
+
+    Note:
+        - This function uses the `invert_ia_mappings` and `compile_ia_mappings_table` helper functions.
+    """
+    return compile_ia_mappings_table(
+        {
+            "l1_mappings": invert_ia_mappings(l1_mappings),
+            "l2_mappings": invert_ia_mappings(l2_mappings),
+        }
+    )
+
+
+def map_data(
+    all_contents_extracted: dict[str, Callable[[], Any]],
+    ia_mappings: pd.DataFrame,
+    string_dtype: str = "object",
+    engine: str = "pandas",
+) -> dict[str, Callable[[], Any]]:
+    """
+    Map extracted content data to L1 and L2 Information Architecture (IA) categories.
+
+    This function processes the extracted content data, applying the compiled L1 and L2 IA mappings
+    for each content category to the 'article_category_names' column in the dataframe in a single pass.
+
+    Args:
+        all_contents_extracted (dict[str, Callable[[], Any]]): A dictionary where keys are
+            content categories and values are functions that return dataframes of extracted content.
+        ia_mappings (pd.DataFrame): The IA mappings table. See `compile_ia_mappings`.
+        string_dtype (str): The dtype of the text columns, either "object" or "string[pyarrow]".
+            Defaults to "object". See `convert_string_columns`.
+        engine (str): The engine that maps the categories, either "pandas" or "polars" to map
+            them with a Polars lazy query. Defaults to "pandas". See `polars_engine.py`.
+
     Returns:
         dict[str, Callable[[], Any]]: A dictionary where keys are content categories and values
         are functions that return dataframes with mapped L1 and L2 categories. The returned
         dataframes include new columns for the mapped categories.
 
     Note:
-        - This function uses the `invert_ia_mappings` and `map_category_names` helper functions.
+        - This function uses the `map_category_names` helper function.
     """
     all_contents_mapped = {}
-    inverted_l1_mappings = invert_ia_mappings(l1_mappings)
-    inverted_l2_mappings = invert_ia_mappings(l2_mappings)
 
     pbar = tqdm(all_contents_extracted.items())
 
     for content_category, partition_load_func in pbar:
         pbar.set_description(f"Mapping: {content_category}")
         # Load partition data
-        df = partition_load_func()
-
-        # Map the values from the `article_category_names` column to the new L1 IA mapping
-        mapped_l1_df = map_category_names(
-            inverted_l1_mappings,
-            df,
-            "content_category",
-            "article_category_names",
-            "l1_mappings",
+        all_contents_mapped[content_category] = _map_partition(
+            partition_load_func(), ia_mappings, string_dtype, engine
         )
 
-        # Map the values from the `article_category_names` column to the new L2 IA mapping
-        mapped_df = map_category_names(
-            inverted_l2_mappings,
-            mapped_l1_df,
-            "content_category",
-            "article_category_names",
-            "l2_mappings",
-        )
-
-        all_contents_mapped[content_category] = mapped_df
+    _log_memory_usage("all_contents_mapped", all_contents_mapped)
 
     return all_contents_mapped
 
 
-def merge_data(all_contents_mapped: dict[str, Callable[[], Any]]) -> pd.DataFrame:
+def _map_partition(
+    df: pd.DataFrame,
+    ia_mappings: pd.DataFrame,
+    string_dtype: str,
+    engine: str = "pandas",
+) -> pd.DataFrame:
+    """
+    Maps the article category names of a content category to the IA mappings. See `map_data`.
+
+    Args:
+        df (pd.DataFrame): The data of the content category.
+        ia_mappings (pd.DataFrame): The IA mappings table.
+        string_dtype (str): The dtype of the text columns.
+        engine (str): The engine that maps the categories.
+
+    Returns:
+        pd.DataFrame: The data with the mapped L1 and L2 categories.
+
+    Raises:
+        AssertionError: If `engine` is not valid.
     """
-    Merge the data from multiple partitioned dataframes into a single `pandas.DataFrame`.
+    assert engine in ENGINES, "Invalid `engine`"
+
+    map_category_names_func = map_category_names
+    if engine == "polars":
+        # Imported here as `polars` is an optional dependency
+        from content_optimization.pipelines.data_processing import polars_engine
+
+        map_category_names_func = polars_engine.map_category_names
+
+    df = convert_string_columns(df, string_dtype)
+
+    # Map the values from the `article_category_names` column to the new L1 and L2 IA mappings
+    mapped_df = map_category_names_func(
+        ia_mappings,
+        df,
+        "content_category",
+        "article_category_names",
+    )
+
+    # Convert the new IA mapping columns
+    return convert_string_columns(mapped_df, string_dtype)
+
+
+def merge_data(
+    all_contents_mapped: dict[str, Callable[[], Any]],
+) -> tuple[Callable[[], Iterator[pa.Table]], Callable[[], Iterator[pa.Table]]]:
+    """
+    Merge the data from multiple partitioned dataframes into a single Parquet file
+    and a Hive-partitioned Parquet dataset.
+
+    The schemas of the partitions are unified up front from their Parquet metadata, then the
+    partitions are loaded and streamed one at a time into the output saved first, and replayed
+    into the other output without loading them again. See `ReplayableTableStream`. Only a
+    single partition is held in memory.
 
     Parameters:
         all_contents_mapped (dict[str, Callable[[], Any]]):
@@ -339,12 +1010,262 @@ def merge_data(all_contents_mapped: dict[str, Callable[[], Any]]) -> pd.DataFram
             where the values load the parquet data as `pandas.DataFrame`.
 
     Returns:
-        pd.DataFrame: The merged dataframe.
+        tuple[Callable[[], Iterator[pa.Table]], Callable[[], Iterator[pa.Table]]]: Callables that
+            return the stream of partitions as Arrow tables with the unified schema, to be saved
+            by `StreamingParquetDataset` and `HivePartitionedDataset` respectively.
     """
-    merged_df = pd.DataFrame()
-    for _, partition_load_func in all_contents_mapped.items():
-        # Load partition data
-        df = partition_load_func()
-        merged_df = pd.concat([merged_df, df], axis=0, ignore_index=True)
+    schemas = []
+
+    pbar = tqdm(all_contents_mapped.items())
+
+    for content_category, partition_load_func in pbar:
+        pbar.set_description(f"Unifying schema: {content_category}")
+        schemas.append(_load_schema(partition_load_func))
+
+    schema = unify_schemas(schemas)
+
+    # Load partition data
+    stream_partitions = ReplayableTableStream(
+        to_unified_table(partition_load_func(), schema)
+        for partition_load_func in all_contents_mapped.values()
+    )
+
+    return stream_partitions, stream_partitions
+
+
+def _load_schema(partition_load_func: Callable[[], Any]) -> pa.Schema:
+    """
+    Loads the Arrow schema of a partition. The schema of a partition of a dataset with a
+    `load_schema` method, e.g. `TypedParquetDataset`, is read from its Parquet metadata, and
+    other partitions are loaded to infer their schema.
+
+    Args:
+        partition_load_func (Callable[[], Any]): The function that loads the partition, i.e.
+            the `load` method of its dataset in a `partitions.PartitionedDataset`.
+
+    Returns:
+        pa.Schema: The schema of the partition.
+    """
+    dataset = getattr(partition_load_func, "__self__", None)
+    if hasattr(dataset, "load_schema"):
+        return dataset.load_schema()
+
+    return pa.Schema.from_pandas(partition_load_func(), preserve_index=False)
+
+
+# State of a worker process of `process_partitions`, i.e. its extraction cache
+# NOTE: Every worker process builds its own cache once in `_init_partition_worker`,
+# instead of receiving the whole cache with every content category
+_worker_state: dict[str, Any] = {}
+
 
-    return merged_df
+def process_partitions(
+    all_contents: dict[str, Callable[[], Any]],
+    columns_to_add_cfg: dict[str, list[str]],
+    columns_to_keep_cfg: dict[str, list[str]],
+    default_columns: list[str],
+    overrides: Overrides,
+    word_count_cutoff: int,
+    extraction_cfg: Optional[dict[str, Any]],
+    extraction_cache: Optional[pd.DataFrame],
+    ia_mappings: pd.DataFrame,
+    streaming_cfg: Optional[dict[str, Any]] = None,
+    string_dtype: str = "object",
+    engine: str = "pandas",
+) -> Iterator[
+    tuple[dict[str, pd.DataFrame], dict[int, tuple[str, str]], dict[str, pd.DataFrame]]
+]:
+    """
+    Runs every content category through all the stages of `standardize_columns`, `add_data`,
+    `extract_data` and `map_data`, and yields each content category as soon as it is done.
+
+    Unlike the nodes of the `data_processing` pipeline, a content category does not wait for
+    the other content categories before its next stage, and no intermediate dataset is written.
+    As this is a generator node, Kedro saves the outputs of every content category before the
+    next one is yielded, so only the content categories being processed are held in memory.
+
+    Content categories are processed concurrently in `workers` processes of a pool, and at
+    most `workers` content categories are in flight at a time. Articles are extracted serially
+    within a content category, so the `parallel` extraction option is ignored. The extraction
+    cache is read to reuse the extracted data of unchanged articles, but it is not updated;
+    run the `data_processing` pipeline to refresh it.
+
+    Args:
+        all_contents (dict[str, Callable[[], Any]]): A dictionary where keys are the filenames of
+            the raw Excel exports and values load them as `pandas.DataFrame`.
+        columns_to_add_cfg (dict[str, list[str]]): The column names to add of each content category.
+        columns_to_keep_cfg (dict[str, list[str]]): The column names to keep of each content category.
+        default_columns (list[str]): The default column names.
+        overrides (Overrides): The curated overrides of the articles, including the whitelist
+            and the blacklist of the flagging rules. See `compile_overrides`.
+        word_count_cutoff (int): The word count threshold for flagging articles.
+        extraction_cfg (Optional[dict[str, Any]]): The `extraction` configuration in
+            `parameters_data_processing.yml`. See `extract_data`.
+        extraction_cache (Optional[pd.DataFrame]): The extraction cache entries. See `ExtractionCache`.
+        ia_mappings (pd.DataFrame): The IA mappings table. See `compile_ia_mappings`.
+        streaming_cfg (Optional[dict[str, Any]]): The `streaming` configuration in
+            `parameters_data_processing.yml`. If `workers` is greater than 1, content categories
+            are processed in a pool of `workers` processes. Defaults to None, which processes
+            the content categories one at a time in the main process. With the `polars`
+            engine, the worker processes are spawned rather than forked.
+        string_dtype (str): The dtype of the text columns, either "object" or "string[pyarrow]".
+            Defaults to "object". See `convert_string_columns`.
+        engine (str): The engine of the stages of `standardize_columns`, `add_data` and
+            `map_data`, either "pandas" or "polars". Defaults to "pandas".
+
+    Yields:
+        tuple[dict[str, pd.DataFrame], dict[int, tuple[str, str]], dict[str, pd.DataFrame]]: For every content
+            category, the processed data keyed by content category, the extracted text keyed by
+            article ID, and the reports of the flagging rules, the applied overrides and the
+            extraction metrics, if enabled, keyed by `<content category>/<report>`.
+    """
+    extraction_cfg = extraction_cfg or {}
+    workers = (streaming_cfg or {}).get("workers") or 1
+    cache_cfg = extraction_cfg.get("cache", {})
+    if not cache_cfg.get("enabled", True):
+        extraction_cache = None
+
+    kwargs = dict(
+        columns_to_add_cfg=columns_to_add_cfg,
+        columns_to_keep_cfg=columns_to_keep_cfg,
+        default_columns=default_columns,
+        overrides=overrides,
+        word_count_cutoff=word_count_cutoff,
+        extraction_cfg=extraction_cfg,
+        ia_mappings=ia_mappings,
+        string_dtype=string_dtype,
+        engine=engine,
+    )
+    partitions = iter(all_contents.items())
+
+    if workers == 1:
+        cache = (
+            ExtractionCache(extraction_cache) if extraction_cache is not None else None
+        )
+        for filename, partition_load_func in partitions:
+            yield _process_partition(
+                filename, partition_load_func, cache=cache, **kwargs
+            )
+        return
+
+    # The thread pool of Polars is not fork-safe, so workers are spawned if the parent
+    # process may have already run a Polars query
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context("spawn") if engine == "polars" else None,
+        initializer=_init_partition_worker,
+        initargs=(extraction_cache,),
+    ) as executor:
+        # Keep at most `workers` content categories in flight
+        in_flight = {
+            executor.submit(_process_partition_in_worker, filename, load_func, kwargs)
+            for filename, load_func in islice(partitions, workers)
+        }
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                for filename, load_func in islice(partitions, 1):
+                    in_flight.add(
+                        executor.submit(
+                            _process_partition_in_worker, filename, load_func, kwargs
+                        )
+                    )
+                yield future.result()
+
+
+def _init_partition_worker(extraction_cache: Optional[pd.DataFrame]) -> None:
+    """
+    Initializes the extraction cache of a worker process of `process_partitions`.
+
+    Args:
+        extraction_cache (Optional[pd.DataFrame]): The extraction cache entries, or None
+            if the cache is disabled.
+    """
+    _worker_state["cache"] = (
+        ExtractionCache(extraction_cache) if extraction_cache is not None else None
+    )
+
+
+def _process_partition_in_worker(
+    filename: str, partition_load_func: Callable[[], Any], kwargs: dict[str, Any]
+) -> tuple[
+    dict[str, pd.DataFrame], dict[int, tuple[str, str]], dict[str, pd.DataFrame]
+]:
+    """
+    Processes a content category in a worker process with its extraction cache.
+    See `_process_partition`.
+    """
+    return _process_partition(
+        filename, partition_load_func, cache=_worker_state["cache"], **kwargs
+    )
+
+
+def _process_partition(
+    filename: str,
+    partition_load_func: Callable[[], Any],
+    columns_to_add_cfg: dict[str, list[str]],
+    columns_to_keep_cfg: dict[str, list[str]],
+    default_columns: list[str],
+    overrides: Overrides,
+    word_count_cutoff: int,
+    extraction_cfg: dict[str, Any],
+    ia_mappings: pd.DataFrame,
+    string_dtype: str,
+    engine: str,
+    cache: Optional[ExtractionCache],
+) -> tuple[
+    dict[str, pd.DataFrame], dict[int, tuple[str, str]], dict[str, pd.DataFrame]
+]:
+    """
+    Runs a content category through all the stages. See `process_partitions`.
+
+    Args:
+        filename (str): The filename of the raw Excel export of the content category.
+        partition_load_func (Callable[[], Any]): The function that loads the raw Excel export.
+        cache (Optional[ExtractionCache]): The extraction cache, or None.
+        Other arguments are the same as `process_partitions`.
+
+    Returns:
+        tuple[dict[str, pd.DataFrame], dict[int, tuple[str, str]], dict[str, pd.DataFrame]]: The processed
+            data, the extracted text and the reports of the content category.
+    """
+    content_category = _get_content_category(filename)
+    logger.info(f"Processing: {content_category}")
+
+    df = _standardize_partition(
+        partition_load_func(),
+        content_category,
+        columns_to_add_cfg,
+        columns_to_keep_cfg,
+        default_columns,
+        string_dtype,
+        engine,
+    )
+    df, overrides_report = _add_partition(
+        df, content_category, overrides, string_dtype, engine
+    )
+    df, extracted_text, rules_report, metrics_report = _extract_and_flag_partition(
+        df,
+        content_category,
+        word_count_cutoff,
+        overrides.whitelist.index,
+        overrides.blacklist["remove_type"],
+        extraction_cfg,
+        None,
+        cache,
+        string_dtype,
+    )
+    df = _map_partition(df, ia_mappings, string_dtype, engine)
+
+    _log_memory_usage(
+        f"all_contents_processed/{content_category}", {content_category: df}
+    )
+
+    reports = {
+        f"{content_category}/flagging_rules_report": rules_report,
+        f"{content_category}/applied_overrides": overrides_report,
+    }
+    if metrics_report is not None:
+        reports[f"{content_category}/extraction_metrics"] = metrics_report
+
+    return {content_category: df}, extracted_text, reports
@@ -0,0 +1,213 @@
+from typing import Any, Callable
+
+import pandas as pd
+
+# Columns of the report of `Overrides.apply`
+REPORT_COLUMNS = ["content_category", "id", "friendly_url", "override", "source"]
+
+
+class Overrides:
+    """
+    The curated overrides of the articles, compiled once into keyed tables.
+
+    Every table records the `source` of each override, i.e. the missing content file or
+    the parameter it comes from, and is applied to a content category as an indexed join,
+    so that the cost of applying the overrides does not grow with their number:
+
+    - `contents`: The content body of the articles with Excel errors, keyed by `friendly_url`.
+    - `urls`: The updated URL of the articles with known 404 errors, keyed by content category
+        and `id`.
+    - `whitelist`: The articles to keep, keyed by `id`.
+    - `blacklist`: The `remove_type` of the articles to remove, keyed by `id`.
+
+    The whitelist and the blacklist are applied after extraction by the flagging rules of
+    `extract_data`, which read them from the same tables as the report of `apply`.
+    """
+
+    def __init__(
+        self,
+        contents: pd.DataFrame,
+        urls: pd.DataFrame,
+        whitelist: pd.DataFrame,
+        blacklist: pd.DataFrame,
+    ) -> None:
+        """
+        Initializes the Overrides with its keyed tables.
+
+        Args:
+            contents (pd.DataFrame): The table indexed by `friendly_url`, with the
+                `content_body` and `source` columns.
+            urls (pd.DataFrame): The table indexed by `content_category` and `id`, with the
+                `full_url` and `source` columns.
+            whitelist (pd.DataFrame): The table indexed by `id`, with the `source` column.
+            blacklist (pd.DataFrame): The table indexed by `id`, with the `remove_type` and
+                `source` columns.
+        """
+        self.contents = contents
+        self.urls = urls
+        self.whitelist = whitelist
+        self.blacklist = blacklist
+
+    @classmethod
+    def from_sources(
+        cls,
+        missing_contents: dict[str, Callable[[], Any]],
+        updated_urls: dict[str, dict[int, str]],
+        whitelist: list[int],
+        blacklist: dict[int, str],
+    ) -> "Overrides":
+        """
+        Compiles the overrides from the missing contents and the parameters.
+
+        If several overrides share the same key, the last one is kept.
+
+        Args:
+            missing_contents (dict[str, Callable[[], Any]]): A dictionary where keys are file paths
+                and values are functions that load the content of text files. The file name is
+                the friendly URL of the article.
+            updated_urls (dict[str, dict[int, str]]): A dictionary where keys are content categories
+                and values are dictionaries mapping article IDs to updated URLs.
+            whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+            blacklist (dict[int, str]): The list of article IDs to remove. See https://bitly.cx/f8FIk.
+
+        Returns:
+            Overrides: The compiled overrides.
+        """
+        contents = pd.DataFrame(
+            [
+                (file_path.split("/")[-1], load_func(), f"missing_contents:{file_path}")
+                for file_path, load_func in missing_contents.items()
+            ],
+            columns=["friendly_url", "content_body", "source"],
+        )
+        urls = pd.DataFrame(
+            [
+                (
+                    content_category,
+                    article_id,
+                    url,
+                    f"params:updated_urls.{content_category}",
+                )
+                for content_category, urls_dict in updated_urls.items()
+                for article_id, url in (urls_dict or {}).items()
+            ],
+            columns=["content_category", "id", "full_url", "source"],
+        )
+        whitelist_table = pd.DataFrame(
+            [(article_id, "params:whitelist") for article_id in whitelist or []],
+            columns=["id", "source"],
+        )
+        blacklist_table = pd.DataFrame(
+            [
+                (article_id, remove_type, "params:blacklist")
+                for article_id, remove_type in (blacklist or {}).items()
+            ],
+            columns=["id", "remove_type", "source"],
+        )
+
+        return cls(
+            contents=_keyed(contents, ["friendly_url"]),
+            urls=_keyed(urls, ["content_category", "id"]),
+            whitelist=_keyed(whitelist_table, ["id"]),
+            blacklist=_keyed(blacklist_table, ["id"]),
+        )
+
+    def apply(
+        self, df: pd.DataFrame, content_category: str
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Applies the missing contents and the updated URLs to the articles of a content category.
+
+        The missing contents replace the `content_body` column of the articles with the same
+        `friendly_url`, and the updated URLs replace the `full_url` and `full_url2` columns of the
+        articles with the same `id`. The whitelist and blacklist are applied after extraction,
+        but the articles they match are reported here as well.
+
+        Args:
+            df (pd.DataFrame): The DataFrame containing the articles of the content category.
+            content_category (str): The content category of the articles.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: The DataFrame with the overrides applied, and
+                a report of every override that matched an article with its `source`.
+        """
+        report = []
+
+        # Add back contents that are previously indicated as Excel errors
+        has_content = df["friendly_url"].isin(self.contents.index)
+        if has_content.any():
+            friendly_urls = df.loc[has_content, "friendly_url"]
+            df.loc[has_content, "content_body"] = friendly_urls.map(
+                self.contents["content_body"]
+            )
+            report.append(
+                self._report(
+                    df, has_content, "content_body", friendly_urls, self.contents
+                )
+            )
+
+        # Add updated URLs of the content category
+        if content_category in self.urls.index.get_level_values("content_category"):
+            urls = self.urls.xs(content_category, level="content_category")
+            has_url = df["id"].isin(urls.index)
+            if has_url.any():
+                ids = df.loc[has_url, "id"]
+                df.loc[has_url, "full_url"] = ids.map(urls["full_url"])
+                df.loc[has_url, "full_url2"] = df.loc[has_url, "full_url"]
+                report.append(self._report(df, has_url, "full_url", ids, urls))
+
+        for override, table in [
+            ("whitelist", self.whitelist),
+            ("blacklist", self.blacklist),
+        ]:
+            is_listed = df["id"].isin(table.index)
+            if is_listed.any():
+                ids = df.loc[is_listed, "id"]
+                report.append(self._report(df, is_listed, override, ids, table))
+
+        report = [
+            part.assign(content_category=content_category)[REPORT_COLUMNS]
+            for part in report
+        ]
+        if not report:
+            return df, pd.DataFrame(columns=REPORT_COLUMNS)
+        return df, pd.concat(report, ignore_index=True)
+
+    @staticmethod
+    def _report(
+        df: pd.DataFrame,
+        mask: pd.Series,
+        override: str,
+        keys: pd.Series,
+        table: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """
+        Reports the articles matched by an override with the `source` of the override.
+
+        Args:
+            df (pd.DataFrame): The DataFrame containing the articles.
+            mask (pd.Series): Whether each article is matched by the override.
+            override (str): The name of the override, i.e. the overridden column or list.
+            keys (pd.Series): The keys of the matched articles in the table of the override.
+            table (pd.DataFrame): The keyed table of the override.
+
+        Returns:
+            pd.DataFrame: The `id`, `friendly_url`, `override` and `source` of the matched articles.
+        """
+        return df.loc[mask, ["id", "friendly_url"]].assign(
+            override=override, source=keys.map(table["source"]).to_numpy()
+        )
+
+
+def _keyed(table: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """
+    Indexes a table by its keys, keeping the last row of duplicated keys.
+
+    Args:
+        table (pd.DataFrame): The table to index.
+        keys (list[str]): The key columns.
+
+    Returns:
+        pd.DataFrame: The table indexed by the keys.
+    """
+    return table.drop_duplicates(subset=keys, keep="last").set_index(keys)
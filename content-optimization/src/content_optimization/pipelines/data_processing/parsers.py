@@ -0,0 +1,174 @@
+import time
+from dataclasses import fields
+from typing import Callable
+
+import pandas as pd
+from bs4 import BeautifulSoup, Comment
+from bs4.builder import HTMLTreeBuilder
+
+# Parser backends supported by `HTMLExtractor.preprocess_html`
+# NOTE: `lxml` and `lexbor` require the `lxml` and `selectolax` packages respectively
+PARSERS = ("html.parser", "lxml", "lexbor")
+
+# Wrapper tags added by HTML5 parsers around an HTML fragment
+DOCUMENT_TAGS = ("html", "head", "body")
+
+
+class LexborTreeBuilder(HTMLTreeBuilder):
+    """
+    A BeautifulSoup tree builder backed by the lexbor HTML parser in `selectolax`.
+
+    The HTML content is tokenized and parsed in C by lexbor. The resulting DOM is then
+    replayed into the BeautifulSoup object, so the tree can be traversed with the same
+    BeautifulSoup API as the other parser backends.
+
+    Note:
+        The `html`, `head` and `body` tags added by lexbor around the HTML content are
+        not replayed, so the tree has the same structure as the one built by `html.parser`.
+        Likewise, `tbody` tags implied by lexbor are not replayed unless the HTML content
+        contains `tbody` tags.
+    """
+
+    NAME = "lexbor"
+    features = [NAME, "html", "fast"]
+
+    def feed(self, markup: str) -> None:
+        """
+        Parses the markup with lexbor and replays the DOM into the BeautifulSoup object.
+
+        Args:
+            markup (str): The HTML content to be parsed.
+        """
+        # Imported here as `selectolax` is an optional dependency
+        from selectolax.lexbor import LexborHTMLParser
+
+        if isinstance(markup, bytes):
+            markup = markup.decode("utf-8")
+
+        # Lexbor inserts a `tbody` in every table, which changes the raw HTML tables
+        self._skip_tbody = "<tbody" not in markup.lower()
+
+        tree = LexborHTMLParser(markup)
+        for node in (tree.head, tree.body):
+            if node is not None:
+                self._replay_children(node)
+
+    def _replay_children(self, node) -> None:
+        """
+        Replays the children of a lexbor node into the BeautifulSoup object.
+
+        Args:
+            node (LexborNode): The lexbor node whose children are replayed.
+        """
+        child = node.child
+        while child is not None:
+            tag = child.tag
+            if tag == "-text":
+                self.soup.handle_data(child.text_content)
+            elif tag == "-comment":
+                self.soup.endData()
+                self.soup.handle_data(child.comment_content or "")
+                self.soup.endData(Comment)
+            elif tag == "tbody" and self._skip_tbody:
+                self._replay_children(child)
+            elif tag[0] not in "-#_":
+                attrs = {
+                    key: "" if value is None else value
+                    for key, value in child.attributes.items()
+                }
+                self.soup.handle_starttag(tag, None, None, attrs)
+                self._replay_children(child)
+                self.soup.endData()
+                self.soup.handle_endtag(tag)
+            child = child.next
+
+
+def build_soup(html_content: str, parser: str = "html.parser") -> BeautifulSoup:
+    """
+    Parses the HTML content into a BeautifulSoup object with the given parser backend.
+
+    HTML5 parsers wrap an HTML fragment in `html`, `head` and `body` tags. These tags are
+    unwrapped so that the tree has the same structure regardless of the parser backend.
+
+    Args:
+        html_content (str): The HTML content to be parsed.
+        parser (str): The parser backend. Must be one of `PARSERS`. Defaults to "html.parser".
+
+    Returns:
+        BeautifulSoup: The parsed HTML content as a BeautifulSoup object.
+
+    Raises:
+        ValueError: If the parser backend is not supported.
+    """
+    if parser not in PARSERS:
+        raise ValueError(f"Invalid parser `{parser}`. Must be one of {PARSERS}")
+
+    if parser == "lexbor":
+        return BeautifulSoup(html_content, builder=LexborTreeBuilder())
+
+    soup = BeautifulSoup(html_content, parser)
+
+    if parser != "html.parser":
+        for name in DOCUMENT_TAGS:
+            tag = soup.find(name, recursive=False)
+            if tag is not None:
+                tag.unwrap()
+
+    return soup
+
+
+def compare_parsers(
+    html_contents: list[str],
+    extract: Callable[[str, str], object],
+    parsers: tuple[str, ...] = PARSERS,
+    reference: str = "html.parser",
+) -> pd.DataFrame:
+    """
+    Runs every parser backend over the HTML contents and compares the extracted data
+    against the reference parser backend.
+
+    Args:
+        html_contents (list[str]): The HTML contents to be extracted.
+        extract (Callable[[str, str], object]): A function that extracts the data from an
+            HTML content with a given parser backend and returns a dataclass, e.g. the
+            `ExtractionResult` of `HTMLExtractor.extract_all`.
+        parsers (tuple[str, ...]): The parser backends to compare. Defaults to `PARSERS`.
+        reference (str): The parser backend to compare against. Defaults to "html.parser".
+
+    Returns:
+        pd.DataFrame: A report with the throughput (articles/sec), the number of articles
+            with a different output and the fields that differ for every parser backend.
+    """
+    results = {}
+    report = []
+
+    for parser in (reference, *[p for p in parsers if p != reference]):
+        start = time.perf_counter()
+        results[parser] = [
+            extract(html_content, parser) for html_content in html_contents
+        ]
+        duration = time.perf_counter() - start
+
+        diff_fields = set()
+        num_diffs = 0
+        for result, reference_result in zip(results[parser], results[reference]):
+            diffs = {
+                field.name
+                for field in fields(result)
+                if getattr(result, field.name) != getattr(reference_result, field.name)
+            }
+            num_diffs += len(diffs) > 0
+            diff_fields.update(diffs)
+
+        report.append(
+            {
+                "parser": parser,
+                "articles": len(html_contents),
+                "seconds": duration,
+                "articles_per_sec": len(html_contents) / duration if duration else None,
+                "num_diffs": num_diffs,
+                "diff_fields": sorted(diff_fields),
+            }
+        )
+
+    return pd.DataFrame(report)
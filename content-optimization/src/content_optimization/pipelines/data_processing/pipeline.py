@@ -5,9 +5,13 @@
 
 from content_optimization.pipelines.data_processing.nodes import (
     add_data,
+    compile_ia_mappings,
+    compile_overrides,
+    deduplicate_data,
     extract_data,
     map_data,
     merge_data,
+    process_partitions,
     standardize_columns,
 )
 from kedro.pipeline import Pipeline, node, pipeline
@@ -23,18 +27,32 @@ def create_pipeline(**kwargs) -> Pipeline:
                     "params:columns_to_add",
                     "params:columns_to_keep",
                     "params:default_columns",
+                    "params:string_dtype",
+                    "params:dataframe_engine",
                 ],
                 outputs="all_contents_standardized",
                 name="standardize_columns_node",
             ),
             node(
-                func=add_data,
+                func=compile_overrides,
                 inputs=[
-                    "all_contents_standardized",
                     "missing_contents",
                     "params:updated_urls",
+                    "params:whitelist",
+                    "params:blacklist",
+                ],
+                outputs="overrides",
+                name="compile_overrides_node",
+            ),
+            node(
+                func=add_data,
+                inputs=[
+                    "all_contents_standardized",
+                    "overrides",
+                    "params:string_dtype",
+                    "params:dataframe_engine",
                 ],
-                outputs="all_contents_added",
+                outputs=["all_contents_added", "applied_overrides"],
                 name="add_data_node",
             ),
             node(
@@ -42,18 +60,44 @@ def create_pipeline(**kwargs) -> Pipeline:
                 inputs=[
                     "all_contents_added",
                     "params:word_count_cutoff",
-                    "params:whitelist",
-                    "params:blacklist",
+                    "overrides",
+                    "params:extraction",
+                    "extraction_cache",
+                    "params:string_dtype",
+                ],
+                outputs=[
+                    "all_contents_extracted",
+                    "all_extracted_text",
+                    "extraction_cache_updated",
+                    "flagging_rules_report",
+                    "extraction_metrics",
                 ],
-                outputs=["all_contents_extracted", "all_extracted_text"],
                 name="extract_data_node",
             ),
             node(
-                func=map_data,
+                func=deduplicate_data,
                 inputs=[
                     "all_contents_extracted",
-                    "params:l1_mappings",
-                    "params:l2_mappings",
+                    "params:whitelist",
+                    "params:near_duplicates",
+                    "params:string_dtype",
+                ],
+                outputs=["all_contents_deduplicated", "near_duplicate_pairs"],
+                name="deduplicate_data_node",
+            ),
+            node(
+                func=compile_ia_mappings,
+                inputs=["params:l1_mappings", "params:l2_mappings"],
+                outputs="ia_mappings",
+                name="compile_ia_mappings_node",
+            ),
+            node(
+                func=map_data,
+                inputs=[
+                    "all_contents_deduplicated",
+                    "ia_mappings",
+                    "params:string_dtype",
+                    "params:dataframe_engine",
                 ],
                 outputs="all_contents_mapped",
                 name="map_data_node",
@@ -61,7 +105,83 @@ def create_pipeline(**kwargs) -> Pipeline:
             node(
                 func=merge_data,
                 inputs="all_contents_mapped",
-                outputs="merged_data",
+                outputs=["merged_data", "merged_data_partitioned"],
+                name="merge_data_node",
+            ),
+        ]
+    )
+
+
+def create_streaming_pipeline(**kwargs) -> Pipeline:
+    """
+    Creates the streaming variant of the data processing pipeline.
+
+    Every content category flows through the stages of `standardize_columns`, `add_data`,
+    `extract_data` and `map_data` in a single generator node, `process_partitions`, and is
+    written as soon as it is done. Near duplicates are compared across all content categories,
+    so `deduplicate_data` runs once all content categories are processed.
+
+    Returns:
+        Pipeline: The streaming pipeline, which writes the same `merged_data` as the
+            `data_processing` pipeline.
+    """
+    return pipeline(
+        [
+            node(
+                func=compile_overrides,
+                inputs=[
+                    "missing_contents",
+                    "params:updated_urls",
+                    "params:whitelist",
+                    "params:blacklist",
+                ],
+                outputs="overrides",
+                name="compile_overrides_node",
+            ),
+            node(
+                func=compile_ia_mappings,
+                inputs=["params:l1_mappings", "params:l2_mappings"],
+                outputs="ia_mappings",
+                name="compile_ia_mappings_node",
+            ),
+            node(
+                func=process_partitions,
+                inputs=[
+                    "all_contents",
+                    "params:columns_to_add",
+                    "params:columns_to_keep",
+                    "params:default_columns",
+                    "overrides",
+                    "params:word_count_cutoff",
+                    "params:extraction",
+                    "extraction_cache",
+                    "ia_mappings",
+                    "params:streaming",
+                    "params:string_dtype",
+                    "params:dataframe_engine",
+                ],
+                outputs=[
+                    "all_contents_processed",
+                    "all_extracted_text",
+                    "processing_reports",
+                ],
+                name="process_partitions_node",
+            ),
+            node(
+                func=deduplicate_data,
+                inputs=[
+                    "all_contents_processed",
+                    "params:whitelist",
+                    "params:near_duplicates",
+                    "params:string_dtype",
+                ],
+                outputs=["all_contents_mapped", "near_duplicate_pairs"],
+                name="deduplicate_processed_data_node",
+            ),
+            node(
+                func=merge_data,
+                inputs="all_contents_mapped",
+                outputs=["merged_data", "merged_data_partitioned"],
                 name="merge_data_node",
             ),
         ]
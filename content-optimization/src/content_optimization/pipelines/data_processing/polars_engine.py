@@ -0,0 +1,397 @@
+"""
+The `polars` engine of the `data_processing` nodes, selected by `dataframe_engine` in
+`parameters_data_processing.yml`.
+
+Every function runs the same logic as its pandas counterpart in `utils.py` and
+`overrides.py` as a single Polars lazy query, so the column selection, the whitespace
+stripping, the override joins and the IA mapping are planned as a whole and executed
+on all cores. Only the columns a query needs are converted from `pandas.DataFrame`, and
+its results are converted back, so the nodes save the same data with either engine.
+
+Polars columns have a single type, so `object` columns of mixed types, e.g. strings and
+integers of a raw Excel export, are not converted. They are processed by the pandas
+implementation instead. See `_mixed_columns`.
+
+Note:
+    This module requires `polars`, which is an optional dependency. It is only imported
+    by the nodes when the `polars` engine is selected.
+"""
+
+from typing import Optional
+
+import pandas as pd
+import polars as pl
+from content_optimization.pipelines.data_processing.overrides import (
+    REPORT_COLUMNS,
+    Overrides,
+)
+from content_optimization.pipelines.data_processing.utils import (
+    convert_string_columns,
+    flag_articles_to_remove_before_extraction,
+)
+from content_optimization.pipelines.data_processing.utils import (
+    map_category_names as pandas_map_category_names,
+)
+
+# The characters stripped by `str.strip`. Polars strips the Unicode White_Space characters
+# by default, which do not include the separators "\x1c" to "\x1f"
+WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004"
+    "\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+# Name of the temporary column of the row number of every article
+ROW = "__row__"
+
+
+def standardize_partition(
+    df: pd.DataFrame,
+    columns_to_add: Optional[list[str]],
+    columns_to_keep: list[str],
+    default_columns: list[str],
+    content_category: str,
+    string_dtype: str,
+) -> pd.DataFrame:
+    """
+    Selects, rearranges and renames the columns, adds the content category and strips the
+    whitespaces of all strings. See `select_and_rename_columns` and `strip_whitespace`.
+
+    Args:
+        df (pd.DataFrame): The raw data of the content category.
+        columns_to_add (Optional[list[str]]): The column names to add back as null values.
+        columns_to_keep (list[str]): The column names to keep, in order.
+        default_columns (list[str]): The default column names.
+        content_category (str): The content category.
+        string_dtype (str): The dtype of the text columns. See `convert_string_columns`.
+
+    Returns:
+        pd.DataFrame: The standardized data.
+
+    Raises:
+        ValueError: If `columns_to_keep` and `default_columns` differ in length.
+    """
+    if len(columns_to_keep) != len(default_columns):
+        raise ValueError(
+            f"Length mismatch: Expected axis has {len(columns_to_keep)} elements, "
+            f"new values have {len(default_columns)} elements"
+        )
+
+    added_columns = [
+        pl.lit(None, dtype=pl.Float64).alias(column)
+        for column in columns_to_add or []
+        if column not in df.columns
+    ]
+    default_column_names = dict(zip(columns_to_keep, default_columns))
+    mixed_columns = _mixed_columns(df, columns_to_keep)
+
+    # Only the columns to keep are converted to the query
+    standardized = (
+        pl.from_pandas(
+            df[
+                [
+                    column
+                    for column in columns_to_keep
+                    if column in df and column not in mixed_columns
+                ]
+            ]
+        )
+        .lazy()
+        .with_columns(added_columns)
+        .select(
+            pl.col(column).alias(default_column_names[column])
+            for column in columns_to_keep
+            if column not in mixed_columns
+        )
+        .with_columns(content_category=pl.lit(content_category))
+        .with_columns(pl.col(pl.String).str.strip_chars(WHITESPACE))
+        .collect()
+    )
+    standardized_df = _to_pandas(standardized, string_dtype)
+
+    # Strip the strings of the columns of mixed types as `strip_whitespace` does
+    for column in mixed_columns:
+        standardized_df[default_column_names[column]] = [
+            x.strip() if isinstance(x, str) else x for x in df[column]
+        ]
+
+    return standardized_df[[*default_columns, "content_category"]]
+
+
+def add_partition(
+    df: pd.DataFrame,
+    content_category: str,
+    overrides: Overrides,
+    string_dtype: str,
+    regex: str = r"(<[div|p|h2].*?>)",
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Applies the overrides to a content category and flags articles to remove before
+    extraction. See `Overrides.apply` and `flag_articles_to_remove_before_extraction`.
+
+    Every override is a left join of the articles with its keyed table, so the articles
+    are matched against all the overrides and flagged in a single query. Only the key
+    columns and `content_body` are converted to the query, and only the overridden values
+    and the flags are assigned back to the articles.
+
+    Args:
+        df (pd.DataFrame): The standardized data of the content category.
+        content_category (str): The content category.
+        overrides (Overrides): The curated overrides of the articles.
+        string_dtype (str): The dtype of the text columns. See `convert_string_columns`.
+        regex (str): The regex pattern of the HTML tags in the `content_body` column.
+            Defaults to r"(<[div|p|h2].*?>)".
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The data with the overrides applied and the
+            `to_remove` and `remove_type` columns, and the report of the overrides that
+            matched an article.
+    """
+    df = convert_string_columns(df, string_dtype)
+
+    columns = ["id", "friendly_url", "content_body", "content_category"]
+    if _mixed_columns(df, columns):
+        df, overrides_report = overrides.apply(df, content_category)
+        return flag_articles_to_remove_before_extraction(df, regex), overrides_report
+
+    articles = pl.from_pandas(df[columns]).lazy()
+    schema = articles.collect_schema()
+
+    # The keys, the overridden columns and the table of every override
+    urls = overrides.urls
+    tables = {
+        "content_body": (["friendly_url"], ["content_body"], overrides.contents),
+        "full_url": (
+            ["id"],
+            ["full_url"],
+            urls[urls.index.get_level_values("content_category") == content_category],
+        ),
+        "whitelist": (["id"], [], overrides.whitelist),
+        "blacklist": (["id"], [], overrides.blacklist),
+    }
+
+    # Join the value and the `source` of every override, which are null if no override
+    # matched an article
+    for override, (keys, columns, keyed_table) in tables.items():
+        table = pl.from_pandas(keyed_table, include_index=True).lazy()
+        articles = articles.join(
+            table.select(
+                *[pl.col(key).cast(schema[key]) for key in keys],
+                *[
+                    pl.col(column).cast(pl.String).alias(f"__{override}_{column}__")
+                    for column in [*columns, "source"]
+                ],
+            ),
+            on=keys,
+            how="left",
+            maintain_order="left",
+        )
+
+    # Mark articles with no content, was rejected by Excel due to a "Value
+    # exceeded maximum cell size" error or with dummy content, after the missing
+    # contents are added back
+    has_content = pl.col("__content_body_source__").is_not_null()
+    content = (
+        pl.when(has_content)
+        .then(pl.col("__content_body_content_body__"))
+        .otherwise(pl.col("content_body").cast(pl.String))
+    )
+    is_na = content.is_null()
+    has_tags = content.str.contains(regex).fill_null(False)
+    is_excel_error = content.str.contains(
+        "Value exceeded maximum cell size", literal=True
+    ).fill_null(False)
+    no_tags = (
+        ~is_na & ~is_excel_error & ~has_tags & pl.col("content_category").is_not_null()
+    )
+    flags = articles.select(
+        has_content=has_content,
+        content_body=pl.col("__content_body_content_body__"),
+        has_url=pl.col("__full_url_source__").is_not_null(),
+        full_url=pl.col("__full_url_full_url__"),
+        to_remove=is_na | ~has_tags,
+        remove_type=pl.when(is_na)
+        .then(pl.lit("NaN"))
+        .when(is_excel_error)
+        .then(pl.lit("Excel Error"))
+        .when(no_tags)
+        .then(pl.lit("No HTML Tags")),
+    )
+
+    # Report the articles matched by every override with the `source` of the override
+    reports = [
+        articles.filter(pl.col(f"__{override}_source__").is_not_null()).select(
+            content_category=pl.lit(content_category),
+            id="id",
+            friendly_url="friendly_url",
+            override=pl.lit(override),
+            source=f"__{override}_source__",
+        )
+        for override in tables
+    ]
+
+    # Collect the flags and the reports together, so that their common subplan runs once
+    flags, *reports = pl.collect_all([flags, *reports])
+
+    # Add back contents that are previously indicated as Excel errors, and updated URLs
+    has_content = flags["has_content"].to_numpy()
+    if has_content.any():
+        df.loc[has_content, "content_body"] = flags.filter("has_content")[
+            "content_body"
+        ].to_list()
+    has_url = flags["has_url"].to_numpy()
+    if has_url.any():
+        df.loc[has_url, "full_url"] = flags.filter("has_url")["full_url"].to_list()
+        df.loc[has_url, "full_url2"] = df.loc[has_url, "full_url"]
+
+    df["to_remove"] = flags["to_remove"].to_numpy()
+    df["remove_type"] = flags["remove_type"].to_numpy()
+
+    # The `friendly_url` of the report is a column of the articles
+    reports = [
+        _to_pandas(report, string_dtype, ["friendly_url"])
+        for report in reports
+        if not report.is_empty()
+    ]
+    if not reports:
+        return df, pd.DataFrame(columns=REPORT_COLUMNS)
+    return df, pd.concat(reports, ignore_index=True)
+
+
+def map_category_names(
+    ia_mappings: pd.DataFrame,
+    df: pd.DataFrame,
+    content_category_column: str,
+    reference_column: str,
+) -> pd.DataFrame:
+    """
+    Maps the article category names of every article to the new IA mapping of every level.
+    See `utils.map_category_names`.
+
+    Only the content category and the article category names of the articles are converted
+    to a Polars lazy query, so the other columns are neither copied nor converted.
+
+    Args:
+        ia_mappings (pd.DataFrame): The IA mappings table. See `compile_ia_mappings_table`.
+        df (pd.DataFrame): The DataFrame containing the articles
+        content_category_column (str): Refer to the column name of the content category (i.e. "content_category")
+        reference_column (str): Refer to the column name of the article category (i.e. "article_category_names")
+
+    Returns:
+        pd.DataFrame: The DataFrame with updated IA mapping for each content category, with one
+            new column per column of the IA mappings table (i.e. "l1_mappings" and "l2_mappings")
+    """
+    if _mixed_columns(df, [content_category_column, reference_column]):
+        return pandas_map_category_names(
+            ia_mappings, df, content_category_column, reference_column
+        )
+
+    new_column_names = list(ia_mappings.columns)
+
+    # Replace Ampersand symbol ("&") to "and"
+    articles = (
+        pl.from_pandas(df[[content_category_column, reference_column]])
+        .lazy()
+        .with_row_index(ROW)
+        .with_columns(
+            pl.col(content_category_column).cast(pl.String),
+            pl.col(reference_column)
+            .cast(pl.String)
+            .str.replace_all("&", "and", literal=True),
+        )
+    )
+
+    # One row per article category name; remove empty strings
+    mapped = (
+        articles.select(
+            ROW,
+            pl.col(content_category_column).alias("content_category"),
+            pl.col(reference_column).str.split(",").alias("category_name"),
+        )
+        .explode("category_name")
+        .filter(pl.col("category_name").str.strip_chars(WHITESPACE).str.len_chars() > 0)
+        .join(
+            pl.from_pandas(ia_mappings, include_index=True).lazy(),
+            on=["content_category", "category_name"],
+            how="inner",
+            maintain_order="left",
+        )
+    )
+
+    for new_column_name in new_column_names:
+        # Keep unique and non-null values only, joined in the order they are first mapped
+        joined = (
+            mapped.select(ROW, new_column_name)
+            .drop_nulls()
+            .unique(keep="first", maintain_order=True)
+            .group_by(ROW, maintain_order=True)
+            .agg(pl.col(new_column_name).cast(pl.String).str.join(" | "))
+            .with_columns(pl.col(new_column_name).str.strip_chars(WHITESPACE))
+            .filter(pl.col(new_column_name) != "")
+        )
+        articles = articles.join(joined, on=ROW, how="left", maintain_order="left")
+
+    mapped_df = articles.collect().to_pandas().set_axis(df.index)
+    for column in [reference_column, *new_column_names]:
+        df[column] = mapped_df[column]
+
+    return df
+
+
+def _mixed_columns(df: pd.DataFrame, columns: list[str]) -> list[str]:
+    """
+    Finds the `object` columns that are not text columns, e.g. of strings and integers.
+    Polars cannot convert a column of mixed types, and converts a column of a single
+    non-string type to a column of a different dtype than the pandas implementation.
+
+    Args:
+        df (pd.DataFrame): The DataFrame.
+        columns (list[str]): The column names to check. Missing columns are ignored.
+
+    Returns:
+        list[str]: The column names of the `object` columns of non-string values.
+    """
+    return [
+        column
+        for column in columns
+        if column in df
+        and df[column].dtype == object
+        and pd.api.types.infer_dtype(df[column]) not in ("string", "empty")
+    ]
+
+
+def _to_pandas(
+    frame: pl.DataFrame, string_dtype: str, columns: Optional[list[str]] = None
+) -> pd.DataFrame:
+    """
+    Converts a Polars DataFrame to pandas with the text columns of the given string dtype,
+    as `convert_string_columns` does.
+
+    With `string[pyarrow]`, the text columns wrap the Arrow buffers of the strings instead
+    of converting every string to a Python object.
+
+    Args:
+        frame (pl.DataFrame): The DataFrame to convert.
+        string_dtype (str): The dtype of the text columns, either "object" or "string[pyarrow]".
+        columns (Optional[list[str]]): The columns that may be text columns. Defaults to None,
+            which converts every text column.
+
+    Returns:
+        pd.DataFrame: The converted DataFrame.
+    """
+    if string_dtype == "object":
+        return frame.to_pandas()
+
+    # Columns of only null values are left as they are
+    text_columns = [
+        name
+        for name, dtype in frame.schema.items()
+        if dtype == pl.String
+        and (columns is None or name in columns)
+        and frame[name].null_count() < frame.height
+    ]
+    table = frame.to_arrow()
+    df = table.drop_columns(text_columns).to_pandas()
+    for name in text_columns:
+        df[name] = pd.arrays.ArrowStringArray(table[name])
+
+    return df[table.column_names]
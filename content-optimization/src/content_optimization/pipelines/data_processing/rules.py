@@ -0,0 +1,320 @@
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Union
+
+import numpy as np
+import pandas as pd
+
+# Columns of the report of `apply_rules`
+REPORT_COLUMNS = ["rule", "remove_type", "matched", "flagged", "seconds"]
+
+
+class ArticleFeatures:
+    """
+    The features of the extracted articles shared by the rules.
+
+    Every feature is computed on first use and reused by all later rules, e.g.
+    the extracted content body is lowercased and hashed only once.
+    """
+
+    def __init__(self, df: pd.DataFrame, whitelist: list[int]) -> None:
+        """
+        Initializes the ArticleFeatures of the given articles.
+
+        Args:
+            df (pd.DataFrame): The DataFrame containing the extracted articles.
+            whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+        """
+        self.df = df
+        self.whitelist = whitelist
+        self._hashes = {}
+
+    @cached_property
+    def whitelisted(self) -> np.ndarray:
+        """Whether each article is whitelisted."""
+        return self.df["id"].isin(self.whitelist).to_numpy()
+
+    @cached_property
+    def content_lower(self) -> pd.Series:
+        """The lowercased extracted content body of each article."""
+        return self.df["extracted_content_body"].str.lower()
+
+    def hashes(self, column: str) -> pd.Series:
+        """
+        Hashes the values of a column, so that rows are grouped by their hash.
+
+        Args:
+            column (str): The column to hash.
+
+        Returns:
+            pd.Series: The 64-bit hash of each value.
+        """
+        if column not in self._hashes:
+            self._hashes[column] = pd.util.hash_pandas_object(
+                self.df[column], index=False
+            )
+        return self._hashes[column]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    A vectorised rule that flags articles to remove.
+
+    Attributes:
+        name (str): The name of the rule in the report.
+        remove_type (Union[str, Callable[[ArticleFeatures], pd.Series]]): The `remove_type` of
+            the flagged articles, or a function that returns the `remove_type` of each article.
+        predicate (Callable[[ArticleFeatures, np.ndarray], np.ndarray]): A function that returns
+            whether each article matches the rule, given the features and whether each article
+            is flagged by the previous rules.
+        skip_flagged (bool): Whether articles flagged by the previous rules are skipped.
+            Otherwise, the `remove_type` of a flagged article is replaced. Defaults to True.
+        skip_whitelisted (bool): Whether whitelisted articles are skipped. Defaults to True.
+    """
+
+    name: str
+    remove_type: Union[str, Callable[[ArticleFeatures], pd.Series]]
+    predicate: Callable[[ArticleFeatures, np.ndarray], np.ndarray]
+    skip_flagged: bool = True
+    skip_whitelisted: bool = True
+
+
+def apply_rules(
+    df: pd.DataFrame, rules: list[Rule], whitelist: list[int]
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Applies the rules in order of precedence and flags the matched articles.
+
+    Each rule sees the articles flagged by the previous rules, so an article is flagged
+    by the first rule that matches it, unless a later rule replaces its `remove_type`.
+    The `to_remove` and `remove_type` columns are then assigned once for all rules.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing the extracted articles.
+        rules (list[Rule]): The rules in order of precedence.
+        whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The DataFrame with the `to_remove` and `remove_type`
+            columns updated, and a report of the number of articles matched and flagged by
+            each rule and its duration in seconds, including the features it computed first.
+    """
+    features = ArticleFeatures(df, whitelist)
+    flagged = df["to_remove"].to_numpy(dtype=bool).copy()
+    remove_types = np.full(len(df), None, dtype=object)
+
+    report = []
+    for rule in rules:
+        start = time.perf_counter()
+        matched = np.asarray(rule.predicate(features, flagged), dtype=bool)
+
+        to_flag = matched.copy()
+        if rule.skip_flagged:
+            to_flag &= ~flagged
+        if rule.skip_whitelisted:
+            to_flag &= ~features.whitelisted
+
+        if isinstance(rule.remove_type, str):
+            remove_types[to_flag] = rule.remove_type
+        else:
+            remove_types[to_flag] = rule.remove_type(features).to_numpy()[to_flag]
+        flagged |= to_flag
+
+        report.append(
+            {
+                "rule": rule.name,
+                "remove_type": (
+                    rule.remove_type if isinstance(rule.remove_type, str) else None
+                ),
+                "matched": int(matched.sum()),
+                "flagged": int(to_flag.sum()),
+                "seconds": time.perf_counter() - start,
+            }
+        )
+
+    # Assign all rules at once
+    to_update = pd.notna(remove_types)
+    df.loc[to_update, "to_remove"] = True
+    df.loc[to_update, "remove_type"] = remove_types[to_update]
+
+    return df, pd.DataFrame(report, columns=REPORT_COLUMNS)
+
+
+def no_extracted_content_rule() -> Rule:
+    """
+    Creates the rule that flags articles with an empty extracted content body.
+
+    Returns:
+        Rule: The rule with the `remove_type` of "No Extracted Content".
+    """
+
+    def predicate(features: ArticleFeatures, flagged: np.ndarray) -> np.ndarray:
+        is_empty = features.df["extracted_content_body"] == ""
+        return is_empty.fillna(False).to_numpy(dtype=bool)
+
+    # Empty articles are flagged even if they were flagged before extraction
+    return Rule(
+        "no_extracted_content", "No Extracted Content", predicate, skip_flagged=False
+    )
+
+
+def duplicated_rule(column: str) -> Rule:
+    """
+    Creates the rule that flags all articles sharing a duplicated value in a column,
+    including the first occurrence. This rule only inspects for duplicates in two columns:
+    `extracted_content_body` and `full_url`.
+
+    Args:
+        column (str):
+            The column to check for duplicated values. Must be either
+            `extracted_content_body` and `full_url`.
+
+    Returns:
+        Rule: The rule with the `remove_type` of "Duplicated Content" or "Duplicated URL".
+
+    Raises:
+        AssertionError: If the `column` parameter is None or not valid.
+    """
+    assert column is not None, "`column` cannot be None"
+    assert column in ["extracted_content_body", "full_url"], "Invalid column"
+
+    def predicate(features: ArticleFeatures, flagged: np.ndarray) -> np.ndarray:
+        hashes = features.hashes(column)
+        duplicated = (
+            hashes.duplicated().to_numpy()  # we want duplicated values
+            & features.df[column].notna().to_numpy()  # ignore null values
+            & ~flagged  # ignore articles that were already flagged
+        )
+        if column == "extracted_content_body":
+            # Ignore empty extracted content
+            duplicated &= (features.df[column] != "").fillna(False).to_numpy(dtype=bool)
+
+        return hashes.isin(hashes[duplicated]).to_numpy()
+
+    if column == "extracted_content_body":
+        return Rule("duplicated_content", "Duplicated Content", predicate)
+    return Rule("duplicated_url", "Duplicated URL", predicate)
+
+
+def recipe_rule() -> Rule:
+    """
+    Creates the rule that flags recipe articles based on `title`, `keywords` and
+    `extracted_content_body` column.
+
+    Returns:
+        Rule: The rule with the `remove_type` of "Recipe".
+    """
+
+    def predicate(features: ArticleFeatures, flagged: np.ndarray) -> np.ndarray:
+        df = features.df
+        # `title` and `keywords` column
+        recipe_title_keywords = df["title"].str.contains(r"[rR]ecipes?", na=False) | df[
+            "keywords"
+        ].str.contains(r"[rR]ecipes?", na=False)
+
+        # `extracted_content_body` column
+        recipe_content = features.content_lower.str.contains(
+            r"what [do ]?you need", na=False
+        ) & features.content_lower.str.contains(r"how to cook [this dish]*", na=False)
+
+        return (recipe_title_keywords | recipe_content).to_numpy(dtype=bool)
+
+    return Rule("recipe", "Recipe", predicate)
+
+
+def multilingual_rule() -> Rule:
+    """
+    Creates the rule that flags articles if it is purely Chinese, Malay or Tamil.
+
+    Returns:
+        Rule: The rule with the `remove_type` of "Multilingual".
+    """
+
+    def predicate(features: ArticleFeatures, flagged: np.ndarray) -> np.ndarray:
+        # Find articles where the last word of the friendly URL (i.e. after the last "_"
+        # or "-") is purely Chinese, Malay or Tamil
+        return (
+            features.df["friendly_url"]
+            .str.lower()
+            .str.contains(r"(?:chinese|tamil|malay)[^_-]*$", na=False)
+            .to_numpy(dtype=bool)
+        )
+
+    return Rule("multilingual", "Multilingual", predicate)
+
+
+def below_word_count_rule(word_count_cutoff: int) -> Rule:
+    """
+    Creates the rule that flags articles based on the word count in the extracted content body.
+
+    Args:
+        word_count_cutoff (int):
+            The word count for an article to be flagged. If the word count falls below this
+            threshold, the article is flagged.
+
+    Returns:
+        Rule: The rule with the `remove_type` of "Below Word Count".
+    """
+
+    def predicate(features: ArticleFeatures, flagged: np.ndarray) -> np.ndarray:
+        # Splitting at most `word_count_cutoff` times counts the words up to the cutoff
+        # without splitting the rest of long articles
+        word_counts = features.df["extracted_content_body"].map(
+            lambda x: len(x.split(maxsplit=word_count_cutoff)), na_action="ignore"
+        )
+        return ((word_counts > 0) & (word_counts <= word_count_cutoff)).to_numpy()
+
+    return Rule("below_word_count", "Below Word Count", predicate)
+
+
+def blacklist_rule(blacklist: Union[dict[int, str], pd.Series]) -> Rule:
+    """
+    Creates the rule that flags articles based on blacklist provided in
+    `parameters_data_processing.yml`.
+
+    Args:
+        blacklist (Union[dict[int, str], pd.Series]): The `remove_type` of the article IDs to
+            remove, e.g. `Overrides.blacklist["remove_type"]`. See https://bitly.cx/f8FIk.
+
+    Returns:
+        Rule: The rule with the `remove_type` of each article given by the blacklist.
+    """
+
+    def predicate(features: ArticleFeatures, flagged: np.ndarray) -> np.ndarray:
+        # The article IDs are the keys of the dictionary or the index of the Series
+        return features.df["id"].isin(blacklist.keys()).to_numpy()
+
+    def remove_type(features: ArticleFeatures) -> pd.Series:
+        return features.df["id"].map(blacklist)
+
+    # Blacklisted articles are always flagged with the `remove_type` of the blacklist
+    return Rule(
+        "blacklist", remove_type, predicate, skip_flagged=False, skip_whitelisted=False
+    )
+
+
+def post_extraction_rules(
+    word_count_cutoff: int, blacklist: Union[dict[int, str], pd.Series]
+) -> list[Rule]:
+    """
+    Creates the rules that flag articles to remove after extraction, in order of precedence.
+
+    Args:
+        word_count_cutoff (int): The word count threshold for flagging articles.
+        blacklist (Union[dict[int, str], pd.Series]): The `remove_type` of the article IDs to
+            remove. See `blacklist_rule`.
+
+    Returns:
+        list[Rule]: The rules in order of precedence.
+    """
+    return [
+        no_extracted_content_rule(),
+        duplicated_rule("extracted_content_body"),
+        duplicated_rule("full_url"),
+        recipe_rule(),
+        multilingual_rule(),
+        below_word_count_rule(word_count_cutoff),
+        blacklist_rule(blacklist),
+    ]
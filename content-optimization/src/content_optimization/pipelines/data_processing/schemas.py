@@ -0,0 +1,36 @@
+import pyarrow as pa
+
+# Text and URL of each link or image, i.e. `[(text, url), ...]`
+LINKS_TYPE = pa.list_(pa.struct([("text", pa.string()), ("url", pa.string())]))
+
+# Text and tag name (e.g. "h2") of each header, i.e. `[(header, level), ...]`
+HEADERS_TYPE = pa.list_(pa.struct([("header", pa.string()), ("level", pa.string())]))
+
+# Header, tag name, and start, content start and end offsets in `extracted_content_body` of
+# each section, i.e. `[(header, level, start, content_start, end), ...]`
+SECTIONS_TYPE = pa.list_(
+    pa.struct(
+        [
+            ("header", pa.string()),
+            ("level", pa.string()),
+            ("start", pa.int64()),
+            ("content_start", pa.int64()),
+            ("end", pa.int64()),
+        ]
+    )
+)
+
+# Rows of cells of each table, i.e. `[[[cell, ...], ...], ...]`
+TABLES_TYPE = pa.list_(pa.list_(pa.list_(pa.string())))
+
+# Arrow types of the columns extracted by the `HTMLExtractor`, enforced when
+# writing `all_contents_extracted` and the datasets derived from it
+EXTRACTED_COLUMN_TYPES = {
+    "related_sections": pa.list_(pa.string()),
+    "extracted_tables": TABLES_TYPE,
+    "extracted_raw_html_tables": pa.list_(pa.string()),
+    "extracted_links": LINKS_TYPE,
+    "extracted_headers": HEADERS_TYPE,
+    "extracted_images": LINKS_TYPE,
+    "sections": SECTIONS_TYPE,
+}
@@ -0,0 +1,71 @@
+import tempfile
+from collections.abc import Iterable
+from typing import Iterator, Optional
+
+import pyarrow as pa
+
+
+class ReplayableTableStream:
+    """
+    A stream of Arrow tables that can be saved to several datasets, but produces every
+    table once, e.g. the partitions of `merge_data`, which are loaded and converted once for
+    both `merged_data` and `merged_data_partitioned`.
+
+    Kedro saves the outputs of a node one after another, so the tables cannot be written to
+    all outputs at the same time without holding them all in memory. Instead, the first
+    iteration pulls the tables from the source and records each one in a temporary Arrow IPC
+    file as it is yielded. Later iterations replay the tables from the file, without loading
+    or converting the source again. Either way, only a single table is held in memory.
+    """
+
+    def __init__(self, tables: Iterable[pa.Table]) -> None:
+        """
+        Initializes the ReplayableTableStream with the source of the tables.
+
+        Args:
+            tables (Iterable[pa.Table]): The tables, which are only pulled when the stream is
+                first iterated.
+        """
+        self._tables = iter(tables)
+        # The temporary file is deleted when the stream is garbage collected
+        self._file = tempfile.TemporaryFile()
+        self._recording = False
+        # The file offset of every recorded table, once all tables are recorded
+        self._offsets: Optional[list[int]] = None
+
+    def __call__(self) -> Iterator[pa.Table]:
+        """
+        Iterates over the tables, e.g. when the stream is saved by `StreamingParquetDataset`
+        or `HivePartitionedDataset`.
+
+        Returns:
+            Iterator[pa.Table]: The tables, in the order of the source.
+
+        Raises:
+            RuntimeError: If the first iteration has not recorded all tables, e.g. it failed.
+        """
+        if self._offsets is not None:
+            return self._replay()
+        if self._recording:
+            raise RuntimeError("The tables of the stream were not all recorded")
+
+        self._recording = True
+        return self._record()
+
+    def _record(self) -> Iterator[pa.Table]:
+        """Yields the tables of the source, recording each one in the temporary file."""
+        offsets = []
+        for table in self._tables:
+            offsets.append(self._file.tell())
+            # Every table is a separate IPC stream, so it is replayed as a single table
+            with pa.ipc.new_stream(self._file, table.schema) as writer:
+                writer.write_table(table)
+            yield table
+
+        self._offsets = offsets
+
+    def _replay(self) -> Iterator[pa.Table]:
+        """Yields the recorded tables from the temporary file."""
+        for offset in self._offsets:
+            self._file.seek(offset)
+            yield pa.ipc.open_stream(self._file).read_all()
@@ -0,0 +1,360 @@
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, Callable, Optional
+
+import pyarrow as pa
+from bs4 import NavigableString, Tag
+from bs4.formatter import Formatter
+
+# Maximum `colspan` and `rowspan` of a cell (same as the HTML standard)
+MAX_COLSPAN = 1000
+MAX_ROWSPAN = 65534
+
+# Sections of a table that contain its rows
+TABLE_SECTIONS = ("thead", "tbody", "tfoot")
+
+# Cells of a row
+CELL_TAGS = ("td", "th")
+
+
+@dataclass
+class ParsedTable:
+    """
+    A table parsed from its HTML into a rectangular grid of cleaned cell values.
+
+    Attributes:
+        header (Optional[list[str]]): The cell values of the first row, or None if the
+            table has no rows.
+        rows (list[list[str]]): The cell values of the other rows. Every row has as many
+            cells as the header.
+        raw_html (str): The table in HTML format.
+    """
+
+    header: Optional[list[str]]
+    rows: list[list[str]]
+    raw_html: str
+
+    def to_list(self) -> Optional[list[list[str]]]:
+        """
+        Converts the table to a list of rows, starting with the header.
+
+        Returns:
+            Optional[list[list[str]]]: The rows of the table, where each row is a list of
+                cell values. Returns None if the table has no rows.
+        """
+        if self.header is None:
+            return None
+        return [self.header, *self.rows]
+
+    def to_arrow(self) -> Optional[pa.Table]:
+        """
+        Converts the table to an Arrow table. See `table_to_arrow`.
+
+        Returns:
+            Optional[pa.Table]: The table with a string column per column of the grid.
+                Returns None if the table has no rows.
+        """
+        if self.header is None:
+            return None
+        return table_to_arrow(self.to_list())
+
+
+def parse_table(table: Tag, clean_text: Callable[[str], str]) -> ParsedTable:
+    """
+    Parses an HTML table into a rectangular grid in a single pass over its elements.
+
+    The table is serialised to HTML in the same pass that collects the text of its cells,
+    instead of traversing the table again with `str(table)` and `cell.get_text()`.
+    A cell with a `rowspan` or `colspan` is repeated in every row and column it spans,
+    and rows with fewer cells than the widest row are padded with empty cells. The rows
+    of nested tables are not part of the grid, as nested tables are parsed on their own.
+
+    Args:
+        table (Tag): The BeautifulSoup element representing the HTML table.
+        clean_text (Callable[[str], str]): The function that cleans the text of each cell.
+
+    Returns:
+        ParsedTable: The parsed table and its HTML, which is identical to `str(table)`.
+    """
+    rows = {id(tr): [] for tr in _iter_rows(table)}
+    formatter = table.formatter_for_name("minimal")
+
+    pieces = []
+    cells = []  # (row, cell, strings) of the cells of the table in document order
+    open_cells = []  # cells containing the current element
+    open_tags = []
+
+    for element in chain([table], table.descendants):
+        # Close the tags that ended before this element
+        while open_tags and element.parent is not open_tags[-1]:
+            _close_tag(open_tags.pop(), pieces, open_cells)
+
+        if isinstance(element, Tag):
+            pieces.append(_format_opening_tag(element, formatter))
+            if element.is_empty_element:
+                continue
+            open_tags.append(element)
+            if element.name in CELL_TAGS and id(element.parent) in rows:
+                strings = []
+                cells.append((rows[id(element.parent)], element, strings))
+                open_cells.append((element, strings))
+        else:
+            pieces.append(element.output_ready(formatter))
+            for cell, strings in open_cells:
+                if _is_text(element, cell.interesting_string_types):
+                    strings.append(element)
+
+    while open_tags:
+        _close_tag(open_tags.pop(), pieces, open_cells)
+
+    for row, cell, strings in cells:
+        row.append((cell, clean_text("".join(strings))))
+
+    raw_html = "".join(pieces)
+    # Empty table in All You Need to Know About Childhood Immunisations
+    if not rows:
+        return ParsedTable(header=None, rows=[], raw_html=raw_html)
+
+    grid = _expand_spans(rows.values())
+
+    return ParsedTable(header=grid[0], rows=grid[1:], raw_html=raw_html)
+
+
+def _expand_spans(rows: Iterable[list[tuple[Tag, str]]]) -> list[list[str]]:
+    """
+    Expands the cells spanning several rows or columns into a rectangular grid.
+
+    Args:
+        rows (Iterable[list[tuple[Tag, str]]]): The cells of each row and their cleaned text.
+
+    Returns:
+        list[list[str]]: The rows of the grid, padded with empty cells to the same width.
+    """
+    grid = []
+    # Column -> [number of rows left, cell value] of the cells spanning the next rows
+    spans = {}
+
+    for cells in rows:
+        row = []
+        column = 0
+        for cell, value in cells:
+            # Fill the columns taken by cells spanning from the previous rows
+            while column in spans:
+                row.append(_take_span(spans, column))
+                column += 1
+
+            rowspan = _span(cell, "rowspan", MAX_ROWSPAN)
+            for _ in range(_span(cell, "colspan", MAX_COLSPAN)):
+                # A column taken by a cell spanning from the previous rows keeps its value,
+                # as the cells overlap
+                if column in spans:
+                    row.append(_take_span(spans, column))
+                else:
+                    row.append(value)
+                    if rowspan > 1:
+                        spans[column] = [rowspan - 1, value]
+                column += 1
+
+        # Fill the cells spanning from the previous rows after the last cell of the row
+        for span_column in sorted(c for c in spans if c >= column) if spans else []:
+            row.extend([""] * (span_column - column))
+            row.append(_take_span(spans, span_column))
+            column = span_column + 1
+
+        grid.append(row)
+
+    width = max(len(row) for row in grid)
+    for row in grid:
+        row.extend([""] * (width - len(row)))
+
+    return grid
+
+
+def table_to_arrow(table: list[list[str]]) -> pa.Table:
+    """
+    Converts a table to an Arrow table, e.g. an item of the `extracted_tables` column.
+
+    The first row is the header. Empty column names are replaced by `column_<index>`
+    and duplicated column names are suffixed with `_<count>`, so that the columns can
+    be selected by name.
+
+    Args:
+        table (list[list[str]]): The rows of the table, where each row is a list of cell values.
+
+    Returns:
+        pa.Table: The table with a string column per column of the table.
+    """
+    header, *rows = table
+    width = max(len(row) for row in table)
+
+    names = []
+    counts = {}
+    for index in range(width):
+        name = header[index] if index < len(header) and header[index] else ""
+        name = name or f"column_{index}"
+        counts[name] = counts.get(name, 0) + 1
+        names.append(name if counts[name] == 1 else f"{name}_{counts[name] - 1}")
+
+    columns = [
+        pa.array([row[index] if index < len(row) else "" for row in rows], pa.string())
+        for index in range(width)
+    ]
+
+    return pa.Table.from_arrays(columns, names=names)
+
+
+def _iter_rows(table: Tag) -> Iterator[Tag]:
+    """
+    Iterates over the rows of a table in document order, excluding the rows of nested tables.
+
+    Args:
+        table (Tag): The BeautifulSoup element representing the HTML table.
+
+    Yields:
+        Tag: The tr elements of the table.
+    """
+    found = False
+    for child in _child_tags(table, ("tr", *TABLE_SECTIONS)):
+        if child.name == "tr":
+            found = True
+            yield child
+        else:
+            for tr in _child_tags(child, ("tr",)):
+                found = True
+                yield tr
+
+    # Rows wrapped in other elements are only reachable by searching the whole table
+    if not found:
+        yield from table.find_all("tr")
+
+
+def _child_tags(tag: Tag, names: tuple[str, ...]) -> Iterator[Tag]:
+    """
+    Iterates over the child elements of a tag with the given names.
+
+    NOTE: This is cheaper than `tag.find_all(names, recursive=False)`, which matches
+    every child against a `SoupStrainer`.
+
+    Args:
+        tag (Tag): The parent element.
+        names (tuple[str, ...]): The tag names of the children.
+
+    Yields:
+        Tag: The matching child elements in document order.
+    """
+    for child in tag.children:
+        if isinstance(child, Tag) and child.name in names:
+            yield child
+
+
+def _format_opening_tag(tag: Tag, formatter: Formatter) -> str:
+    """
+    Formats the opening tag of an element as `Tag.decode` does.
+
+    Args:
+        tag (Tag): The element.
+        formatter (Formatter): The formatter of the attribute values.
+
+    Returns:
+        str: The opening tag with its attributes.
+    """
+    prefix = f"{tag.prefix}:" if tag.prefix else ""
+    closing_slash = (
+        (formatter.void_element_close_prefix or "") if tag.is_empty_element else ""
+    )
+    # Most elements of a table have no attributes
+    if not tag.attrs:
+        return f"<{prefix}{tag.name}{closing_slash}>"
+
+    attributes = []
+    for key, value in formatter.attributes(tag):
+        if value is None:
+            attributes.append(key)
+            continue
+        if isinstance(value, (list, tuple)):
+            text = " ".join(value)  # e.g. multi-valued `class` attributes
+        else:
+            text = str(value)
+        text = formatter.quoted_attribute_value(formatter.attribute_value(text))
+        attributes.append(f"{key}={text}")
+
+    attribute_string = " " + " ".join(attributes) if attributes else ""
+
+    return f"<{prefix}{tag.name}{attribute_string}{closing_slash}>"
+
+
+def _close_tag(
+    tag: Tag, pieces: list[str], open_cells: list[tuple[Tag, list[str]]]
+) -> None:
+    """
+    Formats the closing tag of an element, and closes the cell it ends if any.
+
+    Args:
+        tag (Tag): The element.
+        pieces (list[str]): The pieces of the HTML of the table.
+        open_cells (list[tuple[Tag, list[str]]]): The cells containing the element.
+    """
+    prefix = f"{tag.prefix}:" if tag.prefix else ""
+    pieces.append(f"</{prefix}{tag.name}>")
+    if open_cells and open_cells[-1][0] is tag:
+        open_cells.pop()
+
+
+def _is_text(string: NavigableString, types: Any) -> bool:
+    """
+    Checks whether a string is part of the text of a cell, as `Tag.get_text` does.
+
+    Args:
+        string (NavigableString): The string, e.g. a text or a comment.
+        types (Any): The `interesting_string_types` of the cell.
+
+    Returns:
+        bool: Whether the string is part of the text of the cell.
+    """
+    if isinstance(types, type):
+        return type(string) is types
+    return types is None or type(string) in types
+
+
+def _span(cell: Tag, attribute: str, maximum: int) -> int:
+    """
+    Parses the `rowspan` or `colspan` of a cell.
+
+    Args:
+        cell (Tag): The td or th element.
+        attribute (str): The attribute to parse, i.e. "rowspan" or "colspan".
+        maximum (int): The maximum span.
+
+    Returns:
+        int: The span clipped to [1, maximum]. Missing or invalid spans are 1.
+    """
+    value = cell.attrs.get(attribute)
+    if value is None:
+        return 1
+    try:
+        span = int(str(value).strip())
+    except ValueError:
+        return 1
+
+    return min(max(span, 1), maximum)
+
+
+def _take_span(spans: dict[int, list], column: int) -> str:
+    """
+    Takes the value of the cell spanning into the current row at a column.
+
+    Args:
+        spans (dict[int, list]): The number of rows left and the value of the cell
+            spanning at each column.
+        column (int): The column.
+
+    Returns:
+        str: The value of the spanning cell.
+    """
+    span = spans[column]
+    span[0] -= 1
+    if span[0] == 0:
+        del spans[column]
+
+    return span[1]
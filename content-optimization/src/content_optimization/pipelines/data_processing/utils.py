@@ -3,6 +3,17 @@
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+from content_optimization.pipelines.data_processing.rules import (
+    apply_rules,
+    below_word_count_rule,
+    blacklist_rule,
+    duplicated_rule,
+    multilingual_rule,
+    no_extracted_content_rule,
+    post_extraction_rules,
+    recipe_rule,
+)
 from pandas.errors import SettingWithCopyWarning
 
 warnings.filterwarnings("ignore", category=SettingWithCopyWarning)
@@ -62,6 +73,64 @@ def select_and_rename_columns(
     return df
 
 
+def convert_string_columns(df: pd.DataFrame, string_dtype: str) -> pd.DataFrame:
+    """
+    Converts the text columns of a DataFrame to the given string dtype.
+
+    A text column is a column of strings and null values only. With `string[pyarrow]`,
+    the strings are stored in a single Arrow buffer instead of as Python objects, and
+    the `.str` methods run as vectorised `pyarrow.compute` kernels.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to convert.
+        string_dtype (str): The dtype of the text columns, either "object" to keep the
+            columns as they are or "string[pyarrow]".
+
+    Returns:
+        pd.DataFrame: The DataFrame with the text columns converted.
+
+    Raises:
+        AssertionError: If `string_dtype` is not valid.
+    """
+    assert string_dtype in ["object", "string[pyarrow]"], "Invalid `string_dtype`"
+    if string_dtype == "object":
+        return df
+
+    for column in df.columns:
+        dtype = df[column].dtype
+        # Columns of only null values are left as they are
+        if isinstance(dtype, pd.StringDtype) or (
+            dtype == object and pd.api.types.infer_dtype(df[column]) == "string"
+        ):
+            df[column] = df[column].astype(string_dtype)
+
+    return df
+
+
+def strip_whitespace(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Strips leading and trailing whitespaces from all strings in a DataFrame.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to strip.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the strings stripped.
+
+    Note:
+        Columns of `string[pyarrow]` dtype are stripped by the `utf8_trim_whitespace` kernel.
+        Other non-string values in `object` columns are kept as they are.
+    """
+    for column in df.columns:
+        dtype = df[column].dtype
+        if isinstance(dtype, pd.StringDtype):
+            df[column] = df[column].str.strip()
+        elif dtype == object:
+            df[column] = [x.strip() if isinstance(x, str) else x for x in df[column]]
+
+    return df
+
+
 def flag_articles_to_remove_before_extraction(
     df: pd.DataFrame, regex: str = r"(<[div|p|h2].*?>)"
 ) -> pd.DataFrame:
@@ -71,6 +140,10 @@ def flag_articles_to_remove_before_extraction(
     exceeded maximum cell size" error. The default regex pattern flags out dummy
     content. Dummy content are content without the necessary HTML tags.
 
+    The `content_body` column is scanned once for the regex pattern and once for the
+    Excel error with vectorised string methods, which run as `pyarrow.compute` kernels
+    on `string[pyarrow]` columns. `to_remove` and `remove_type` are then assigned together.
+
     Args:
         df (pd.DataFrame): The DataFrame containing the articles.
         regex (str):
@@ -82,38 +155,36 @@ def flag_articles_to_remove_before_extraction(
     """
     excel_error = "Value exceeded maximum cell size"
 
-    def apply_regex(x: str) -> bool:
-        # Define the regex pattern
-        pattern = re.compile(regex)
-
-        if pd.isna(x) or excel_error in str(x):
-            return True
-        return bool(pattern.search(str(x)))
-
-    # Update `to_remove`
-    df["to_remove"] = df["content_body"].apply(
-        lambda x: (False if pd.notna(x) and re.search(regex, str(x)) else True)
+    content = df["content_body"]
+    if isinstance(content.dtype, pd.StringDtype):
+        # The regex kernel of `pyarrow.compute` is faster than its substring kernel
+        excel_error_pattern, regex_excel_error = re.escape(excel_error), True
+    else:
+        # Non-string values are searched as strings
+        content = content.astype(object).map(str, na_action="ignore")
+        excel_error_pattern, regex_excel_error = excel_error, False
+
+    is_na = content.isna().to_numpy()
+    with warnings.catch_warnings():
+        # The default regex pattern has a match group, which is irrelevant for a search
+        warnings.filterwarnings("ignore", "This pattern .* has match groups")
+        has_tags = content.str.contains(regex, na=False).to_numpy(dtype=bool)
+    is_excel_error = content.str.contains(
+        excel_error_pattern, regex=regex_excel_error, na=False
+    ).to_numpy(dtype=bool)
+    no_tags = (
+        ~is_na & ~is_excel_error & ~has_tags & df["content_category"].notna().to_numpy()
     )
 
-    # Get indexes for all NaN content body
-    na_indexes = df[df["content_body"].isna()].index
-    # Get all indexes for content body with Excel error
-    excel_error_indexes = df.query(
-        f"content_body.str.contains('{excel_error}', na=False)"
-    ).index
-    # Get all indexes content body without HTML tags indexes
-    no_tags_indexes = df[
-        ~df.query("content_category.notna()")["content_body"].apply(
-            lambda x: apply_regex(x)
-        )
-    ].index
-
-    df["remove_type"] = None
+    # Update `to_remove`
+    df["to_remove"] = is_na | ~has_tags
 
-    # Set `remove_type` for all indexes
-    df.loc[na_indexes, "remove_type"] = "NaN"
-    df.loc[excel_error_indexes, "remove_type"] = "Excel Error"
-    df.loc[no_tags_indexes, "remove_type"] = "No HTML Tags"
+    # Set `remove_type`, where the conditions are mutually exclusive
+    df["remove_type"] = np.select(
+        [is_na, is_excel_error, no_tags],
+        ["NaN", "Excel Error", "No HTML Tags"],
+        default=None,
+    )
 
     return df
 
@@ -131,21 +202,7 @@ def flag_no_extracted_content(df: pd.DataFrame, whitelist: list[int]) -> pd.Data
             The modified DataFrame with the `to_remove` and `remove_type` columns updated. The `remove_type`
             column is updated with the type of "No Extracted Content".
     """
-    # All content ids without extracted content
-    no_extracted_content_ids = set(
-        df[df["extracted_content_body"] == ""].id.to_list()
-    ).difference(set(whitelist))
-
-    # All content without extracted content indexes
-    no_extracted_content_indexes = df.query(
-        f"id in {list(no_extracted_content_ids)}"
-    ).index
-
-    # Update `to_remove`
-    df.loc[no_extracted_content_indexes, "to_remove"] = True
-
-    # Set `remove_type` for all indexes
-    df.loc[no_extracted_content_indexes, "remove_type"] = "No Extracted Content"
+    df, _ = apply_rules(df, [no_extracted_content_rule()], whitelist)
 
     return df
 
@@ -174,42 +231,7 @@ def flag_duplicated(
     Raises:
         AssertionError: If the `column` parameter is None or not valid.
     """
-    assert column is not None, "`column` cannot be None"
-    assert column in ["extracted_content_body", "full_url"], "Invalid column"
-
-    if column == "extracted_content_body":
-        duplicated_df = df[
-            (df[column].duplicated())  # we want duplicated articles
-            & (df[column].notna())  # ignore null values
-            & (df[column] != "")  # ignore empty extracted content
-            & (~df["to_remove"])  # ignore articles that were already flagged
-        ]
-        value = "Duplicated Content"
-
-    elif column == "full_url":
-        duplicated_df = df[
-            (df[column].duplicated())  # we want duplicated URLs
-            & (df[column].notna())  # ignore null values
-            & (~df["to_remove"])  # ignore articles that were already flagged
-        ]
-        value = "Duplicated URL"
-
-    for i in range(len(duplicated_df)):
-        # Get all indexes for duplicated content or URL
-        duplicated_indexes = df[df[column] == duplicated_df.iloc[i][column]].index
-
-        # Note: We could simply update all at once at `duplicated_indexes`
-        # However, we'd overwrite the previous flags. This is kept as is, for now.
-        for j in duplicated_indexes:
-            if not df.iloc[j]["to_remove"]:
-                # Ignore whitelisted articles
-                if df.iloc[j]["id"] in whitelist:
-                    continue
-                # Update `to_remove`
-                df.at[j, "to_remove"] = True
-
-                # Set `remove_type` for all indexes (either "Duplicated Content" or "Duplicated URL")
-                df.at[j, "remove_type"] = value
+    df, _ = apply_rules(df, [duplicated_rule(column)], whitelist)
 
     return df
 
@@ -228,60 +250,7 @@ def flag_recipe_articles(df: pd.DataFrame, whitelist: list[int]) -> pd.DataFrame
             The modified DataFrame with the `to_remove` and `remove_type` columns updated. The `remove_type`
             column is updated with the type of "Recipe".
     """
-
-    # `title` and `keywords` column
-    recipe_title_keywords_indexes = np.argwhere(
-        [
-            (
-                True
-                if (
-                    (title is not None and re.search(r"[rR]ecipes?", title))
-                    or (keywords is not None and re.search(r"[rR]ecipes?", keywords))
-                )
-                and (not to_remove)
-                else False
-            )
-            for title, keywords, to_remove in zip(
-                df["title"], df["keywords"], df["to_remove"]
-            )
-        ]
-    ).flatten()
-
-    # `extracted_content_body` column
-    recipe_content_indexes = np.argwhere(
-        [
-            (
-                True
-                if (
-                    content is not None
-                    and re.search(r"what [do ]?you need", content.lower())
-                    and re.search(r"how to cook [this dish]*", content.lower())
-                )
-                and (not to_remove)
-                else False
-            )
-            for content, to_remove in zip(df["extracted_content_body"], df["to_remove"])
-        ]
-    ).flatten()
-
-    # All recipe article indexes
-    all_recipe_indexes = list(
-        set(recipe_title_keywords_indexes).union(set(recipe_content_indexes))
-    )
-
-    # All content ids that are flagged as recipes
-    recipe_ids = set(df.iloc[all_recipe_indexes].id.to_list()).difference(
-        set(whitelist)
-    )
-
-    # All content below word count cutoff indexes
-    recipe_indexes = df.query(f"id in {list(recipe_ids)}").index
-
-    # Update `to_remove`
-    df.loc[recipe_indexes, "to_remove"] = True
-
-    # Set `remove_type` for all indexes
-    df.loc[recipe_indexes, "remove_type"] = "Recipe"
+    df, _ = apply_rules(df, [recipe_rule()], whitelist)
 
     return df
 
@@ -304,26 +273,7 @@ def flag_below_word_count_cutoff(
             The DataFrame with a new column `to_remove` indicating whether an article should be
             removed. The `remove_type` column is also updated with the type of "Below Word Count".
     """
-    indexes = df.query("to_remove != True")["extracted_content_body"].apply(
-        lambda x: len(x.split()) > 0 and len(x.split()) <= word_count_cutoff
-    )
-
-    # Get the indexes of the True values
-    all_word_count_indexes = indexes[indexes].index
-
-    # All content ids below word count cutoff
-    word_count_ids = set(df.iloc[all_word_count_indexes].id.to_list()).difference(
-        set(whitelist)
-    )
-
-    # All content below word count cutoff indexes
-    word_count_indexes = df.query(f"id in {list(word_count_ids)}").index
-
-    # Update `to_remove`
-    df.loc[word_count_indexes, "to_remove"] = True
-
-    # Set `remove_type` for all indexes
-    df.loc[word_count_indexes, "remove_type"] = "Below Word Count"
+    df, _ = apply_rules(df, [below_word_count_rule(word_count_cutoff)], whitelist)
 
     return df
 
@@ -341,50 +291,7 @@ def flag_multilingual_content(df: pd.DataFrame, whitelist: list[int]) -> pd.Data
             The DataFrame with a new column `to_remove` indicating whether an article should be
             removed. The `remove_type` column is also updated with the type of "Multilingual".
     """
-
-    def find_multilingual(friendly_url: str | None = None) -> bool:
-        """
-        A function that checks if a friendly URL is purely Chinese, Malay, or Tamil.
-
-        Args:
-            friendly_url (str | None): The friendly URL to check.
-
-        Returns:
-            bool: True if the friendly URL is purely Chinese, Malay, or Tamil, False otherwise.
-        """
-        # Return false if value is None
-        if friendly_url is None:
-            return False
-
-        # Get the last word from the friendly_url
-        check_lang = friendly_url.split("_")[-1].split("-")[-1]
-        return True if re.search("(chinese|tamil|malay)", check_lang.lower()) else False
-
-    # Find articles that are purely Chinese, Malay or Tamil
-    all_multilingual_indexes = df.index[
-        df["friendly_url"].apply(find_multilingual)
-    ].to_list()
-
-    # Find articles that are already considered as `to_remove`
-    removed_indexes = df.index[df["to_remove"]].to_list()
-
-    # Filter out `removed_indexes` from all_multilingual_indexes
-    filtered_multilingual_indexes = list(
-        set(all_multilingual_indexes).difference(set(removed_indexes))
-    )
-    # Filter out multilingual articles that are not whitelisted
-    multilingual_ids = set(
-        df.iloc[filtered_multilingual_indexes].id.to_list()
-    ).difference(set(whitelist))
-
-    # All content mulitlingual indexes
-    multilingual_indexes = df.query(f"id in {list(multilingual_ids)}").index
-
-    # Update `to_remove`
-    df.loc[multilingual_indexes, "to_remove"] = True
-
-    # Set `remove_type` for all indexes
-    df.loc[multilingual_indexes, "remove_type"] = "Multilingual"
+    df, _ = apply_rules(df, [multilingual_rule()], whitelist)
 
     return df
 
@@ -402,10 +309,7 @@ def flag_articles_via_blacklist(
     Returns:
         pd.DataFrame: The DataFrame with updated flags for articles to remove.
     """
-    for article_id, remove_type in blacklist.items():
-        idx = df.loc[df["id"] == article_id].index
-        df.loc[idx, "to_remove"] = True
-        df.loc[idx, "remove_type"] = remove_type
+    df, _ = apply_rules(df, [blacklist_rule(blacklist)], whitelist=[])
 
     return df
 
@@ -415,10 +319,14 @@ def flag_articles_to_remove_after_extraction(
     word_count_cutoff: int,
     whitelist: list[int],
     blacklist: dict[int, str],
-) -> pd.DataFrame:
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Flags articles to remove after extraction based on several different criteria.
 
+    The criteria are applied as vectorised rules in order of precedence: no extracted content,
+    duplicated content, duplicated URL, recipe, multilingual, below word count and blacklist.
+    See `post_extraction_rules`.
+
     Args:
         df (pd.DataFrame): The DataFrame containing the articles.
         word_count_cutoff (int): The word count threshold for flagging articles.
@@ -426,66 +334,12 @@ def flag_articles_to_remove_after_extraction(
         blacklist (dict[int, str]): The list of article IDs to remove. See https://bitly.cx/f8FIk.
 
     Returns:
-        pd.DataFrame: The DataFrame with updated flags for articles to remove.
-    """
-    df = flag_no_extracted_content(df, whitelist)
-    df = flag_duplicated(df, whitelist, column="extracted_content_body")
-    df = flag_duplicated(df, whitelist, column="full_url")
-    df = flag_recipe_articles(df, whitelist)
-    df = flag_multilingual_content(df, whitelist)
-    df = flag_below_word_count_cutoff(df, word_count_cutoff, whitelist)
-    df = flag_articles_via_blacklist(df, blacklist)
-
-    return df
-
-
-def add_content_body(df: pd.DataFrame, excel_errors: dict[str, str]) -> pd.DataFrame:
-    """
-
-    Args:
-        df (pd.DataFrame): The DataFrame containing the articles
-        excel_errors (dict[str,str]): A dictionary that maps each article friendly url to the updated content body
-
-    Returns:
-        pd.DataFrame: The DataFrame with updated content body for articles with Excel errors.
-
-    """
-    for friendly_url, text in excel_errors.items():
-        # Fetch rows where `friendly_url` column value must match filename
-        article_index = df.index[df["friendly_url"] == friendly_url]
-        # Skip if the index is empty
-        if article_index.empty:
-            continue
-        # Assign Raw HTML content to `content_body` column
-        df.loc[article_index, "content_body"] = text
-
-    return df
-
-
-def add_updated_urls(
-    df: pd.DataFrame, new_urls: dict[str, dict[str, str]]
-) -> pd.DataFrame:
-    """
-
-    Args:
-        df (pd.DataFrame): The DataFrame containing the articles
-        new_urls: A dictionary that maps each article id to the updated full_url
-
-    Returns:
-        pd.DataFrame: The DataFrame with updated full_url for articles with known 404 errors
-
+        tuple[pd.DataFrame, pd.DataFrame]: The DataFrame with updated flags for articles to remove,
+            and the report of every rule. See `apply_rules`.
     """
-    for article_id, url in new_urls.items():
-        # Fetch rows where `id` column value must match article_id
-        article_index = df.index[df["id"] == article_id]
-        # Skip if the index is empty
-        if article_index.empty:
-            continue
-        # Assign updated_url to `full_url` and `full_url2` column
-        df.loc[article_index, "full_url"] = url
-        df.loc[article_index, "full_url2"] = url
-
-    return df
+    return apply_rules(
+        df, post_extraction_rules(word_count_cutoff, blacklist), whitelist
+    )
 
 
 def invert_ia_mappings(
@@ -515,68 +369,160 @@ def invert_ia_mappings(
     return invert_mappings
 
 
+def compile_ia_mappings_table(
+    inverted_mappings: dict[str, dict[str, dict[str, str]]]
+) -> pd.DataFrame:
+    """
+    Compiles the inverted IA mappings of every level into a single lookup table.
+
+    Args:
+        inverted_mappings (dict[str, dict[str, dict[str, str]]]): A dictionary that maps the
+            new column name of every IA mapping level (i.e. "l1_mappings") to its inverted
+            mapping. See `invert_ia_mappings`.
+
+    Returns:
+        pd.DataFrame: The lookup table indexed by content category and article category name,
+            with the stripped new IA mapping of every level as a column. Article category names
+            without an IA mapping for a level have a null value in that column.
+    """
+    tables = []
+    for new_column_name, mappings in inverted_mappings.items():
+        records = [
+            (content_category, category_name, ia_map.strip())
+            for content_category, map_dicts in mappings.items()
+            for category_name, ia_map in map_dicts.items()
+        ]
+        table = pd.DataFrame(
+            records, columns=["content_category", "category_name", new_column_name]
+        )
+        tables.append(table.set_index(["content_category", "category_name"]))
+
+    return pd.concat(tables, axis=1)
+
+
 def map_category_names(
-    mappings: dict[str, dict[str, str]],
+    ia_mappings: pd.DataFrame,
     df: pd.DataFrame,
     content_category_column: str,
     reference_column: str,
-    new_column_name: str,
 ) -> pd.DataFrame:
     """
+    Maps the article category names of every article to the new IA mapping of every level.
+
+    The article category names are split and exploded once, looked up in the IA mappings
+    table with a single merge, and aggregated back per article for all levels at once.
 
     Args:
-        mappings (dict[str, dict[str, str]]): A dictionary that maps the article category name to new IA mapping for each content category
+        ia_mappings (pd.DataFrame): The IA mappings table. See `compile_ia_mappings_table`.
         df (pd.DataFrame): The DataFrame containing the articles
         content_category_column (str): Refer to the column name of the content category (i.e. "content_category")
         reference_column (str): Refer to the column name of the article category (i.e. "article_category_names")
-        new_column_name (str): The newly created column name for the IA mappings
 
     Returns:
-        pd.DataFrame: The DataFrame with updated IA mapping for each content category
+        pd.DataFrame: The DataFrame with updated IA mapping for each content category, with one
+            new column per column of the IA mappings table (i.e. "l1_mappings" and "l2_mappings")
 
+    Note:
+        The new IA mappings of an article are joined by " | " in the order they are first
+        mapped from its article category names.
     """
-    # Initially assign the new column to None
-    df[new_column_name] = None
+    new_column_names = list(ia_mappings.columns)
 
-    # Iterate through all rows in the dataframe
-    for index, row in df.iterrows():
-        # Get the assigned value of the "article_category_names" column
-        category_string = row[reference_column]
-        # Get content category of the article
-        content_category = row[content_category_column]
-        # Get the IA Mapping for the respective content category
-        category_map = mappings.get(content_category, None)
+    # Initially assign the new columns to None
+    for new_column_name in new_column_names:
+        df[new_column_name] = None
 
-        # Skip if the assigned value is not a string
-        if not isinstance(category_string, str):
-            continue
+    # Skip if the assigned value is not a string
+    is_string = df[reference_column].apply(lambda x: isinstance(x, str))
 
-        # Replace Ampersand symbol ("&") to "and"
-        category_string = category_string.replace("&", "and")
-
-        # Assign the new value to the "article_category_names" column
-        df.at[index, reference_column] = category_string
-        # Remove empty stings
-        categories_list = list(
-            filter(lambda x: len(x.strip()) > 0, category_string.split(","))
-        )
+    # Replace Ampersand symbol ("&") to "and" and assign it back to the "article_category_names" column
+    category_strings = df.loc[is_string, reference_column].str.replace(
+        "&", "and", regex=False
+    )
+    df.loc[is_string, reference_column] = category_strings
+
+    # One row per article category name, indexed by the article; remove empty strings
+    category_names = category_strings.str.split(",").explode()
+    category_names = category_names[category_names.str.strip().str.len() > 0]
+
+    lookup = pd.DataFrame(
+        {
+            "index": category_names.index,
+            "content_category": df.loc[
+                category_names.index, content_category_column
+            ].to_numpy(),
+            "category_name": category_names.to_numpy(),
+        }
+    )
+    # An inner merge keeps the order of the article category names
+    mapped = lookup.merge(
+        ia_mappings,
+        how="inner",
+        left_on=["content_category", "category_name"],
+        right_index=True,
+    )
 
-        # If the IA Mapping exists for the given content category, perform the IA Mapping for the article
-        if category_map is not None:
-            for ind, category_name in enumerate(categories_list):
-                # Assign the new IA Mapping to the article if it exists. Otherwise, assign a null value
-                result = category_map.get(category_name, None)
-                categories_list[ind] = result.strip() if result is not None else None
+    for new_column_name in new_column_names:
+        # Keep unique and non-null values only
+        values = mapped[["index", new_column_name]].dropna().drop_duplicates()
+        if values.empty:
+            continue
 
-            # Keep unique and non-null values only
-            unique_categories_list = list(
-                filter(lambda x: x is not None, list(set(categories_list)))
-            )
+        # One column per position of the IA mapping within its article
+        positions = values.groupby("index", sort=False).cumcount()
+        wide = values.assign(position=positions).pivot(
+            index="index", columns="position", values=new_column_name
+        )
 
-            # Assign the new mappings as a joined string and assign a null value if empty string
-            joined_string = " | ".join(unique_categories_list)
-            df.at[index, new_column_name] = (
-                joined_string.strip() if joined_string else None
+        # Assign the new mappings as a joined string and assign a null value if empty string
+        joined = wide[0]
+        for position in wide.columns[1:]:
+            joined = joined.where(
+                wide[position].isna(), joined + " | " + wide[position]
             )
+        joined = joined.str.strip()
+        joined = joined[joined != ""]
+        df.loc[joined.index, new_column_name] = joined
 
     return df
+
+
+def unify_schemas(schemas: list[pa.Schema]) -> pa.Schema:
+    """
+    Unifies the Arrow schemas of multiple partitions into a single schema.
+
+    Fields are ordered by their first appearance across the schemas, as in `pd.concat`.
+    Types are promoted permissively, e.g. a column of null values in one partition
+    takes the type of the same column in the other partitions.
+
+    Args:
+        schemas (list[pa.Schema]): The schemas of the partitions.
+
+    Returns:
+        pa.Schema: The unified schema without any pandas metadata.
+    """
+    schemas = [schema.remove_metadata() for schema in schemas]
+
+    return pa.unify_schemas(schemas, promote_options="permissive")
+
+
+def to_unified_table(df: pd.DataFrame, schema: pa.Schema) -> pa.Table:
+    """
+    Converts a partition to an Arrow table with the unified schema.
+
+    Args:
+        df (pd.DataFrame): The DataFrame of the partition.
+        schema (pa.Schema): The unified schema. See `unify_schemas`.
+
+    Returns:
+        pa.Table: The Arrow table with the columns of the unified schema, where the
+            columns missing from the partition are filled with null values.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # Add the columns missing from the partition
+    for field in schema:
+        if field.name not in table.column_names:
+            table = table.append_column(field, pa.nulls(len(table), field.type))
+
+    return table.select(schema.names).cast(schema)
@@ -3,16 +3,24 @@
 generated using Kedro 0.19.6
 """
 
-from typing import Any
+from typing import Any, Callable, Iterator, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from content_optimization.pipelines.feature_engineering.text_index import (
+    TEXT_INDEX_SCHEMA,
+    build_text_index,
+    load_tokenizer,
+)
 from keybert import KeyBERT
 from keyphrase_vectorizers import KeyphraseTfidfVectorizer
 from pytictoc import TicToc
 
 
 def extract_keywords(
-    merged_data: pd.DataFrame,
+    merged_data: ds.Dataset,
     cfg: dict[str, Any],
     only_confirmed_option: list[str],
     all_option: list[str],
@@ -23,13 +31,15 @@ def extract_keywords(
     use_mmr: bool,
     diversity: float,
     top_n: int,
+    columns: Optional[list[str]] = None,
 ) -> pd.DataFrame:
     """
     Extract keywords using KeyBERT model based on the provided parameters and
     return the DataFrame with the added `keybert_keywords` column containing the keywords.
 
     Args:
-        merged_data (pd.DataFrame): The DataFrame containing the merged data.
+        merged_data (ds.Dataset): The merged data partitioned by content category. The subset of
+            articles is pushed down into the Parquet scan, so only the selected partitions are read.
         cfg (dict[str, Any]): The configuration dictionary containing the options to subset the merged data.
         only_confirmed_option (list[str]): The list of confirmed content categories if option is `only_confirmed`.
         all_option (list[str]): The list of all content categories if option is `all`.
@@ -40,6 +50,8 @@ def extract_keywords(
         use_mmr (bool): Whether to use Maximal Marginal Relevance (MMR) for keyphrase extraction.
         diversity (float): The diversity parameter for keyphrase extraction.
         top_n (int): The number of top keywords to extract.
+        columns (Optional[list[str]]): The columns of the merged data to read, in addition to
+            `extracted_content_body`. Defaults to None, which reads all columns.
 
     Returns:
          pd.DataFrame: The dataframe with the extracted keywords.
@@ -53,24 +65,30 @@ def extract_keywords(
         assert set(only_confirmed_option).issubset(
             set(all_option)
         ), "Invalid option(s). Please ensure selected content categories exist."
-        filtered_data = merged_data.query("content_category in @only_confirmed_option")
+        expression = pc.field("content_category").isin(only_confirmed_option)
     elif option == "all":
-        filtered_data = merged_data.copy()
+        expression = None
     else:
         assert (
             option in all_option
         ), "Invalid option. Please ensure selected content category exists."
-        filtered_data = merged_data.query("content_category == @option")
+        expression = pc.field("content_category") == option
 
     # To remove flagged articles or not and to subset by contributor
+    subset = pc.field("pr_name") == contributor
     if to_remove:
-        filtered_data = filtered_data.query(
-            f"pr_name == '{contributor}' and to_remove == {not to_remove}"
-        ).reset_index(drop=True)
-    else:
-        filtered_data = filtered_data.query(f"pr_name == '{contributor}'").reset_index(
-            drop=True
-        )
+        subset = subset & (pc.field("to_remove") == (not to_remove))
+    expression = subset if expression is None else expression & subset
+
+    # Only read the columns needed
+    if columns is not None and "extracted_content_body" not in columns:
+        columns = [*columns, "extracted_content_body"]
+
+    filtered_data = (
+        merged_data.to_table(columns=columns, filter=expression)
+        .to_pandas()
+        .reset_index(drop=True)
+    )
 
     # Extract the raw content body text
     docs = filtered_data["extracted_content_body"].to_list()
@@ -104,3 +122,53 @@ def extract_keywords(
     filtered_data_with_keywords[f"keywords_{model}"] = keywords
 
     return filtered_data_with_keywords
+
+
+def index_text(
+    merged_data: ds.Dataset,
+    tokenizer: Optional[str] = None,
+    batch_size: int = 1024,
+) -> Callable[[], Iterator[pa.Table]]:
+    """
+    Computes the sentence offsets, word counts and token counts of the extracted content body
+    of every article once, so that consumers can read them instead of tokenising the text again.
+
+    The merged data is read in batches of `batch_size` articles, and the text index of each batch
+    is built with `build_text_index` and streamed to the `text_index` dataset. For example, an
+    article can be split into the chunks of the embedding model with `chunk_sentences`.
+
+    Args:
+        merged_data (ds.Dataset): The merged data partitioned by content category. Only the
+            `id`, `content_category` and `extracted_content_body` columns are read.
+        tokenizer (Optional[str]): The Hugging Face tokenizer whose tokens are counted, e.g. the
+            tokenizer of the embedding model. Defaults to None, which leaves the token counts null.
+        batch_size (int): The number of articles indexed at a time. Defaults to 1024.
+
+    Returns:
+        Callable[[], Iterator[pa.Table]]: A callable that returns the stream of the text index of
+            every batch with the `TEXT_INDEX_SCHEMA`, to be saved by `HivePartitionedDataset`.
+    """
+    # Load the tokenizer once, when the node runs
+    tokenizer = load_tokenizer(tokenizer) if tokenizer is not None else None
+
+    def stream_text_index() -> Iterator[pa.Table]:
+        num_batches = 0
+        for batch in merged_data.to_batches(
+            columns=["id", "content_category", "extracted_content_body"],
+            batch_size=batch_size,
+        ):
+            if batch.num_rows == 0:
+                continue
+            num_batches += 1
+            yield build_text_index(
+                batch.column("id").to_pylist(),
+                batch.column("content_category").to_pylist(),
+                batch.column("extracted_content_body").to_pylist(),
+                tokenizer,
+            )
+
+        # The dataset needs a table to save the schema from
+        if num_batches == 0:
+            yield TEXT_INDEX_SCHEMA.empty_table()
+
+    return stream_text_index
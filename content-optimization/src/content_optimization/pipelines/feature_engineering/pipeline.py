@@ -3,7 +3,10 @@
 generated using Kedro 0.19.6
 """
 
-from content_optimization.pipelines.feature_engineering.nodes import extract_keywords
+from content_optimization.pipelines.feature_engineering.nodes import (
+    extract_keywords,
+    index_text,
+)
 from kedro.pipeline import Pipeline, node, pipeline
 
 
@@ -13,7 +16,7 @@ def create_pipeline(**kwargs) -> Pipeline:
             node(
                 func=extract_keywords,
                 inputs=[
-                    "merged_data",
+                    "merged_data_partitioned",
                     "params:cfg",
                     "params:selection_options.only_confirmed",
                     "params:selection_options.all",
@@ -24,9 +27,20 @@ def create_pipeline(**kwargs) -> Pipeline:
                     "params:keywords.use_mmr",
                     "params:keywords.diversity",
                     "params:keywords.top_n",
+                    "params:keywords.columns",
                 ],
                 outputs="filtered_data_with_keywords",
                 name="extract_keywords_node",
             ),
+            node(
+                func=index_text,
+                inputs=[
+                    "merged_data_partitioned",
+                    "params:text_index.tokenizer",
+                    "params:text_index.batch_size",
+                ],
+                outputs="text_index",
+                name="index_text_node",
+            ),
         ]
     )
@@ -0,0 +1,240 @@
+import re
+from collections.abc import Iterable
+from typing import Any, Optional
+
+import numpy as np
+import pyarrow as pa
+
+# A sentence runs from a non-whitespace character to the first sentence-final punctuation
+# followed by whitespace, or to the end of its line. Lines of the extracted content body
+# are paragraphs, list items or headers, so a sentence never spans lines
+# NOTE: Sentences only end at whitespace, so the words of the sentences of a text are
+# exactly the words of the text, i.e. `text.split()`
+SENTENCE_PATTERN = re.compile(
+    r"\S[^\n]*?(?:[.!?]+[\"')\]]*(?=\s)|(?=[^\S\n]*(?:\n|\Z)))"
+)
+
+# Abbreviations that do not end a sentence, e.g. "Dr. Tan" and "e.g. fever"
+ABBREVIATIONS = frozenset(
+    [
+        "dr.",
+        "mr.",
+        "mrs.",
+        "ms.",
+        "prof.",
+        "st.",
+        "no.",
+        "vs.",
+        "e.g.",
+        "i.e.",
+        "approx.",
+    ]
+)
+
+# Schema of the `text_index` dataset in `data/04_feature`. Offsets are character offsets
+# in `extracted_content_body`, so `text[start:end]` is a sentence
+TEXT_INDEX_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("content_category", pa.string()),
+        ("sentence_starts", pa.list_(pa.int32())),
+        ("sentence_ends", pa.list_(pa.int32())),
+        ("sentence_word_counts", pa.list_(pa.int32())),
+        ("sentence_token_counts", pa.list_(pa.int32())),
+        ("word_count", pa.int32()),
+        ("token_count", pa.int32()),
+    ]
+)
+
+
+def split_sentences(text: str) -> list[tuple[int, int]]:
+    """
+    Splits a text into sentences. See `SENTENCE_PATTERN`.
+
+    Args:
+        text (str): The text to split, e.g. an extracted content body.
+
+    Returns:
+        list[tuple[int, int]]: The start and end offsets of each sentence in the text.
+    """
+    spans = []
+    for match in SENTENCE_PATTERN.finditer(text):
+        start, end = match.span()
+        # Join a sentence ending with an abbreviation to the next sentence on the same line
+        if spans and "\n" not in text[spans[-1][1] : start]:
+            previous_start, previous_end = spans[-1]
+            last_word = text[previous_start:previous_end].rsplit(maxsplit=1)[-1]
+            if last_word.lower().lstrip("(") in ABBREVIATIONS:
+                spans[-1] = (previous_start, end)
+                continue
+        spans.append((start, end))
+
+    return spans
+
+
+def load_tokenizer(name: str) -> Any:
+    """
+    Loads a Hugging Face tokenizer, e.g. the tokenizer of the embedding model.
+
+    Args:
+        name (str): The name of the tokenizer on the Hugging Face Hub, e.g.
+            "sentence-transformers/all-MiniLM-L6-v2", or the path to a local tokenizer.
+
+    Returns:
+        Any: The tokenizer, a `transformers.PreTrainedTokenizerBase`.
+    """
+    # Imported here as `transformers` is an optional dependency
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(name)
+
+
+def count_tokens(sentences: list[str], tokenizer: Any) -> list[int]:
+    """
+    Counts the tokens of each sentence in a single call to the tokenizer.
+
+    Special tokens (e.g. `[CLS]` and `[SEP]`) are not counted, as they are added once per
+    sequence rather than per sentence. See `tokenizer.num_special_tokens_to_add()`.
+
+    Args:
+        sentences (list[str]): The sentences.
+        tokenizer (Any): A Hugging Face tokenizer. See `load_tokenizer`.
+
+    Returns:
+        list[int]: The number of tokens of each sentence.
+    """
+    if not sentences:
+        return []
+    encodings = tokenizer(
+        sentences,
+        add_special_tokens=False,
+        return_attention_mask=False,
+        return_token_type_ids=False,
+    )
+    return [len(input_ids) for input_ids in encodings["input_ids"]]
+
+
+def build_text_index(
+    ids: Iterable[int],
+    content_categories: Iterable[str],
+    texts: Iterable[Optional[str]],
+    tokenizer: Optional[Any] = None,
+) -> pa.Table:
+    """
+    Builds the sentence offsets, word counts and token counts of a batch of articles.
+
+    The offsets and counts of the sentences of all articles are stored as flat arrays with
+    an offset per article, i.e. Arrow list arrays, and the sentences of the whole batch are
+    tokenised in a single call to the tokenizer.
+
+    Args:
+        ids (Iterable[int]): The IDs of the articles.
+        content_categories (Iterable[str]): The content categories of the articles.
+        texts (Iterable[Optional[str]]): The extracted content bodies of the articles.
+        tokenizer (Optional[Any]): A Hugging Face tokenizer. See `load_tokenizer`.
+            Defaults to None, which leaves the token counts null.
+
+    Returns:
+        pa.Table: The text index of the articles with the `TEXT_INDEX_SCHEMA`. The lists and
+            counts of articles without an extracted content body are null.
+    """
+    ids, content_categories, texts = list(ids), list(content_categories), list(texts)
+
+    list_offsets = [0]
+    starts, ends, word_counts = [], [], []
+    sentences = []
+    is_null = []
+    for text in texts:
+        is_null.append(text is None)
+        if text is not None:
+            for start, end in split_sentences(text):
+                sentence = text[start:end]
+                starts.append(start)
+                ends.append(end)
+                word_counts.append(len(sentence.split()))
+                sentences.append(sentence)
+        list_offsets.append(len(starts))
+
+    list_offsets = pa.array(list_offsets, type=pa.int32())
+    mask = pa.array(is_null, type=pa.bool_())
+
+    def to_list_array(values: list[int]) -> pa.ListArray:
+        return pa.ListArray.from_arrays(
+            list_offsets, pa.array(values, type=pa.int32()), mask=mask
+        )
+
+    def to_totals(values: list[int]) -> pa.Array:
+        # Sum the values of the sentences of each article from their cumulative sums
+        cumsum = np.concatenate([[0], np.cumsum(values, dtype=np.int64)])
+        offsets = list_offsets.to_numpy()
+        return pa.array(
+            cumsum[offsets[1:]] - cumsum[offsets[:-1]],
+            type=pa.int32(),
+            mask=np.asarray(is_null, dtype=bool),
+        )
+
+    sentence_word_counts = to_list_array(word_counts)
+    word_count = to_totals(word_counts)
+    if tokenizer is None:
+        sentence_token_counts = pa.nulls(len(texts), type=pa.list_(pa.int32()))
+        token_count = pa.nulls(len(texts), type=pa.int32())
+    else:
+        token_counts = count_tokens(sentences, tokenizer)
+        sentence_token_counts = to_list_array(token_counts)
+        token_count = to_totals(token_counts)
+
+    return pa.Table.from_arrays(
+        [
+            pa.array(ids, type=pa.int64()),
+            pa.array(content_categories, type=pa.string()),
+            to_list_array(starts),
+            to_list_array(ends),
+            sentence_word_counts,
+            sentence_token_counts,
+            word_count,
+            token_count,
+        ],
+        schema=TEXT_INDEX_SCHEMA,
+    )
+
+
+def chunk_sentences(
+    sentence_starts: list[int],
+    sentence_ends: list[int],
+    sentence_token_counts: list[int],
+    max_tokens: int,
+) -> list[tuple[int, int]]:
+    """
+    Groups consecutive sentences into chunks of at most `max_tokens` tokens, e.g. to embed an
+    article in chunks that fit the maximum sequence length of the embedding model.
+
+    A sentence is added to the current chunk unless the chunk would exceed `max_tokens`, in
+    which case a new chunk is started. A sentence longer than `max_tokens` is a chunk of its own.
+
+    Args:
+        sentence_starts (list[int]): The start offsets of the sentences of an article.
+        sentence_ends (list[int]): The end offsets of the sentences of an article.
+        sentence_token_counts (list[int]): The number of tokens of the sentences of an article.
+        max_tokens (int): The maximum number of tokens of a chunk.
+
+    Returns:
+        list[tuple[int, int]]: The start and end offsets of each chunk in the text, which
+            spans its sentences and the whitespace between them.
+    """
+    chunks = []
+    chunk_start, chunk_end, chunk_tokens = None, None, 0
+    for start, end, num_tokens in zip(
+        sentence_starts, sentence_ends, sentence_token_counts
+    ):
+        if chunk_start is not None and chunk_tokens + num_tokens > max_tokens:
+            chunks.append((chunk_start, chunk_end))
+            chunk_start, chunk_tokens = None, 0
+        if chunk_start is None:
+            chunk_start = start
+        chunk_end = end
+        chunk_tokens += num_tokens
+
+    if chunk_start is not None:
+        chunks.append((chunk_start, chunk_end))
+
+    return chunks
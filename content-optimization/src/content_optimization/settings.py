@@ -2,6 +2,11 @@
 from the Kedro defaults. For further information, including these default values, see
 https://docs.kedro.org/en/stable/kedro_project_setup/settings.html."""
 
+from pathlib import Path
+
+from content_optimization.hooks import NodeInstrumentationHooks
+from kedro_viz.integrations.kedro.sqlite_store import SQLiteStore
+
 # Instantiated project hooks.
 # For example, after creating a hooks.py and defining a ProjectHooks class there, do
 # from pandas_viz.hooks import ProjectHooks
@@ -9,14 +14,13 @@
 # Hooks are executed in a Last-In-First-Out (LIFO) order.
 # HOOKS = (ProjectHooks(),)
 
+# Enabled with the `NODE_METRICS` environment variable, e.g. `NODE_METRICS=1 kedro run`
+HOOKS = (NodeInstrumentationHooks(),)
+
 # Installed plugins for which to disable hook auto-registration.
 # DISABLE_HOOKS_FOR_PLUGINS = ("kedro-viz",)
 
 # Class that manages storing KedroSession data.
-from pathlib import Path
-
-from kedro_viz.integrations.kedro.sqlite_store import SQLiteStore
-
 SESSION_STORE_CLASS = SQLiteStore
 # Keyword arguments to pass to the `SESSION_STORE_CLASS` constructor.
 SESSION_STORE_ARGS = {"path": str(Path(__file__).parents[2])}
@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Registers the `benchmark` marker of the benchmark modules."""
+    config.addinivalue_line(
+        "markers", "benchmark: skipped unless `RUN_BENCHMARKS` is set"
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """
+    Skips the tests marked as `benchmark` unless the `RUN_BENCHMARKS` environment variable
+    is set, e.g.
+
+        RUN_BENCHMARKS=1 pytest tests/benchmarks -s --no-cov
+
+    Args:
+        config (pytest.Config): The pytest configuration.
+        items (list[pytest.Item]): The collected tests.
+    """
+    if os.environ.get("RUN_BENCHMARKS"):
+        return
+
+    skip = pytest.mark.skip(reason="Set RUN_BENCHMARKS to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
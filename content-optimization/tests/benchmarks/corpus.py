@@ -0,0 +1,361 @@
+"""
+Deterministic generator of synthetic HealthHub exports, in the same shape as the raw Excel
+exports in `data/01_raw/all_contents`, for benchmarking the `data_processing` nodes at scale.
+
+The articles mix the HTML elements and the edge cases of the real exports: nested divs,
+headers, lists, tables with spanning cells, "Read these next:" blocks, images and links,
+as well as recipes, multilingual articles, Excel errors, content without HTML tags, empty
+and short content, and duplicated content. The same arguments always generate the same
+exports, e.g.
+
+    exports = generate_corpus(1000, ["medications", "live-healthy-articles"], seed=0)
+"""
+
+import zlib
+from collections.abc import Sequence
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Columns of the exports after `standardize_columns`; see `default_columns` in
+# `parameters_data_processing.yml`
+DEFAULT_COLUMNS = [
+    "id",
+    "content_name",
+    "title",
+    "article_category_names",
+    "cover_image_url",
+    "full_url",
+    "full_url2",
+    "friendly_url",
+    "category_description",
+    "content_body",
+    "keywords",
+    "feature_title",
+    "pr_name",
+    "alternate_image_text",
+    "date_modified",
+    "number_of_views",
+    "last_month_view_count",
+    "last_two_months_view",
+    "page_views",
+    "engagement_rate",
+    "bounce_rate",
+    "exit_rate",
+    "scroll_percentage",
+    "percentage_total_views",
+    "cumulative_percentage_total_views",
+]
+
+# Kinds of articles and their share of the exports
+ARTICLE_KINDS = {
+    "article": 0.70,  # sections of paragraphs, lists, images and "Read these next:"
+    "table": 0.10,  # schedules and dosages with spanning cells
+    "recipe": 0.03,
+    "multilingual": 0.05,
+    "excel_error": 0.02,
+    "no_html": 0.02,
+    "empty": 0.02,
+    "short": 0.03,  # below the word count cutoff
+    "duplicate": 0.03,  # same content body as an earlier article
+}
+
+# Shares of the articles, sections and sentences with optional elements
+RECIPE_TITLE_SHARE = 0.5  # of recipes with "Recipe" in the title
+READ_THESE_NEXT_SHARE = 0.6
+LIST_SHARE = 0.4
+IMAGE_SHARE = 0.3
+LINKED_IMAGE_SHARE = 0.3
+# Cumulative shares of the sentences in bold, in a link, followed by a line break, and
+# followed by a non-breaking space
+INLINE_SHARES = (0.15, 0.25, 0.30, 0.33)
+
+# Prefix of the IDs of each content category, so that IDs are unique across exports
+ID_START = 1_400_000
+IDS_PER_CATEGORY = 100_000
+
+EXCEL_ERROR = "Value exceeded maximum cell size"
+
+ARTICLE_CATEGORY_NAMES = [
+    "Conditions and Illnesses",
+    "Medications",
+    "Body Care",
+    "Exercise and Fitness",
+    "Food and Nutrition",
+    "Mind and Balance",
+    "Child and Teen Health",
+    "Pregnancy and Infant Health",
+    "Financial Assistance",
+]
+
+LANGUAGES = ["chinese", "malay", "tamil"]
+
+# Words of the generated text. Articles draw from a Zipf-like distribution over the
+# vocabulary, so that the word counts and the near-duplicate shingles are realistic.
+TOPIC_WORDS = (
+    "health diabetes blood pressure heart vaccine dose child fever rash infection "
+    "doctor clinic polyclinic hospital medication tablet symptoms treatment exercise "
+    "diet sugar salt sleep stress screening cancer kidney eye skin allergy asthma "
+    "pregnancy baby elderly caregiver subsidy medisave medishield insurance"
+).split()
+FILLER_WORDS = (
+    "the a of and to in is for you your with can be are or it on as this may that "
+    "if not have more at by from an should when how what which also take help"
+).split()
+VOCABULARY = np.array(TOPIC_WORDS + FILLER_WORDS + [f"term{i}" for i in range(2000)])
+WORD_PROBABILITIES = 1 / np.arange(1, len(VOCABULARY) + 1) ** 0.9
+# Words are drawn by inverse transform sampling, which is much faster than
+# `rng.choice(..., p=...)` for the many small draws of an article
+WORD_CDF = np.cumsum(WORD_PROBABILITIES) / WORD_PROBABILITIES.sum()
+
+
+def generate_corpus(
+    num_articles: int,
+    content_categories: Sequence[str],
+    columns_to_keep: Optional[dict[str, list[str]]] = None,
+    seed: int = 0,
+) -> dict[str, pd.DataFrame]:
+    """
+    Generates the exports of several content categories.
+
+    Args:
+        num_articles (int): The number of articles of each content category.
+        content_categories (Sequence[str]): The content categories.
+        columns_to_keep (Optional[dict[str, list[str]]]): The columns of the raw export of
+            each content category, in the order of `DEFAULT_COLUMNS`, e.g. `columns_to_keep`
+            in `parameters_data_processing.yml`. Defaults to None, which names the columns
+            with the `DEFAULT_COLUMNS`.
+        seed (int): The seed of the corpus. Defaults to 0.
+
+    Returns:
+        dict[str, pd.DataFrame]: The exports keyed by the partition name of
+            `all_contents`, e.g. "export-published-medications_2024".
+    """
+    columns_to_keep = columns_to_keep or {}
+
+    return {
+        f"export-published-{content_category}_2024": generate_export(
+            content_category,
+            num_articles,
+            columns=columns_to_keep.get(content_category),
+            id_start=ID_START + IDS_PER_CATEGORY * i,
+            seed=seed,
+        )
+        for i, content_category in enumerate(content_categories)
+    }
+
+
+def generate_export(
+    content_category: str,
+    num_articles: int,
+    columns: Optional[list[str]] = None,
+    id_start: int = ID_START,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Generates the export of a content category.
+
+    Args:
+        content_category (str): The content category, e.g. "medications".
+        num_articles (int): The number of articles.
+        columns (Optional[list[str]]): The columns of the raw export, in the order of
+            `DEFAULT_COLUMNS`. Defaults to None, which uses the `DEFAULT_COLUMNS`.
+        id_start (int): The ID of the first article. Defaults to `ID_START`.
+        seed (int): The seed of the export. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: The articles of the export.
+    """
+    # `hash` is salted per process, so the content category is hashed with CRC32 instead
+    rng = np.random.default_rng([seed, zlib.crc32(content_category.encode())])
+    kinds = rng.choice(
+        list(ARTICLE_KINDS), size=num_articles, p=list(ARTICLE_KINDS.values())
+    )
+
+    rows = []
+    for i, kind in enumerate(kinds):
+        article_id = id_start + i
+        title = _title(rng, kind)
+        slug = "-".join(title.lower().split()[:6]) + f"-{article_id}"
+        if kind == "multilingual":
+            slug += f"-{rng.choice(LANGUAGES)}"
+        full_url = f"https://www.healthhub.sg/{content_category}/{slug}"
+        if kind == "duplicate" and rows:
+            content_body = rows[rng.integers(len(rows))]["content_body"]
+        else:
+            content_body = _content_body(rng, kind)
+        views = int(rng.zipf(1.5)) * 10
+
+        rows.append(
+            {
+                "id": article_id,
+                "content_name": title,
+                "title": f"  {title} ",  # stripped by `standardize_columns`
+                "article_category_names": ",".join(
+                    rng.choice(ARTICLE_CATEGORY_NAMES, size=2, replace=False)
+                ),
+                "cover_image_url": f"/-/media/{slug}.jpg",
+                "full_url": full_url,
+                "full_url2": full_url,
+                "friendly_url": slug,
+                "category_description": None,
+                "content_body": content_body,
+                "keywords": "recipe" if kind == "recipe" else _words(rng, 3),
+                "feature_title": title,
+                "pr_name": rng.choice(["HPB", "MOH", None]),
+                "alternate_image_text": title,
+                "date_modified": f"2024-{rng.integers(1, 13):02d}-{rng.integers(1, 29):02d}",
+                "number_of_views": views,
+                "last_month_view_count": views // 10,
+                "last_two_months_view": views // 5,
+                "page_views": views,
+                "engagement_rate": round(float(rng.random()), 4),
+                "bounce_rate": round(float(rng.random()), 4),
+                "exit_rate": round(float(rng.random()), 4),
+                "scroll_percentage": round(float(rng.random()), 4),
+                "percentage_total_views": 0.0,
+                "cumulative_percentage_total_views": 0.0,
+            }
+        )
+
+    df = pd.DataFrame(rows, columns=DEFAULT_COLUMNS)
+    if columns is not None:
+        df.columns = columns
+
+    return df
+
+
+def _words(rng: np.random.Generator, n: int) -> str:
+    """Returns `n` words of the vocabulary."""
+    indexes = np.searchsorted(WORD_CDF, rng.random(n), side="right")
+
+    return " ".join(VOCABULARY[np.minimum(indexes, len(VOCABULARY) - 1)])
+
+
+def _title(rng: np.random.Generator, kind: str) -> str:
+    """Returns the title of an article."""
+    title = _words(rng, int(rng.integers(3, 8))).capitalize()
+    if kind == "recipe" and rng.random() < RECIPE_TITLE_SHARE:
+        return f"{title} Recipe"
+
+    return title
+
+
+def _content_body(rng: np.random.Generator, kind: str) -> Optional[str]:
+    """Returns the HTML content body of an article of the given kind."""
+    if kind == "excel_error":
+        return EXCEL_ERROR
+    if kind == "no_html":
+        return _words(rng, 200)
+    if kind == "empty":
+        return None
+    if kind == "short":
+        return f"<div><p>{_words(rng, 30)}</p></div>"
+
+    sections = []
+    for _ in range(int(rng.integers(3, 8))):
+        sections.append(_section(rng))
+    if kind == "table":
+        sections[1:1] = [_table(rng) for _ in range(int(rng.integers(1, 4)))]
+    if kind == "recipe":
+        sections.append(
+            "<h3>What you need</h3>"
+            + _list(rng, "ul")
+            + "<h3>How to cook this dish</h3>"
+            + _list(rng, "ol")
+        )
+    if rng.random() < READ_THESE_NEXT_SHARE:
+        sections.append(_read_these_next(rng))
+
+    return _nest(rng, "".join(sections))
+
+
+def _section(rng: np.random.Generator) -> str:
+    """Returns a section with a header, paragraphs, and maybe a list and an image."""
+    header = rng.choice(["h2", "h3", "h4"], p=[0.6, 0.3, 0.1])
+    parts = [f"<{header}>{_words(rng, 5).capitalize()}</{header}>"]
+    for _ in range(int(rng.integers(1, 4))):
+        parts.append(_paragraph(rng))
+    if rng.random() < LIST_SHARE:
+        parts.append(_list(rng, rng.choice(["ul", "ol"])))
+    if rng.random() < IMAGE_SHARE:
+        parts.append(_image(rng))
+
+    return _nest(rng, "".join(parts), max_depth=2)
+
+
+def _paragraph(rng: np.random.Generator) -> str:
+    """Returns a paragraph with inline formatting, links and line breaks."""
+    sentences = []
+    for _ in range(int(rng.integers(2, 6))):
+        sentence = _words(rng, int(rng.integers(8, 20))).capitalize() + "."
+        bold, link, line_break, nbsp = INLINE_SHARES
+        roll = rng.random()
+        if roll < bold:
+            sentence = f"<strong>{sentence}</strong>"
+        elif roll < link:
+            sentence = f'<a href="/article/{rng.integers(1000, 9999)}">{sentence}</a>'
+        elif roll < line_break:
+            sentence += "<br>"
+        elif roll < nbsp:
+            sentence += "&nbsp;"
+        sentences.append(sentence)
+
+    return "<p>" + " ".join(sentences) + "</p>"
+
+
+def _list(rng: np.random.Generator, tag: str) -> str:
+    """Returns an ordered or unordered list."""
+    items = "".join(
+        f"<li>{_words(rng, int(rng.integers(3, 12)))}</li>"
+        for _ in range(int(rng.integers(3, 8)))
+    )
+
+    return f"<{tag}>{items}</{tag}>"
+
+
+def _image(rng: np.random.Generator) -> str:
+    """Returns an image, sometimes wrapped in a link."""
+    image = (
+        f'<img src="/-/media/image-{rng.integers(1000)}.png" alt="{_words(rng, 3)}">'
+    )
+    if rng.random() < LINKED_IMAGE_SHARE:
+        return f'<a href="/-/media/image-{rng.integers(1000)}.png">{image}</a>'
+
+    return image
+
+
+def _table(rng: np.random.Generator) -> str:
+    """Returns a schedule table with cells spanning rows and columns."""
+    num_rows = int(rng.integers(4, 16))
+    rows = [
+        "<tr><th>Vaccine</th><th>Dose</th><th>Age</th><th>Notes</th></tr>",
+        "<tr><th colspan='2'>Primary series</th><th colspan='2'>Booster</th></tr>",
+    ]
+    for i in range(num_rows):
+        first = f"<td rowspan='3'>{_words(rng, 2)}</td>" if i % 3 == 0 else ""
+        rows.append(
+            f"<tr>{first}<td>Dose {i % 3 + 1}</td><td>{rng.integers(1, 24)} months</td>"
+            f"<td><p>{_words(rng, 6)}</p></td></tr>"
+        )
+
+    return f"<table><tbody>{''.join(rows)}</tbody></table>"
+
+
+def _read_these_next(rng: np.random.Generator) -> str:
+    """Returns a "Read these next:" block of links to other articles."""
+    links = "".join(
+        f'<li><a href="/article/{rng.integers(1000, 9999)}">{_words(rng, 4)}</a></li>'
+        for _ in range(int(rng.integers(2, 5)))
+    )
+
+    return f"<p><strong>Read these next:</strong></p><ul>{links}</ul>"
+
+
+def _nest(rng: np.random.Generator, html: str, max_depth: int = 4) -> str:
+    """Wraps the HTML in up to `max_depth` divs, as the layouts of the exports do."""
+    for _ in range(int(rng.integers(0, max_depth + 1))):
+        html = f'<div class="{rng.choice(["content", "row", "col-md-12", "rte"])}">{html}</div>'
+
+    return html
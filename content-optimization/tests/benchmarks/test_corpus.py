@@ -0,0 +1,52 @@
+import pandas as pd
+from src.content_optimization.pipelines.data_processing.nodes import standardize_columns
+from tests.benchmarks.corpus import DEFAULT_COLUMNS, EXCEL_ERROR, generate_corpus
+
+
+def test_generate_corpus():
+    """
+    A test function for `generate_corpus` that checks the synthetic exports.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the same exports for the same seed and different exports for another seed
+        2. Expects the raw columns to be standardized by `standardize_columns`
+        3. Expects unique IDs across content categories
+        4. Expects the edge cases of the real exports to be generated
+    """
+    content_categories = ["medications", "live-healthy-articles"]
+    columns_to_keep = {
+        content_category: [f"{content_category}_{column}" for column in DEFAULT_COLUMNS]
+        for content_category in content_categories
+    }
+    corpus = generate_corpus(300, content_categories, columns_to_keep, seed=0)
+
+    for name, df in generate_corpus(
+        300, content_categories, columns_to_keep, seed=0
+    ).items():
+        pd.testing.assert_frame_equal(df, corpus[name])
+    assert not generate_corpus(300, content_categories, columns_to_keep, seed=1)[
+        "export-published-medications_2024"
+    ].equals(corpus["export-published-medications_2024"])
+
+    all_contents = {name: (lambda df=df: df) for name, df in corpus.items()}
+    standardized = standardize_columns(
+        all_contents, {}, columns_to_keep, DEFAULT_COLUMNS
+    )
+    assert set(standardized) == set(content_categories)
+
+    df = pd.concat(standardized.values(), ignore_index=True)
+    assert df.columns.tolist()[: len(DEFAULT_COLUMNS)] == DEFAULT_COLUMNS
+    assert df["id"].is_unique
+
+    content_body = df["content_body"]
+    assert (content_body == EXCEL_ERROR).any()
+    assert content_body.isna().any()
+    assert content_body.str.contains("rowspan", na=False).any()
+    assert content_body.str.contains("Read these next:", na=False).any()
+    assert content_body.str.contains("What you need", na=False).any()
+    assert content_body[~content_body.str.contains("<", na=True)].any()
+    assert content_body.dropna().duplicated().any()
+    assert df["friendly_url"].str.contains(r"-(?:chinese|malay|tamil)$").any()
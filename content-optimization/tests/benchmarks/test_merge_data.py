@@ -0,0 +1,133 @@
+"""
+Benchmark of `merge_data` on a synthetic corpus of 100k articles, saved to both
+`merged_data` and `merged_data_partitioned`.
+"""
+
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from src.content_optimization.datasets.arrow import HivePartitionedDataset
+from src.content_optimization.datasets.parquet import (
+    StreamingParquetDataset,
+    TypedParquetDataset,
+)
+from src.content_optimization.pipelines.data_processing.nodes import merge_data
+
+pytestmark = pytest.mark.benchmark
+
+NUM_ARTICLES = 100_000
+NUM_PARTITIONS = 10
+
+EXTRACTED_COLUMN_TYPES = (
+    "content_optimization.pipelines.data_processing.schemas.EXTRACTED_COLUMN_TYPES"
+)
+
+
+def _write_corpus(path: Path) -> None:
+    """Writes a synthetic corpus of `NUM_ARTICLES` articles as parquet partitions."""
+    rng = np.random.default_rng(0)
+    words = np.array([f"word{i}" for i in range(5000)])
+    size = NUM_ARTICLES // NUM_PARTITIONS
+    path.mkdir(parents=True, exist_ok=True)
+
+    for partition in range(NUM_PARTITIONS):
+        ids = np.arange(partition * size, (partition + 1) * size)
+        df = pd.DataFrame(
+            {
+                "id": ids,
+                "title": [f"Article {i}" for i in ids],
+                "content_category": f"category-{partition}",
+                "extracted_content_body": [
+                    " ".join(rng.choice(words, size=300)) for _ in ids
+                ],
+                "extracted_links": [[("Link", f"/article-{i}")] for i in ids],
+                "to_remove": rng.random(size) < 0.1,  # noqa: PLR2004
+                # Columns of null values in some partitions only
+                "l1_mappings": None if partition % 2 else "Health Conditions",
+            }
+        )
+        _dataset(path / f"category-{partition}.parquet").save(df)
+
+
+def _dataset(filepath: Path) -> TypedParquetDataset:
+    """Returns the dataset of a partition, as in `all_contents_mapped`."""
+    return TypedParquetDataset(
+        filepath=filepath.as_posix(), column_types=EXTRACTED_COLUMN_TYPES
+    )
+
+
+def _load_partitions(path: Path) -> dict:
+    """Returns the partitions as load functions, as in a `PartitionedDataset`."""
+    return {file.stem: _dataset(file).load for file in sorted(path.glob("*.parquet"))}
+
+
+def _merge_by_concat(path: Path, output: Path) -> tuple[float, int]:
+    """Merges the partitions with the previous `pd.concat` loop."""
+    start = time.perf_counter()
+    merged_df = pd.DataFrame()
+    for partition_load_func in _load_partitions(path).values():
+        df = partition_load_func()
+        merged_df = pd.concat([merged_df, df], axis=0, ignore_index=True)
+    merged_df.to_parquet(output)
+    HivePartitionedDataset(path=output.with_suffix("").as_posix()).save(merged_df)
+    duration = time.perf_counter() - start
+
+    return duration, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _merge_by_stream(path: Path, output: Path) -> tuple[float, int]:
+    """Merges the partitions with `merge_data` and `StreamingParquetDataset`."""
+    start = time.perf_counter()
+    merged_data, merged_data_partitioned = merge_data(_load_partitions(path))
+    StreamingParquetDataset(filepath=output.as_posix()).save(merged_data)
+    HivePartitionedDataset(path=output.with_suffix("").as_posix()).save(
+        merged_data_partitioned
+    )
+    duration = time.perf_counter() - start
+
+    return duration, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def test_merge_data_benchmark(tmp_path: Path):
+    """
+    Compares the time and peak memory of `merge_data` with the `pd.concat` loop, each
+    in a fresh process.
+
+    Args:
+        tmp_path (Path): The temporary directory of the synthetic corpus.
+
+    Raises:
+        AssertionError: If the merged data differs.
+    """
+    _write_corpus(tmp_path / "corpus")
+
+    results = {}
+    for name, merge in [("concat", _merge_by_concat), ("stream", _merge_by_stream)]:
+        with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor:
+            output = tmp_path / f"{name}.parquet"
+            results[name] = executor.submit(merge, tmp_path / "corpus", output).result()
+
+    # The pandas metadata of the typed columns is ignored, as pandas cannot parse it
+    pd.testing.assert_frame_equal(
+        pq.read_table(tmp_path / "stream.parquet").to_pandas(ignore_metadata=True),
+        pq.read_table(tmp_path / "concat.parquet").to_pandas(ignore_metadata=True),
+    )
+    assert (
+        HivePartitionedDataset(path=(tmp_path / "stream").as_posix())
+        .load()
+        .count_rows()
+        == NUM_ARTICLES
+    )
+
+    for name, (duration, max_rss) in results.items():
+        print(
+            f"\nmerge_data ({name}): {NUM_ARTICLES:,} articles in {duration:.1f}s, "
+            f"peak RSS {max_rss / 1024:,.0f} MiB"
+        )
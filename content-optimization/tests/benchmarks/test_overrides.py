@@ -0,0 +1,62 @@
+"""
+Benchmark of `Overrides.apply` with many curated overrides on a large synthetic frame.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.content_optimization.pipelines.data_processing.overrides import Overrides
+from tests.pipelines.data_processing.test_overrides import _apply_overrides_by_scans
+
+pytestmark = pytest.mark.benchmark
+
+NUM_ARTICLES = 50_000
+
+
+@pytest.mark.parametrize("num_overrides", [100, 1000])
+def test_overrides_benchmark(num_overrides: int):
+    """
+    Compares the time of the indexed joins with the scans for every override.
+
+    Args:
+        num_overrides (int): The number of missing contents and of updated URLs.
+
+    Raises:
+        AssertionError: If the overridden articles differ.
+    """
+    rng = np.random.default_rng(0)
+    ids = np.arange(NUM_ARTICLES) + 1_000_000
+    df = pd.DataFrame(
+        {
+            "id": ids,
+            "friendly_url": [f"article-{i}" for i in ids],
+            "content_body": "<p>Value exceeded maximum cell size</p>",
+            "full_url": [f"https://www.healthhub.sg/a/{i}" for i in ids],
+            "full_url2": [f"https://www.healthhub.sg/a/{i}" for i in ids],
+        }
+    )
+    content_ids = rng.choice(ids, size=num_overrides, replace=False)
+    url_ids = rng.choice(ids, size=num_overrides, replace=False)
+    excel_errors = {f"article-{i}": f"<p>Missing content {i}</p>" for i in content_ids}
+    new_urls = {int(i): f"https://www.healthhub.sg/new/{i}" for i in url_ids}
+
+    start = time.perf_counter()
+    expected = _apply_overrides_by_scans(df.copy(), excel_errors, new_urls)
+    print(f"\nscans ({num_overrides} overrides): {time.perf_counter() - start:.2f}s")
+
+    overrides = Overrides.from_sources(
+        {
+            f"medications/{friendly_url}": (lambda text=text: text)
+            for friendly_url, text in excel_errors.items()
+        },
+        {"medications": new_urls},
+        [],
+        {},
+    )
+    start = time.perf_counter()
+    result, _ = overrides.apply(df.copy(), "medications")
+    print(f"joins ({num_overrides} overrides): {time.perf_counter() - start:.2f}s")
+
+    pd.testing.assert_frame_equal(result, expected)
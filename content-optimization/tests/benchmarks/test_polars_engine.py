@@ -0,0 +1,137 @@
+"""
+Benchmark of the `polars` engine against the `pandas` engine of `standardize_columns`,
+`add_data` and `map_data` on a synthetic HealthHub corpus with both string dtypes.
+See `corpus.py`.
+
+Each node loads its inputs from Parquet partitions as in a `kedro run`, and is timed over
+`REPEATS` runs per engine, keeping the fastest. Both engines must return the same data.
+The partitions are converted from and to pandas at the boundaries of the Polars queries,
+which copies every string with the `object` dtype but not with `string[pyarrow]`.
+"""
+
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+import pytest
+from kedro.config import OmegaConfigLoader
+from src.content_optimization.pipelines.data_processing.nodes import (
+    add_data,
+    compile_ia_mappings,
+    compile_overrides,
+    extract_data,
+    map_data,
+    standardize_columns,
+)
+from tests.benchmarks.corpus import generate_corpus
+from tests.benchmarks.test_throughput import CONTENT_CATEGORIES, _save_partitions
+
+pytestmark = pytest.mark.benchmark
+pytest.importorskip("polars")
+
+NUM_ARTICLES = int(os.environ.get("BENCHMARK_ARTICLES", 5000))  # per content category
+REPEATS = 3
+
+
+@pytest.fixture(scope="module")
+def node_runs(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> dict[str, Callable[[str, str], Any]]:
+    """
+    Saves the inputs of the nodes on the synthetic corpus once, and returns a function per
+    node that runs it on the same inputs with a given engine and string dtype.
+    """
+    params = OmegaConfigLoader("conf", base_env="base", default_run_env="local")[
+        "parameters"
+    ]
+    path = tmp_path_factory.mktemp("polars_engine")
+    for stage in ["raw", "standardized", "added", "extracted"]:
+        (path / stage).mkdir()
+
+    corpus = generate_corpus(
+        NUM_ARTICLES, CONTENT_CATEGORIES, params["columns_to_keep"], seed=0
+    )
+    overrides = compile_overrides(
+        {}, params["updated_urls"], params["whitelist"], params["blacklist"]
+    )
+    ia_mappings = compile_ia_mappings(params["l1_mappings"], params["l2_mappings"])
+
+    all_contents = _save_partitions(corpus, path / "raw")
+    runs = {
+        "standardize_columns": lambda engine, string_dtype: standardize_columns(
+            all_contents,
+            params["columns_to_add"],
+            params["columns_to_keep"],
+            params["default_columns"],
+            string_dtype,
+            engine,
+        )
+    }
+    all_contents_standardized = _save_partitions(
+        runs["standardize_columns"]("pandas", "object"), path / "standardized"
+    )
+
+    runs["add_data"] = lambda engine, string_dtype: add_data(
+        all_contents_standardized, overrides, string_dtype, engine
+    )
+    all_contents_added = _save_partitions(
+        runs["add_data"]("pandas", "object")[0], path / "added"
+    )
+
+    all_contents_extracted = _save_partitions(
+        extract_data(
+            all_contents_added,
+            params["word_count_cutoff"],
+            overrides,
+            {"parallel": True, "cache": {"enabled": False}},
+        )[0],
+        path / "extracted",
+        typed=True,
+    )
+    runs["map_data"] = lambda engine, string_dtype: map_data(
+        all_contents_extracted, ia_mappings, string_dtype, engine
+    )
+
+    return runs
+
+
+@pytest.mark.parametrize("string_dtype", ["object", "string[pyarrow]"])
+@pytest.mark.parametrize("node_name", ["standardize_columns", "add_data", "map_data"])
+def test_polars_engine_benchmark(
+    node_name: str, string_dtype: str, node_runs: dict[str, Callable[[str, str], Any]]
+):
+    """
+    Compares the throughput of a node with the `pandas` and the `polars` engines.
+
+    Args:
+        node_name (str): The name of the node function.
+        string_dtype (str): The dtype of the text columns.
+        node_runs (dict[str, Callable[[str, str], Any]]): The function that runs each node.
+
+    Raises:
+        AssertionError: If the outputs of the engines differ.
+    """
+    num_articles = NUM_ARTICLES * len(CONTENT_CATEGORIES)
+    outputs, throughput = {}, {}
+    for engine in ["pandas", "polars"]:
+        durations = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            outputs[engine] = node_runs[node_name](engine, string_dtype)
+            durations.append(time.perf_counter() - start)
+        throughput[engine] = num_articles / min(durations)
+
+    print(
+        f"\n{node_name} ({string_dtype}): pandas {throughput['pandas']:,.0f} articles/s, "
+        f"polars {throughput['polars']:,.0f} articles/s "
+        f"({throughput['polars'] / throughput['pandas']:.1f}x)"
+    )
+
+    partitions = {
+        engine: output[0] if isinstance(output, tuple) else output
+        for engine, output in outputs.items()
+    }
+    for content_category, df in partitions["pandas"].items():
+        pd.testing.assert_frame_equal(partitions["polars"][content_category], df)
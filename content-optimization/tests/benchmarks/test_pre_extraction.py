@@ -0,0 +1,68 @@
+"""
+Benchmark of `flag_articles_to_remove_before_extraction` on a large synthetic frame.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.content_optimization.pipelines.data_processing.utils import (
+    convert_string_columns,
+    flag_articles_to_remove_before_extraction,
+)
+from tests.pipelines.data_processing.test_utils import (
+    _flag_articles_to_remove_before_extraction_by_scans,
+)
+
+pytestmark = pytest.mark.benchmark
+
+NUM_ARTICLES = 200_000
+
+
+def _content_bodies() -> pd.DataFrame:
+    """Returns `NUM_ARTICLES` articles with about 2 KB of content each."""
+    rng = np.random.default_rng(0)
+    words = np.array([f"word{i}" for i in range(5000)])
+    bodies = np.array(
+        [
+            "<div><h2>Overview</h2><p>"
+            + " ".join(rng.choice(words, size=250))
+            + "</p></div>"
+            for _ in range(1000)
+        ]
+        + [" ".join(rng.choice(words, size=250)) for _ in range(50)]  # dummy content
+        + ["Value exceeded maximum cell size"] * 10
+        + [None] * 20,
+        dtype=object,
+    )
+
+    return pd.DataFrame(
+        {
+            "content_body": rng.choice(bodies, size=NUM_ARTICLES),
+            "content_category": "medications",
+        }
+    )
+
+
+def test_pre_extraction_benchmark():
+    """
+    Compares the time of the single-pass flags with the multi-scan implementation.
+
+    Raises:
+        AssertionError: If the flags differ.
+    """
+    df = _content_bodies()
+
+    start = time.perf_counter()
+    expected = _flag_articles_to_remove_before_extraction_by_scans(df.copy())
+    print(f"\nmulti-scan (object): {time.perf_counter() - start:.2f}s")
+
+    for string_dtype in ["object", "string[pyarrow]"]:
+        df_converted = convert_string_columns(df.copy(), string_dtype)
+        start = time.perf_counter()
+        result = flag_articles_to_remove_before_extraction(df_converted)
+        print(f"single-pass ({string_dtype}): {time.perf_counter() - start:.2f}s")
+
+        pd.testing.assert_series_equal(result["to_remove"], expected["to_remove"])
+        pd.testing.assert_series_equal(result["remove_type"], expected["remove_type"])
@@ -0,0 +1,75 @@
+"""
+Benchmark of the `string[pyarrow]` dtype against Python strings on a synthetic raw export.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.content_optimization.pipelines.data_processing.utils import (
+    convert_string_columns,
+    flag_multilingual_content,
+    flag_recipe_articles,
+    strip_whitespace,
+)
+
+pytestmark = pytest.mark.benchmark
+
+NUM_ARTICLES = 20_000
+
+
+def _raw_export() -> pd.DataFrame:
+    """Returns `NUM_ARTICLES` articles with about 10 KB of HTML content each."""
+    rng = np.random.default_rng(0)
+    words = np.array([f"word{i}" for i in range(5000)])
+    ids = np.arange(NUM_ARTICLES)
+
+    return pd.DataFrame(
+        {
+            "id": ids,
+            "title": [f" Article {i} " for i in ids],
+            "keywords": [" fever, rash " if i % 3 else None for i in ids],
+            "friendly_url": [f"article-{i}" for i in ids],
+            "content_body": [
+                " <p>" + " ".join(rng.choice(words, size=1200)) + "</p> " for _ in ids
+            ],
+            "extracted_content_body": [
+                " ".join(rng.choice(words, size=600)) for _ in ids
+            ],
+            "number_of_views": rng.integers(0, 10_000, size=NUM_ARTICLES),
+            "to_remove": False,
+            "remove_type": None,
+        }
+    )
+
+
+def test_string_dtype_benchmark():
+    """
+    Compares the memory usage and the time of stripping and flagging the articles
+    with Python strings and with `string[pyarrow]`.
+
+    Raises:
+        AssertionError: If the flags differ.
+    """
+    results = {}
+    for string_dtype in ["object", "string[pyarrow]"]:
+        df = convert_string_columns(_raw_export(), string_dtype)
+
+        start = time.perf_counter()
+        df = strip_whitespace(df)
+        strip_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        df = flag_recipe_articles(df, whitelist=[])
+        df = flag_multilingual_content(df, whitelist=[])
+        flag_duration = time.perf_counter() - start
+
+        memory_usage = df.memory_usage(deep=True).sum() / 2**20
+        results[string_dtype] = df["to_remove"]
+        print(
+            f"\n{string_dtype}: {memory_usage:,.0f} MiB, stripped in {strip_duration:.2f}s, "
+            f"flagged in {flag_duration:.2f}s"
+        )
+
+    pd.testing.assert_series_equal(results["object"], results["string[pyarrow]"])
@@ -0,0 +1,76 @@
+"""
+Benchmark of `parse_table` on table-heavy synthetic articles, e.g. medication dosage
+and immunisation schedule tables.
+"""
+
+import time
+
+import numpy as np
+import pytest
+from bs4 import BeautifulSoup, Tag
+from src.content_optimization.pipelines.data_processing.extractor import HTMLExtractor
+from src.content_optimization.pipelines.data_processing.tables import parse_table
+
+pytestmark = pytest.mark.benchmark
+
+NUM_ARTICLES = 200
+
+
+def _process_table_by_scans(table_html: Tag) -> list[list[str]]:
+    """
+    The previous implementation of `HTMLExtractor._process_table`, which searches the rows
+    of the table three times and ignores `rowspan` and `colspan`, and serialises the table
+    separately. Used as the baseline of `parse_table`.
+    """
+    clean_text = HTMLExtractor.clean_text
+    if table_html.find_all("tr") == []:
+        return None, str(table_html)
+    headers = [clean_text(header.get_text()) for header in table_html.find_all("tr")[0]]
+    table = [list(filter(lambda k: " " in k, headers))]
+    for row in table_html.find_all("tr")[1:]:
+        table.append([clean_text(ele.get_text()) for ele in row.find_all("td")])
+
+    return table, str(table_html)
+
+
+def _schedule_html(rng: np.random.Generator) -> str:
+    """Returns an article with 10 schedule tables of 30 rows with spanning cells."""
+    tables = []
+    for _ in range(10):
+        rows = ["<tr><th>Vaccine</th><th>Dose</th><th>Age</th><th>Notes</th></tr>"]
+        for i in range(30):
+            first = f"<td rowspan='3'>Vaccine {i // 3}</td>" if i % 3 == 0 else ""
+            rows.append(
+                f"<tr>{first}<td>Dose {i % 3 + 1}</td>"
+                f"<td>{rng.integers(1, 24)} months</td><td><p>Given at polyclinics</p></td></tr>"
+            )
+        tables.append(f"<table><tbody>{''.join(rows)}</tbody></table>")
+
+    return "<h2>Schedule</h2>" + "<p>See the table below.</p>".join(tables)
+
+
+def test_tables_benchmark():
+    """
+    Compares the time of the single-pass table engine with the multi-scan implementation.
+
+    Raises:
+        AssertionError: If the number of rows of a table differs.
+    """
+    rng = np.random.default_rng(0)
+    tables = [
+        table
+        for _ in range(NUM_ARTICLES)
+        for table in BeautifulSoup(_schedule_html(rng), "html.parser").find_all("table")
+    ]
+
+    start = time.perf_counter()
+    expected = [_process_table_by_scans(table) for table in tables]
+    print(f"\nmulti-scan: {time.perf_counter() - start:.2f}s ({len(tables)} tables)")
+
+    start = time.perf_counter()
+    result = [parse_table(table, HTMLExtractor.clean_text) for table in tables]
+    print(f"single-pass: {time.perf_counter() - start:.2f}s ({len(tables)} tables)")
+
+    for (rows, raw_html), parsed in zip(expected, result):
+        assert len(parsed.to_list()) == len(rows)
+        assert parsed.raw_html == raw_html
@@ -0,0 +1,220 @@
+"""
+Throughput of every node of the `data_processing` pipeline on a synthetic HealthHub corpus,
+in articles per second. See `corpus.py`.
+
+Each node loads its inputs from Parquet partitions as in a `kedro run`, and is timed over
+`REPEATS` runs, keeping the fastest. A node fails if its throughput drops more than
+`BENCHMARK_TOLERANCE` (defaults to 30%) below the baseline stored in
+`throughput_baseline.json`. Baselines depend on the machine, so record them again on the
+machine that runs the benchmarks:
+
+    RUN_BENCHMARKS=1 UPDATE_BENCHMARK_BASELINE=1 pytest tests/benchmarks/test_throughput.py -s --no-cov
+"""
+
+import json
+import os
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from kedro.config import OmegaConfigLoader
+from kedro_datasets.pandas import ParquetDataset
+from src.content_optimization.datasets.parquet import TypedParquetDataset
+from src.content_optimization.pipelines.data_processing.nodes import (
+    add_data,
+    compile_ia_mappings,
+    compile_overrides,
+    deduplicate_data,
+    extract_data,
+    map_data,
+    merge_data,
+    standardize_columns,
+)
+from tests.benchmarks.corpus import generate_corpus
+
+pytestmark = pytest.mark.benchmark
+
+NUM_ARTICLES = int(os.environ.get("BENCHMARK_ARTICLES", 1000))  # per content category
+CONTENT_CATEGORIES = [
+    "cost-and-financing",
+    "diseases-and-conditions",
+    "live-healthy-articles",
+    "medications",
+]
+REPEATS = 3
+TOLERANCE = float(os.environ.get("BENCHMARK_TOLERANCE", 0.3))
+BASELINE_PATH = Path(__file__).parent / "throughput_baseline.json"
+
+EXTRACTED_COLUMN_TYPES = (
+    "content_optimization.pipelines.data_processing.schemas.EXTRACTED_COLUMN_TYPES"
+)
+
+
+def _save_partitions(
+    partitions: dict[str, Any], path: Path, typed: bool = False
+) -> dict[str, Callable[[], Any]]:
+    """
+    Saves partitions as Parquet files, and returns their load functions as a
+    `PartitionedDataset` does.
+    """
+    loaders = {}
+    for name, df in partitions.items():
+        filepath = str(path / f"{name}.parquet")
+        dataset = (
+            TypedParquetDataset(filepath=filepath, column_types=EXTRACTED_COLUMN_TYPES)
+            if typed
+            else ParquetDataset(filepath=filepath)
+        )
+        dataset.save(df)
+        loaders[name] = dataset.load
+
+    return loaders
+
+
+def _merge(all_contents_mapped: dict[str, Callable[[], Any]]) -> int:
+    """Runs `merge_data` and consumes the merged stream, as its datasets do."""
+    merged_data, _ = merge_data(all_contents_mapped)
+
+    return sum(table.num_rows for table in merged_data())
+
+
+@pytest.fixture(scope="module")
+def node_runs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Callable[[], Any]]:
+    """
+    Runs the nodes on the synthetic corpus once, saving the outputs of each node for the
+    next one, and returns a function per node that runs it again on the same inputs.
+    """
+    params = OmegaConfigLoader("conf", base_env="base", default_run_env="local")[
+        "parameters"
+    ]
+    path = tmp_path_factory.mktemp("throughput")
+    for stage in [
+        "raw",
+        "added",
+        "standardized",
+        "extracted",
+        "deduplicated",
+        "mapped",
+    ]:
+        (path / stage).mkdir()
+
+    corpus = generate_corpus(
+        NUM_ARTICLES, CONTENT_CATEGORIES, params["columns_to_keep"], seed=0
+    )
+    overrides = compile_overrides(
+        {}, params["updated_urls"], params["whitelist"], params["blacklist"]
+    )
+    ia_mappings = compile_ia_mappings(params["l1_mappings"], params["l2_mappings"])
+
+    runs = {
+        "standardize_columns": lambda: standardize_columns(
+            all_contents,
+            params["columns_to_add"],
+            params["columns_to_keep"],
+            params["default_columns"],
+        )
+    }
+    all_contents = _save_partitions(corpus, path / "raw")
+    all_contents_standardized = _save_partitions(
+        runs["standardize_columns"](), path / "standardized"
+    )
+
+    runs["add_data"] = lambda: add_data(all_contents_standardized, overrides)
+    all_contents_added = _save_partitions(runs["add_data"]()[0], path / "added")
+
+    runs["extract_data"] = lambda: extract_data(
+        all_contents_added,
+        params["word_count_cutoff"],
+        overrides,
+        {"cache": {"enabled": False}},
+    )
+    all_contents_extracted = _save_partitions(
+        runs["extract_data"]()[0], path / "extracted", typed=True
+    )
+
+    runs["deduplicate_data"] = lambda: deduplicate_data(
+        all_contents_extracted, params["whitelist"], params["near_duplicates"]
+    )
+    all_contents_deduplicated = _save_partitions(
+        runs["deduplicate_data"]()[0], path / "deduplicated", typed=True
+    )
+
+    runs["map_data"] = lambda: map_data(all_contents_deduplicated, ia_mappings)
+    all_contents_mapped = _save_partitions(
+        runs["map_data"](), path / "mapped", typed=True
+    )
+
+    runs["merge_data"] = lambda: _merge(all_contents_mapped)
+
+    return runs
+
+
+@pytest.fixture(scope="module")
+def baseline() -> Iterator[dict[str, Any]]:
+    """
+    Loads the stored baseline, and stores the measured throughput as the new baseline
+    after the benchmarks if `UPDATE_BENCHMARK_BASELINE` is set.
+    """
+    stored = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    measured = {"num_articles": NUM_ARTICLES, "articles_per_second": {}}
+    yield {"stored": stored, "measured": measured}
+
+    if os.environ.get("UPDATE_BENCHMARK_BASELINE"):
+        measured["articles_per_second"] = dict(
+            sorted(measured["articles_per_second"].items())
+        )
+        BASELINE_PATH.write_text(json.dumps(measured, indent=2) + "\n")
+
+
+@pytest.mark.parametrize(
+    "node_name",
+    [
+        "standardize_columns",
+        "add_data",
+        "extract_data",
+        "deduplicate_data",
+        "map_data",
+        "merge_data",
+    ],
+)
+def test_throughput(
+    node_name: str,
+    node_runs: dict[str, Callable[[], Any]],
+    baseline: dict[str, Any],
+):
+    """
+    Measures the throughput of a node and compares it with the stored baseline.
+
+    Args:
+        node_name (str): The name of the node function.
+        node_runs (dict[str, Callable[[], Any]]): The function that runs each node.
+        baseline (dict[str, Any]): The stored and the measured throughput.
+
+    Raises:
+        AssertionError: If the throughput is more than `TOLERANCE` below the baseline.
+    """
+    num_articles = NUM_ARTICLES * len(CONTENT_CATEGORIES)
+    durations = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        node_runs[node_name]()
+        durations.append(time.perf_counter() - start)
+
+    throughput = num_articles / min(durations)
+    baseline["measured"]["articles_per_second"][node_name] = round(throughput, 1)
+
+    stored = baseline["stored"]
+    expected = stored.get("articles_per_second", {}).get(node_name)
+    print(
+        f"\n{node_name}: {throughput:,.0f} articles/s "
+        f"(baseline: {f'{expected:,.0f}' if expected else 'none'})"
+    )
+    if expected is None or stored.get("num_articles") != NUM_ARTICLES:
+        pytest.skip("No baseline for this node and number of articles")
+
+    assert throughput >= expected * (1 - TOLERANCE), (
+        f"The throughput of {node_name} dropped from {expected:,.0f} to "
+        f"{throughput:,.0f} articles/s"
+    )
@@ -0,0 +1,92 @@
+"""
+Benchmark of `TypedParquetDataset` against `pandas.ParquetDataset` on synthetic extracted data.
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.content_optimization.datasets.parquet import TypedParquetDataset
+
+pytestmark = pytest.mark.benchmark
+
+NUM_ARTICLES = 20_000
+COLUMN_TYPES = (
+    "content_optimization.pipelines.data_processing.schemas.EXTRACTED_COLUMN_TYPES"
+)
+
+
+def _extracted_df() -> pd.DataFrame:
+    """Returns `NUM_ARTICLES` articles with synthetic extracted columns."""
+    rng = np.random.default_rng(0)
+    ids = np.arange(NUM_ARTICLES)
+
+    return pd.DataFrame(
+        {
+            "id": ids,
+            "related_sections": [
+                [f"Article {j}" for j in rng.integers(0, 1000, size=3)] for _ in ids
+            ],
+            "extracted_tables": [
+                (
+                    [[[f"cell {r}-{c}" for c in range(4)] for r in range(5)]]
+                    if i % 5 == 0
+                    else None
+                )
+                for i in ids
+            ],
+            "extracted_raw_html_tables": [
+                ["<table>...</table>"] if i % 5 == 0 else None for i in ids
+            ],
+            "extracted_links": [
+                [(f"Link {j}", f"/article-{j}") for j in rng.integers(0, 1000, size=10)]
+                for _ in ids
+            ],
+            "extracted_headers": [
+                [(f"Header {j}", f"h{j % 3 + 2}") for j in range(6)] for _ in ids
+            ],
+            "extracted_images": [[("", f"/images/{i}.png")] for i in ids],
+        }
+    )
+
+
+def _time_load(load) -> float:
+    """Returns the best time of 3 loads."""
+    durations = []
+    for _ in range(3):
+        start = time.perf_counter()
+        load()
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def test_typed_parquet_benchmark(tmp_path: Path):
+    """
+    Compares the file size and load time of the typed and the inferred Parquet files.
+
+    Args:
+        tmp_path (Path): The temporary directory of the Parquet files.
+    """
+    df = _extracted_df()
+
+    inferred_path = tmp_path / "inferred.parquet"
+    df.to_parquet(inferred_path)
+
+    typed_path = tmp_path / "typed.parquet"
+    dataset = TypedParquetDataset(
+        filepath=typed_path.as_posix(), column_types=COLUMN_TYPES
+    )
+    dataset.save(df)
+
+    results = {
+        "inferred": (inferred_path, _time_load(lambda: pd.read_parquet(inferred_path))),
+        "typed": (typed_path, _time_load(dataset.load)),
+    }
+    for name, (path, duration) in results.items():
+        print(
+            f"\n{name}: {NUM_ARTICLES:,} articles, {path.stat().st_size / 2**20:.1f} MiB, "
+            f"loaded in {duration:.2f}s"
+        )
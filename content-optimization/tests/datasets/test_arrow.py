@@ -0,0 +1,61 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from src.content_optimization.datasets.arrow import HivePartitionedDataset
+
+
+def test_hive_partitioned_dataset(tmp_path):
+    """
+    A test function for `HivePartitionedDataset` that checks the partitioning and the
+    predicate pushdown.
+
+    Args:
+        tmp_path (Path): The temporary directory of the dataset.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects one directory per content category
+        2. Expects the same data and column order as the saved data
+        3. Expects a filter on the content category to only scan the fragments of that category
+    """
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "content_category": ["medications", "cost-and-financing"] * 2,
+            "pr_name": ["HPB", "HPB", None, "HPB"],
+            "to_remove": [False, True, False, False],
+        }
+    )
+    dataset = HivePartitionedDataset(path=(tmp_path / "merged_data").as_posix())
+    dataset.save(
+        lambda: iter(
+            [
+                pa.Table.from_pandas(df.iloc[:2], preserve_index=False),
+                pa.Table.from_pandas(df.iloc[2:], preserve_index=False),
+            ]
+        )
+    )
+
+    assert sorted(path.name for path in (tmp_path / "merged_data").iterdir()) == [
+        "_common_metadata",
+        "content_category=cost-and-financing",
+        "content_category=medications",
+    ]
+
+    merged_data = dataset.load()
+    expected = pd.concat(
+        [
+            df[df["content_category"] == "cost-and-financing"],
+            df[df["content_category"] == "medications"],
+        ]
+    ).reset_index(drop=True)
+    pd.testing.assert_frame_equal(merged_data.to_table().to_pandas(), expected)
+
+    expression = (pc.field("content_category") == "medications") & (
+        pc.field("pr_name") == "HPB"
+    )
+    assert len(list(merged_data.get_fragments(filter=expression))) == 1
+    filtered_data = merged_data.to_table(columns=["id"], filter=expression).to_pandas()
+    assert filtered_data["id"].tolist() == [1]
@@ -0,0 +1,142 @@
+import fsspec
+import pandas as pd
+import pytest
+from src.content_optimization.datasets.excel import ParquetCachedExcelDataset
+
+
+@pytest.fixture
+def export(tmp_path) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "title": ["Rubella", "Measles", None],
+            "content_body": ["<p>Rubella</p>", "<p>Measles</p>", None],
+        }
+    )
+    df.to_excel(tmp_path / "export-published-diseases.xlsx", index=False)
+    return df
+
+
+def test_parquet_cached_excel_dataset(
+    tmp_path, export: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    A test function for `ParquetCachedExcelDataset` that checks the Parquet cache.
+
+    Args:
+        tmp_path (Path): The temporary directory of the Excel and Parquet files.
+        export (pd.DataFrame): The data in the Excel file.
+        monkeypatch (pytest.MonkeyPatch): The fixture to patch the Excel reader.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the Excel file to be converted to a single Parquet file on the first load
+        2. Expects later loads to read the Parquet file without parsing the Excel file
+        3. Expects a changed Excel file to replace its cached Parquet file
+    """
+    filepath = tmp_path / "export-published-diseases.xlsx"
+    cache_dir = tmp_path / "cache"
+    dataset = ParquetCachedExcelDataset(
+        filepath=filepath.as_posix(), cache_dir=cache_dir.as_posix()
+    )
+
+    pd.testing.assert_frame_equal(dataset.load(), export)
+    cached = list(cache_dir.glob("*.parquet"))
+    assert len(cached) == 1
+
+    with monkeypatch.context() as m:
+        m.setattr(pd, "read_excel", pytest.fail)
+        pd.testing.assert_frame_equal(dataset.load(), export)
+
+    export.loc[0, "title"] = "Rubella (German Measles)"
+    export.to_excel(filepath, index=False)
+
+    pd.testing.assert_frame_equal(dataset.load(), export)
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+    assert not cached[0].exists()
+
+
+def test_parquet_cached_excel_dataset_mixed_types(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    A test function for `ParquetCachedExcelDataset` with columns of mixed types, which
+    cannot be converted to Arrow as they are.
+
+    Args:
+        tmp_path (Path): The temporary directory of the Excel and Parquet files.
+        monkeypatch (pytest.MonkeyPatch): The fixture to patch the Excel reader.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the values of the columns of mixed types to be loaded as strings
+        2. Expects the Excel file to be converted to a Parquet file
+        3. Expects later loads to read the Parquet file without parsing the Excel file
+    """
+    export = pd.DataFrame(
+        {"id": [1, 2, 3], "keywords": ["rubella", 3.5, None], "pr_name": ["A", 5, "B"]}
+    )
+    filepath = tmp_path / "export-published-medications.xlsx"
+    export.to_excel(filepath, index=False)
+    cache_dir = tmp_path / "cache"
+
+    dataset = ParquetCachedExcelDataset(
+        filepath=filepath.as_posix(), cache_dir=cache_dir.as_posix()
+    )
+
+    expected = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "keywords": ["rubella", "3.5", None],
+            "pr_name": ["A", "5", "B"],
+        }
+    )
+    pd.testing.assert_frame_equal(dataset.load(), expected)
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+    with monkeypatch.context() as m:
+        m.setattr(pd, "read_excel", pytest.fail)
+        pd.testing.assert_frame_equal(dataset.load(), expected)
+
+
+def test_parquet_cached_excel_dataset_cache_protocol(
+    tmp_path, export: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    A test function for `ParquetCachedExcelDataset` with a cache directory on another
+    filesystem than the Excel file.
+
+    Args:
+        tmp_path (Path): The temporary directory of the Excel file.
+        export (pd.DataFrame): The data in the Excel file.
+        monkeypatch (pytest.MonkeyPatch): The fixture to patch the Excel reader.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the Parquet file to be written to the filesystem of the cache directory
+        2. Expects no Parquet file to be written next to the Excel file
+        3. Expects later loads to read the Parquet file without parsing the Excel file
+    """
+    memory_fs = fsspec.filesystem("memory")
+    cache_dir = f"memory:///{tmp_path.name}/cache"
+    dataset = ParquetCachedExcelDataset(
+        filepath=(tmp_path / "export-published-diseases.xlsx").as_posix(),
+        cache_dir=cache_dir,
+    )
+
+    try:
+        pd.testing.assert_frame_equal(dataset.load(), export)
+        assert len(memory_fs.glob(f"/{tmp_path.name}/cache/*.parquet")) == 1
+        assert not list(tmp_path.rglob("*.parquet"))
+
+        with monkeypatch.context() as m:
+            m.setattr(pd, "read_excel", pytest.fail)
+            pd.testing.assert_frame_equal(dataset.load(), export)
+    finally:
+        memory_fs.rm(f"/{tmp_path.name}", recursive=True)
@@ -0,0 +1,113 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from src.content_optimization.datasets.parquet import (
+    StreamingParquetDataset,
+    TypedParquetDataset,
+)
+from src.content_optimization.pipelines.data_processing.nodes import merge_data
+from src.content_optimization.pipelines.data_processing.schemas import (
+    EXTRACTED_COLUMN_TYPES,
+)
+
+COLUMN_TYPES = (
+    "content_optimization.pipelines.data_processing.schemas.EXTRACTED_COLUMN_TYPES"
+)
+
+
+def _extracted_df(content_category: str) -> pd.DataFrame:
+    """Returns extracted data as stored by `extract_data`, i.e. with tuple records."""
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "content_category": content_category,
+            "related_sections": [["Fever"], [], None],
+            "extracted_tables": [[[["Dose", "Age"], ["5ml", "1-5"]]], None, None],
+            "extracted_raw_html_tables": [["<table></table>"], None, None],
+            "extracted_links": [[("Fever", "/fever"), ("Rash", None)], [], None],
+            "extracted_headers": [[("Symptoms", "h2"), ("Causes", "h3")], [], None],
+            "extracted_images": [[("Thermometer", "/thermometer.png")], [], None],
+            "sections": [
+                [("Symptoms", "h2", 0, 9, 20), ("Causes", "h3", 20, 27, 42)],
+                [],
+                None,
+            ],
+        }
+    )
+
+
+def test_typed_parquet_dataset(tmp_path):
+    """
+    A test function for `TypedParquetDataset` that checks the Arrow types and the round trip.
+
+    Args:
+        tmp_path (Path): The temporary directory of the dataset.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the extracted columns to be stored with the Arrow types of the schema,
+            even if all values of a column are null
+        2. Expects the extracted columns to be loaded as `pd.ArrowDtype`
+        3. Expects the records to be loaded as dictionaries with the same values
+        4. Expects the same data after saving the loaded data again
+    """
+    filepath = (tmp_path / "medications.parquet").as_posix()
+    dataset = TypedParquetDataset(filepath=filepath, column_types=COLUMN_TYPES)
+    df = _extracted_df("medications")
+    df["extracted_raw_html_tables"] = None
+    dataset.save(df)
+
+    schema = pq.read_schema(filepath)
+    assert schema.names == df.columns.tolist()
+    for column, arrow_type in EXTRACTED_COLUMN_TYPES.items():
+        assert schema.field(column).type == arrow_type
+
+    typed_data = dataset.load()
+    for column in EXTRACTED_COLUMN_TYPES:
+        assert isinstance(typed_data[column].dtype, pd.ArrowDtype)
+
+    assert typed_data["extracted_links"].iloc[0] == [
+        {"text": "Fever", "url": "/fever"},
+        {"text": "Rash", "url": None},
+    ]
+    assert typed_data["extracted_headers"].iloc[1] == []
+    assert typed_data["extracted_headers"].isna().tolist() == [False, False, True]
+    assert typed_data["extracted_tables"].iloc[0] == [[["Dose", "Age"], ["5ml", "1-5"]]]
+
+    dataset.save(typed_data)
+    pd.testing.assert_frame_equal(dataset.load(), typed_data)
+
+
+def test_merge_data_typed_partitions(tmp_path):
+    """
+    A test function for `merge_data` with partitions saved by `TypedParquetDataset`.
+
+    Args:
+        tmp_path (Path): The temporary directory of the datasets.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the merged data to keep the Arrow types of the extracted columns
+    """
+    all_contents_mapped = {}
+    for content_category in ["medications", "live-healthy-articles"]:
+        dataset = TypedParquetDataset(
+            filepath=(tmp_path / f"{content_category}.parquet").as_posix(),
+            column_types=COLUMN_TYPES,
+        )
+        dataset.save(_extracted_df(content_category))
+        all_contents_mapped[content_category] = dataset.load
+
+    merged_data, _ = merge_data(all_contents_mapped)
+    output = StreamingParquetDataset(filepath=(tmp_path / "merged.parquet").as_posix())
+    output.save(merged_data)
+
+    schema = pq.read_schema(tmp_path / "merged.parquet")
+    assert schema.field("extracted_headers").type.value_type == pa.struct(
+        [("header", pa.string()), ("level", pa.string())]
+    )
+    assert output.load()["id"].tolist() == [1, 2, 3] * 2
@@ -0,0 +1,137 @@
+import pytest
+from kedro.io import DatasetError
+from src.content_optimization.datasets.text_store import (
+    PackedTextDataset,
+    PackedTextStore,
+)
+
+
+def test_packed_text_dataset(tmp_path):
+    """
+    A test function for `PackedTextDataset` that checks the lookup of texts by article ID.
+
+    Args:
+        tmp_path (Path): The temporary directory of the dataset.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects a single packed file instead of a text file per article
+        2. Expects the same texts by article ID, including non-ASCII and empty texts
+        3. Expects a KeyError for articles that are not in the store
+    """
+    texts = {
+        1437892: (
+            "diseases-and-conditions/Rubella_1437892",
+            "Rubella is a viral infection.",
+        ),
+        1000: ("medications/Paracetamol_1000", "Take 500 mg – 1 g every 4–6 hours."),
+        1445577: ("live-healthy-articles/How Dangerous Is Rubella__1445577", ""),
+    }
+    dataset = PackedTextDataset(
+        filepath=(tmp_path / "all_extracted_text.pack").as_posix()
+    )
+    dataset.save(texts)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["all_extracted_text.pack"]
+
+    with dataset.load() as store:
+        assert list(store) == [1000, 1437892, 1445577]
+        for article_id, (file_path, text) in texts.items():
+            assert store[article_id] == text
+            assert store.path(article_id) == file_path
+        with pytest.raises(KeyError):
+            store[1001]
+
+
+def test_packed_text_dataset_append(tmp_path):
+    """
+    A test function for `PackedTextDataset` saved several times, e.g. by a generator node.
+
+    Args:
+        tmp_path (Path): The temporary directory of the dataset.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the texts of the previous run to be replaced by the first save
+        2. Expects later saves to append to the texts of the first save
+        3. Expects an article saved again to have its latest text
+    """
+    filepath = (tmp_path / "all_extracted_text.pack").as_posix()
+    PackedTextDataset(filepath=filepath).save({1: ("medications/Old_1", "Old run")})
+
+    dataset = PackedTextDataset(filepath=filepath)
+    dataset.save({2: ("medications/A_2", "A"), 3: ("medications/B_3", "B")})
+    dataset.save({4: ("cost-and-financing/C_4", "C"), 2: ("medications/A_2", "A2")})
+
+    with dataset.load() as store:
+        assert dict(store) == {2: "A2", 3: "B", 4: "C"}
+
+
+def test_packed_text_dataset_append_error(tmp_path):
+    """
+    A test function for `PackedTextDataset` with a save that fails while appending.
+
+    Args:
+        tmp_path (Path): The temporary directory of the dataset.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the error of the failed save to be raised
+        2. Expects the texts of the previous saves to be loaded after the failed save
+        3. Expects no temporary file to be left behind
+    """
+    filepath = (tmp_path / "all_extracted_text.pack").as_posix()
+    dataset = PackedTextDataset(filepath=filepath)
+    dataset.save({2: ("medications/A_2", "A"), 3: ("medications/B_3", "B")})
+
+    # The text of the second article cannot be encoded, after the first one is written
+    with pytest.raises(DatasetError):
+        dataset.save({4: ("cost-and-financing/C_4", "C"), 5: ("medications/D_5", 5)})
+
+    with dataset.load() as store:
+        assert dict(store) == {2: "A", 3: "B"}
+    assert [path.name for path in tmp_path.iterdir()] == ["all_extracted_text.pack"]
+
+
+def test_packed_text_store_export(tmp_path):
+    """
+    A test function for `PackedTextStore.export` and the `export_path` of `PackedTextDataset`.
+
+    Args:
+        tmp_path (Path): The temporary directory of the dataset.
+
+    Raises:
+        AssertionError: If the exported text files differ from the saved texts.
+    """
+    texts = {
+        1: ("medications/Paracetamol_1", "Paracetamol"),
+        2: ("cost-and-financing/MediShield Life_2", "MediShield Life"),
+    }
+    dataset = PackedTextDataset(
+        filepath=(tmp_path / "all_extracted_text.pack").as_posix(),
+        export_path=(tmp_path / "saved").as_posix(),
+    )
+    dataset.save(texts)
+    with dataset.load() as store:
+        store.export((tmp_path / "exported").as_posix())
+
+    for directory in ["saved", "exported"]:
+        for file_path, text in texts.values():
+            assert (tmp_path / directory / f"{file_path}.txt").read_text() == text
+
+
+def test_packed_text_store_invalid_file():
+    """
+    A test function for `PackedTextStore` with a buffer that is not a packed text file.
+
+    Raises:
+        AssertionError: If no ValueError is raised.
+    """
+    with pytest.raises(ValueError, match="Not a packed text file"):
+        PackedTextStore.from_buffer(b"Rubella is a viral infection.")
@@ -1,10 +1,13 @@
 from pathlib import Path
 
+import pandas as pd
 import pytest
 from kedro.config import OmegaConfigLoader
 from kedro.io import DataCatalog
 from kedro_datasets.pandas.parquet_dataset import ParquetDataset
 from kedro_datasets.partitions.partitioned_dataset import PartitionedDataset
+from src.content_optimization.datasets.arrow import HivePartitionedDataset
+from src.content_optimization.datasets.parquet import StreamingParquetDataset
 
 # Get the project root directory
 project_path = Path.cwd()
@@ -46,7 +49,10 @@ def datasets() -> dict:
             ).as_posix(),
         ),
         "all_contents_extracted": PartitionedDataset(
-            dataset="pandas.ParquetDataset",
+            dataset={
+                "type": "content_optimization.datasets.parquet.TypedParquetDataset",
+                "column_types": "content_optimization.pipelines.data_processing.schemas.EXTRACTED_COLUMN_TYPES",
+            },
             path=(
                 project_path
                 / "tests"
@@ -55,11 +61,20 @@ def datasets() -> dict:
                 / "all_contents_extracted"
             ).as_posix(),
         ),
-        "merged_data": ParquetDataset(
+        "merged_data": StreamingParquetDataset(
             filepath=(
                 project_path / "tests" / "data" / "03_primary" / "merged_data.parquet"
             ).as_posix(),
         ),
+        "merged_data_partitioned": HivePartitionedDataset(
+            path=(
+                project_path
+                / "tests"
+                / "data"
+                / "03_primary"
+                / "merged_data_partitioned"
+            ).as_posix(),
+        ),
         "filtered_data_with_keywords": ParquetDataset(
             filepath=(
                 project_path
@@ -92,11 +107,22 @@ def catalog(datasets: dict, parameters: dict) -> DataCatalog:
             "all_contents_added": datasets["all_contents_added"],
             "all_contents_extracted": datasets["all_contents_extracted"],
             "merged_data": datasets["merged_data"],
+            "merged_data_partitioned": datasets["merged_data_partitioned"],
+            "extraction_cache": pd.DataFrame(columns=["key", "result", "last_used"]),
             "params:columns_to_add": parameters["columns_to_add"],
             "params:columns_to_keep": parameters["columns_to_keep"],
             "params:default_columns": parameters["default_columns"],
             "params:word_count_cutoff": parameters["word_count_cutoff"],
             "params:whitelist": parameters["whitelist"],
+            "params:blacklist": parameters["blacklist"],
+            "params:updated_urls": parameters["updated_urls"],
+            "params:l1_mappings": parameters["l1_mappings"],
+            "params:l2_mappings": parameters["l2_mappings"],
+            "params:extraction": parameters["extraction"],
+            "params:near_duplicates": parameters["near_duplicates"],
+            "params:streaming": parameters["streaming"],
+            "params:string_dtype": parameters["string_dtype"],
+            "params:dataframe_engine": parameters["dataframe_engine"],
             "params:cfg": parameters["cfg"],
             "params:selection_options.only_confirmed": parameters["selection_options"][
                 "only_confirmed"
@@ -109,6 +135,61 @@ def catalog(datasets: dict, parameters: dict) -> DataCatalog:
             "params:keywords.use_mmr": parameters["keywords"]["use_mmr"],
             "params:keywords.diversity": parameters["keywords"]["diversity"],
             "params:keywords.top_n": parameters["keywords"]["top_n"],
+            "params:keywords.columns": parameters["keywords"]["columns"],
         }
     )
     return catalog
+
+
+@pytest.fixture
+def articles() -> pd.DataFrame:
+    """
+    A small set of articles in the same shape as a partition of `all_contents_added`,
+    covering the HTML elements handled by the `HTMLExtractor`.
+    """
+    bodies = [
+        (
+            "<div><h2>What is Rubella?</h2><p>Rubella is a contagious viral infection "
+            "caused by the <strong>rubella virus</strong>.</p><ul><li>Fever</li>"
+            "<li>Rash</li></ul><p><strong>Read these next:</strong></p><ul>"
+            '<li><a href="/rubella-vaccine">Rubella Vaccine</a></li></ul></div>'
+        ),
+        (
+            "<div><h2>Childhood Immunisation Schedule</h2><table><tr><th>Vaccine "
+            "name</th><th>Age given</th></tr><tr><td>BCG</td><td>Birth</td></tr>"
+            "</table><p>Keep your child's health booklet updated.</p>"
+            '<img src="/schedule.png" alt="Immunisation schedule"></div>'
+        ),
+        (
+            '<div><h3>Eating Well</h3><p>Eat more fruit.<br>Drink water.</p><ol start="2">'
+            '<li>Plan meals</li><li>Shop smart</li></ol><p><a href="#footnote1">1</a>'
+            '<a href="https://www.healthhub.sg/apps" title="HealthHub">app</a></p></div>'
+        ),
+        "No HTML tags in this content body",
+        None,
+        (
+            "<div><h2>What is Rubella?</h2><p>Rubella is a contagious viral infection "
+            "caused by the <strong>rubella virus</strong>.</p></div>"
+        ),
+    ]
+    df = pd.DataFrame(
+        {
+            "id": [1000 + i for i in range(len(bodies))],
+            "content_name": [f"Article {i}" for i in range(len(bodies))],
+            "title": [f"Article/{i}: Title" for i in range(len(bodies))],
+            "article_category_names": ["Conditions and Illnesses"] * len(bodies),
+            "full_url": [
+                f"https://www.healthhub.sg/a-z/article-{i}" for i in range(len(bodies))
+            ],
+            "friendly_url": [f"article-{i}" for i in range(len(bodies))],
+            "content_body": bodies,
+            "keywords": [None] * len(bodies),
+            "content_category": ["diseases-and-conditions"] * len(bodies),
+        }
+    )
+    df["to_remove"] = df["content_body"].isna() | ~df["content_body"].str.contains(
+        "<", na=False
+    )
+    df["remove_type"] = None
+
+    return df
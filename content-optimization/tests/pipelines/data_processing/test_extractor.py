@@ -0,0 +1,231 @@
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.content_optimization.pipelines.data_processing.extractor import (
+    METRICS_STAGES,
+    HTMLExtractor,
+)
+
+
+@pytest.mark.parametrize("index", [0, 1, 2])
+def test_extract_all(articles: pd.DataFrame, index: int):
+    """
+    A test function for `HTMLExtractor.extract_all` that checks the individual
+    extractor methods against the result of the single traversal.
+
+    Args:
+        articles (pd.DataFrame): The articles to extract.
+        index (int): The index of the article to extract.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the individual extractor methods to return the result of `extract_all`
+        2. Expects the result to be independent of the order the methods are called in
+    """
+    row = articles.iloc[index]
+    args = (
+        row["content_name"],
+        row["content_category"],
+        row["full_url"],
+        row["content_body"],
+    )
+
+    result = HTMLExtractor(*args).extract_all()
+
+    # Extract the main content first, which modifies the tree
+    extractor = HTMLExtractor(*args)
+    assert extractor.extract_text() == result.extracted_content_body
+    assert extractor.check_for_table() == result.has_table
+    assert extractor.check_for_image() == result.has_image
+    assert extractor.extract_related_sections() == result.related_sections
+    assert extractor.extract_tables() == result.extracted_tables
+    assert extractor.extract_raw_html_tables() == result.extracted_raw_html_tables
+    assert extractor.extract_links() == result.extracted_links
+    assert extractor.extract_headers() == result.extracted_headers
+    assert extractor.extract_img_links_and_alt_text() == result.extracted_images
+    assert extractor.extract_sections() == result.sections
+
+
+def test_extract_sections():
+    """
+    A test function for `HTMLExtractor.extract_sections` that checks the offsets of the
+    sections in the extracted content body.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects a section for every header in the main content, in document order
+        2. Expects every section to start with its header and to end where the next one starts
+        3. Expects repeated headers, headers merged with the following text and headers
+           within containers to be located
+        4. Expects the content before the first header not to be a section
+    """
+    html_content = (
+        "<p>Rubella is a contagious viral infection.</p><div><h2>Symptoms</h2><p>Fever"
+        "</p><p>Symptoms</p></div><h3>Tips</h3><p>Rest well.</p><h3>Symptoms</h3><ul>"
+        "<li>Rash</li></ul><div><span><h4>(Optional) Reading</h4></span></div>"
+    )
+    extractor = HTMLExtractor(
+        "Rubella", "diseases-and-conditions", "https://www.healthhub.sg", html_content
+    )
+    content_body = extractor.extract_text()
+    sections = extractor.extract_sections()
+
+    assert [(header, level) for header, level, _, _, _ in sections] == [
+        ("Symptoms", "h2"),
+        ("Tips", "h3"),
+        ("Symptoms", "h3"),
+        ("(Optional) Reading", "h4"),
+    ]
+    assert content_body[: sections[0][2]].strip() == (
+        "Rubella is a contagious viral infection."
+    )
+    for (header, _, start, content_start, end), next_section in zip(
+        sections, sections[1:] + [None]
+    ):
+        assert content_body.startswith(header, start)
+        assert content_body[start:content_start].strip() == header
+        assert end == (next_section[2] if next_section else len(content_body))
+
+    assert content_body[sections[0][3] : sections[0][4]].startswith("Fever")
+    assert content_body[sections[1][3] : sections[1][4]].startswith("Rest well.")
+    assert content_body[sections[2][3] : sections[2][4]].startswith("- Rash")
+
+
+def test_extract_sections_with_adjacent_headers():
+    """
+    A test function for `HTMLExtractor.extract_sections` with adjacent and short headers,
+    which are merged with the next header or text in the extracted content body.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects a section for every header, including a header merged with the previous one
+        2. Expects the content of every section to start after its header, whether the header
+           is followed by a newline, several newlines or a space
+        3. Expects the sections of adjacent headers to have no content
+    """
+    html_content = (
+        "<p>Questions about rubella.</p><h2>FAQ</h2><h3>Q1</h3><h3>Q2</h3>"
+        "<p>Is rubella contagious?</p><h3>Tips</h3><p>Rest well.</p><h3>Symptoms</h3>"
+        "<h4>Rash</h4><p>Red spots.</p>"
+    )
+    extractor = HTMLExtractor(
+        "Rubella", "diseases-and-conditions", "https://www.healthhub.sg", html_content
+    )
+    content_body = extractor.extract_text()
+    sections = extractor.extract_sections()
+
+    assert [
+        (header, content_body[content_start:end].strip())
+        for header, _, _, content_start, end in sections
+    ] == [
+        ("FAQ", ""),
+        ("Q1", ""),
+        ("Q2", "Is rubella contagious?"),
+        ("Tips", "Rest well."),
+        ("Symptoms", ""),
+        ("Rash", "Red spots."),
+    ]
+    for header, _, start, content_start, _ in sections:
+        assert content_body.startswith(header, start)
+        assert content_body[start:content_start].strip() == header
+
+
+@pytest.mark.parametrize("index", [0, 1, 2])
+def test_extraction_metrics(articles: pd.DataFrame, index: int):
+    """
+    A test function for the `ExtractionMetrics` collected by the `HTMLExtractor`.
+
+    Args:
+        articles (pd.DataFrame): The articles to extract.
+        index (int): The index of the article to extract.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects no metrics and no timed methods unless the metrics are enabled
+        2. Expects the same result with and without the metrics
+        3. Expects the elements of the article to be counted
+        4. Expects the durations of the stages of the article only
+    """
+    row = articles.iloc[index]
+    args = (
+        row["content_name"],
+        row["content_category"],
+        row["full_url"],
+        row["content_body"],
+    )
+
+    extractor = HTMLExtractor(*args)
+    result = extractor.extract_all()
+    assert extractor.metrics is None
+    assert not set(METRICS_STAGES).intersection(vars(extractor))
+
+    extractor = HTMLExtractor(*args, collect_metrics=True)
+    assert extractor.extract_all() == result
+
+    metrics = extractor.metrics
+    assert metrics.dom_nodes > 0
+    assert metrics.tables == len(result.extracted_tables or [])
+    assert metrics.images == len(result.extracted_images)
+    assert metrics.headers == len(result.extracted_headers)
+    assert metrics.links >= len(result.extracted_links)
+    assert metrics.fragments >= metrics.cleaned_fragments > 0
+
+    stages = set(METRICS_STAGES.values())
+    if not result.has_table:
+        stages.remove("process_tables")
+    assert set(metrics.durations) == stages
+    assert all(duration >= 0 for duration in metrics.durations.values())
+
+
+def _clean_text_by_replace(text: str) -> str:
+    """The chained replacements of `HTMLExtractor.clean_text` used as reference."""
+    text = text.replace("\u2013", "-")
+    text = unicodedata.normalize("NFKD", text)
+    text = text.encode("ascii", "ignore").decode("utf-8")
+    text = text.replace("\xa0", " ")
+    text = text.replace("\u200b", "")
+    text = text.replace("\u2028", "\n")
+    text = text.replace("\u2029", "\n")
+    text = text.replace("_x000D_", "")
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+@pytest.mark.parametrize("length", [5, 50, 500])
+def test_clean_text(length: int):
+    """
+    A test function for `HTMLExtractor.clean_text` that compares the translation table
+    normaliser with the chained replacements on random texts.
+
+    Args:
+        length (int): The number of characters in each random text.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the same cleaned text for short (memoised) and long texts
+        2. Expects `clean_texts` to clean a batch of texts in the same order
+    """
+    rng = np.random.default_rng(length)
+    alphabet = list(
+        "ab Z1_x0D.\t\n\r\x0b\x0c\x1c\u2013\u2014\xa0\u200b\u2028\u2029\u3000"
+        "\xa9\xe9\u0301\ufb01\u2122\u00bd\u2460\ufe32\u4e2d"
+    ) + ["_x000D_"]
+    texts = ["".join(rng.choice(alphabet, size=length)) for _ in range(200)]
+
+    expected = [_clean_text_by_replace(text) for text in texts]
+
+    assert [HTMLExtractor.clean_text(text) for text in texts] == expected
+    assert HTMLExtractor.clean_texts(texts) == expected
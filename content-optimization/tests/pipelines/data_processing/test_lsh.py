@@ -0,0 +1,66 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+from src.content_optimization.pipelines.data_processing.lsh import (
+    find_near_duplicates,
+    jaccard_similarity,
+    shingle_hashes,
+)
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.8])
+def test_find_near_duplicates(threshold: float):
+    """
+    A test function for `find_near_duplicates` that compares the near-duplicate pairs
+    with an all-pairs comparison of the exact Jaccard similarity.
+
+    Args:
+        threshold (float): The minimum Jaccard similarity of a near-duplicate pair.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects no pair below the threshold
+        2. Expects every near-duplicate pair of the all-pairs comparison to be found
+    """
+    rng = np.random.default_rng(0)
+    vocabulary = [f"word{i}" for i in range(500)]
+    texts = []
+    for _ in range(20):
+        words = rng.choice(vocabulary, size=150).tolist()
+        texts.append(" ".join(words))
+        # Near duplicates that differ by a footer or a few edited words
+        texts.append(" ".join(words + ["read", "these", "next"]))
+        edited = words.copy()
+        edited[rng.integers(150)] = "edited"
+        texts.append(" ".join(edited))
+
+    pairs = find_near_duplicates(texts, threshold=threshold, bands=32)
+
+    hashes = [shingle_hashes(text) for text in texts]
+    expected = {
+        (i, j)
+        for i, j in combinations(range(len(texts)), 2)
+        if jaccard_similarity(hashes[i], hashes[j]) >= threshold
+    }
+
+    assert all(similarity >= threshold for _, _, similarity in pairs)
+    assert {(i, j) for i, j, _ in pairs} == expected
+
+
+def test_find_near_duplicates_short_texts():
+    """
+    A test function for `find_near_duplicates` with texts shorter than a shingle.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects identical short texts to be near duplicates
+        2. Expects empty texts to never be near duplicates
+    """
+    pairs = find_near_duplicates(["Fever", "", "fever", "Rash", ""])
+
+    assert pairs == [(0, 2, 1.0)]
@@ -1,12 +1,25 @@
 import re
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 from kedro.io import DataCatalog
+from kedro_datasets.pandas import ParquetDataset
+from src.content_optimization.datasets.parquet import (
+    StreamingParquetDataset,
+    TypedParquetDataset,
+)
+from src.content_optimization.pipelines.data_processing import nodes
 from src.content_optimization.pipelines.data_processing.nodes import (
+    EXTRACTION_METRICS_COLUMNS,
     add_data,
+    compile_ia_mappings,
+    compile_overrides,
+    deduplicate_data,
     extract_data,
+    map_data,
     merge_data,
+    process_partitions,
     standardize_columns,
 )
 
@@ -63,8 +76,16 @@ def test_standardize_columns(catalog: DataCatalog, num_cols: int = 26):
 def test_add_data(catalog: DataCatalog):
     all_contents_standardized = catalog.load("all_contents_standardized")
     missing_contents = catalog.load("missing_contents")
+    overrides = compile_overrides(
+        missing_contents,
+        catalog.load("params:updated_urls"),
+        catalog.load("params:whitelist"),
+        catalog.load("params:blacklist"),
+    )
 
-    all_contents_added = add_data(all_contents_standardized, missing_contents)
+    all_contents_added, applied_overrides = add_data(
+        all_contents_standardized, overrides
+    )
 
     # Check if output is a dictionary
     assert isinstance(all_contents_added, dict), "Expected a dictionary"
@@ -96,6 +117,15 @@ def test_add_data(catalog: DataCatalog):
             r"Value exceeded maximum cell size", row["content_body"]
         ), "Content body was not successfully replaced"
 
+    # Check if every replaced content body is reported with its source
+    replaced = applied_overrides[applied_overrides["override"] == "content_body"]
+    assert set(replaced["friendly_url"]) == set(
+        filtered_df["friendly_url"]
+    ), "Every replaced content body should be reported"
+    assert (
+        replaced["source"].str.startswith("missing_contents:").all()
+    ), "The source of a replaced content body should be its file"
+
 
 @pytest.mark.parametrize("word_count_cutoff", [50, 90])
 def test_extract_data(catalog: DataCatalog, word_count_cutoff: int):
@@ -116,10 +146,9 @@ def test_extract_data(catalog: DataCatalog, word_count_cutoff: int):
         4. Expects the extracted content body to meet the word count cutoff
     """
     whitelist = catalog.load("params:whitelist")
-    all_contents_extracted, all_extracted_text = extract_data(
-        catalog.load("all_contents_added"),
-        word_count_cutoff,
-        whitelist,
+    overrides = compile_overrides({}, {}, whitelist, catalog.load("params:blacklist"))
+    all_contents_extracted, all_extracted_text, _, _, _ = extract_data(
+        catalog.load("all_contents_added"), word_count_cutoff, overrides
     )
 
     # Check if output is a dictionary
@@ -157,6 +186,246 @@ def test_extract_data(catalog: DataCatalog, word_count_cutoff: int):
         ), "Found extracted content body below the word count cutoff that is not removed"
 
 
+def test_extract_data_parallel(articles: pd.DataFrame):
+    """
+    A test function for the parallel mode of `extract_data` that compares its output
+    with the serial mode.
+
+    Args:
+        articles (pd.DataFrame): The articles to extract as a single content category.
+
+    Raises:
+        AssertionError: If the outputs of the parallel and serial modes differ.
+
+    Note:
+        1. Expects the same extracted dataframes in the same order
+        2. Expects the same extracted text files in the same order
+    """
+    all_contents_added = {
+        "diseases-and-conditions": lambda: articles.copy(),
+        "live-healthy-articles": lambda: articles.assign(
+            content_category="live-healthy-articles"
+        ),
+    }
+
+    overrides = compile_overrides({}, {}, [1003], {})
+
+    serial_extracted, serial_text, _, _, _ = extract_data(
+        all_contents_added, 5, overrides, {"cache": {"enabled": False}}
+    )
+    parallel_extracted, parallel_text, _, _, _ = extract_data(
+        all_contents_added,
+        5,
+        overrides,
+        {
+            "parallel": True,
+            "workers": 2,
+            "chunk_size": 2,
+            "cache": {"enabled": False},
+        },
+    )
+
+    # Check if the partitions are identical and in the same order
+    assert list(serial_extracted) == list(parallel_extracted)
+    for content_category, df in serial_extracted.items():
+        pd.testing.assert_frame_equal(df, parallel_extracted[content_category])
+
+    # Check if the text files are identical and in the same order
+    assert list(serial_text.items()) == list(parallel_text.items())
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_extract_data_metrics(articles: pd.DataFrame, parallel: bool):
+    """
+    A test function for the extraction metrics report of `extract_data`.
+
+    Args:
+        articles (pd.DataFrame): The articles to extract as a single content category.
+        parallel (bool): Whether to extract the articles in a process pool.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects an empty report with the report columns when the metrics are disabled
+        2. Expects the same extracted data with and without the metrics
+        3. Expects a row of metrics for every content category
+        4. Expects the articles found in the extraction cache not to be counted
+    """
+    all_contents_added = {
+        "diseases-and-conditions": lambda: articles.copy(),
+        "live-healthy-articles": lambda: articles.assign(
+            content_category="live-healthy-articles"
+        ),
+    }
+    overrides = compile_overrides({}, {}, [1003], {})
+    extraction_cfg = {"parallel": parallel, "workers": 2, "cache": {"enabled": False}}
+
+    extracted, _, _, _, metrics_report = extract_data(
+        all_contents_added, 5, overrides, extraction_cfg
+    )
+    assert metrics_report.empty
+    assert metrics_report.columns.tolist() == EXTRACTION_METRICS_COLUMNS
+
+    extraction_cfg["metrics"] = True
+    metrics_extracted, _, _, _, metrics_report = extract_data(
+        all_contents_added, 5, overrides, extraction_cfg
+    )
+    for content_category, df in extracted.items():
+        pd.testing.assert_frame_equal(df, metrics_extracted[content_category])
+
+    assert metrics_report.columns.tolist() == EXTRACTION_METRICS_COLUMNS
+    assert metrics_report["content_category"].tolist() == list(all_contents_added)
+    num_extracted = (~articles["to_remove"] | articles["id"].isin([1003])).sum()
+    assert (metrics_report["articles"] == num_extracted).all()
+    assert (
+        metrics_report["tables"] == articles["content_body"].str.count("<table").sum()
+    ).all()
+    assert (metrics_report["total_s"] >= metrics_report["max_article_s"]).all()
+
+    # Every extracted article is found in the cache of the previous run
+    extraction_cfg["cache"] = {"enabled": True}
+    _, _, extraction_cache, _, _ = extract_data(
+        all_contents_added, 5, overrides, extraction_cfg
+    )
+    _, _, _, _, metrics_report = extract_data(
+        all_contents_added, 5, overrides, extraction_cfg, extraction_cache
+    )
+    assert (metrics_report["articles"] == 0).all()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_process_partitions(articles: pd.DataFrame, tmp_path, workers: int):
+    """
+    A test function for `process_partitions` that compares the fused stages with the
+    nodes of the `data_processing` pipeline.
+
+    Args:
+        articles (pd.DataFrame): The articles to process as each content category.
+        tmp_path (Path): The temporary directory of the raw Excel exports.
+        workers (int): The number of worker processes.
+
+    Raises:
+        AssertionError: If the outputs of the fused stages and the nodes differ.
+
+    Note:
+        1. Expects the same processed dataframes as `map_data` for every content category
+        2. Expects the same extracted texts as `extract_data`
+        3. Expects the reports of the flagging rules and applied overrides of every content category
+    """
+    content_categories = ["diseases-and-conditions", "live-healthy-articles"]
+    raw = articles.drop(columns=["content_category", "to_remove", "remove_type"])
+    default_columns = raw.columns.tolist()
+    all_contents = {}
+    for i, content_category in enumerate(content_categories):
+        # Loaded from files, so that the partitions can be sent to worker processes
+        dataset = ParquetDataset(filepath=str(tmp_path / f"{content_category}.parquet"))
+        # Article IDs are unique across content categories
+        dataset.save(raw.assign(id=raw["id"] + 1000 * (1 - i)))
+        all_contents[f"export-published-{content_category}_2024"] = dataset.load
+
+    columns_to_keep = {
+        content_category: default_columns for content_category in content_categories
+    }
+    overrides = compile_overrides({}, {}, [1003], {1000: "Irrelevant Content"})
+    extraction_cfg = {"cache": {"enabled": False}}
+    ia_mappings = compile_ia_mappings(
+        {"diseases-and-conditions": {"Diseases": ["Conditions and Illnesses"]}},
+        {"diseases-and-conditions": {"Infections": ["Conditions and Illnesses"]}},
+    )
+
+    # Run the nodes of the `data_processing` pipeline one after another
+    all_contents_standardized = standardize_columns(
+        all_contents, {}, columns_to_keep, default_columns
+    )
+    all_contents_added, _ = add_data(
+        {k: (lambda df=df: df.copy()) for k, df in all_contents_standardized.items()},
+        overrides,
+    )
+    all_contents_extracted, all_extracted_text, _, _, _ = extract_data(
+        {k: (lambda df=df: df.copy()) for k, df in all_contents_added.items()},
+        5,
+        overrides,
+        extraction_cfg,
+    )
+    all_contents_mapped = map_data(
+        {k: (lambda df=df: df.copy()) for k, df in all_contents_extracted.items()},
+        ia_mappings,
+    )
+
+    all_contents_processed, processed_text, processing_reports = {}, {}, {}
+    for partitions, extracted_text, reports in process_partitions(
+        all_contents,
+        {},
+        columns_to_keep,
+        default_columns,
+        overrides,
+        5,
+        extraction_cfg,
+        None,
+        ia_mappings,
+        {"workers": workers},
+    ):
+        all_contents_processed.update(partitions)
+        processed_text.update(extracted_text)
+        processing_reports.update(reports)
+
+    assert set(all_contents_processed) == set(content_categories)
+    for content_category, df in all_contents_mapped.items():
+        pd.testing.assert_frame_equal(all_contents_processed[content_category], df)
+    assert processed_text == all_extracted_text
+
+    assert set(processing_reports) == {
+        f"{content_category}/{report}"
+        for content_category in content_categories
+        for report in ["flagging_rules_report", "applied_overrides"]
+    }
+    rules_report = processing_reports["live-healthy-articles/flagging_rules_report"]
+    assert rules_report.set_index("rule").at["blacklist", "flagged"] == 1
+
+
+def test_extract_data_cache(articles: pd.DataFrame, monkeypatch: pytest.MonkeyPatch):
+    """
+    A test function for the extraction cache of `extract_data` that compares the output
+    of a cold run with a warm run.
+
+    Args:
+        articles (pd.DataFrame): The articles to extract as a single content category.
+        monkeypatch (pytest.MonkeyPatch): The fixture to patch the extraction of an article.
+
+    Raises:
+        AssertionError: If the outputs of the cold and warm runs differ.
+
+    Note:
+        1. Expects one cache entry per distinct HTML content extracted in the cold run
+        2. Expects no article to be extracted in the warm run
+        3. Expects the same extracted dataframes and text files in both runs
+    """
+    all_contents_added = {"diseases-and-conditions": lambda: articles.copy()}
+    overrides = compile_overrides({}, {}, [1003], {})
+
+    cold_extracted, cold_text, extraction_cache, _, _ = extract_data(
+        all_contents_added, 5, overrides, {}, None
+    )
+    extracted = articles[~articles["to_remove"] | articles["id"].isin([1003])]
+    assert len(extraction_cache) == extracted["content_body"].nunique()
+
+    def _extract_article(article):
+        raise AssertionError(f"Article {article[0]} was extracted on a cache hit")
+
+    monkeypatch.setattr(nodes, "_extract_article", _extract_article)
+    warm_extracted, warm_text, warm_cache, _, _ = extract_data(
+        all_contents_added, 5, overrides, {}, extraction_cache
+    )
+
+    pd.testing.assert_frame_equal(
+        cold_extracted["diseases-and-conditions"],
+        warm_extracted["diseases-and-conditions"],
+    )
+    assert list(cold_text.items()) == list(warm_text.items())
+    assert set(warm_cache["key"]) == set(extraction_cache["key"])
+
+
 def test_merge_data(catalog: DataCatalog):
     """
     A test function for `merge_data` that checks the output data.
@@ -168,16 +437,20 @@ def test_merge_data(catalog: DataCatalog):
         AssertionError: If the output data does not meet the specified criteria (see below).
 
     Note:
-        1. Expects a dataframe as output
+        1. Expects a stream of Arrow tables with the same schema as output
         2. Expects the total number of rows in the output data equal to the sum of the rows in the input data
     """
     all_contents_extracted = catalog.load("all_contents_extracted")
-    merged_df = merge_data(all_contents_extracted)
-
-    # Check if output is a dataframe
-    assert isinstance(merged_df, pd.DataFrame), "Expected a dataframe"
+    merged_data, _ = merge_data(all_contents_extracted)
+    tables = list(merged_data())
+
+    # Check if output is a stream of tables with the same schema
+    assert all(isinstance(table, pa.Table) for table in tables), "Expected tables"
+    assert all(
+        table.schema.equals(tables[0].schema) for table in tables
+    ), "Expected the same schema across all tables"
     # Check if output contains the correct number of rows
-    assert merged_df.shape[0] == sum(
+    assert sum(table.num_rows for table in tables) == sum(
         [
             partition_load_func().shape[0]
             for partition_load_func in all_contents_extracted.values()
@@ -185,6 +458,111 @@ def test_merge_data(catalog: DataCatalog):
     ), "Unexpected number of rows in the merged dataframe"
 
 
+def test_merge_data_schema(tmp_path):
+    """
+    A test function for `merge_data` with partitions of different schemas, saved
+    with `StreamingParquetDataset`.
+
+    Args:
+        tmp_path (Path): The temporary directory of the merged Parquet file.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the same merged data as concatenating the partitions with `pd.concat`
+    """
+    partitions = {
+        "cost-and-financing": pd.DataFrame(
+            {"id": [1, 2], "title": ["A", "B"], "l1_mappings": [None, None]}
+        ),
+        "medications": pd.DataFrame(
+            {
+                "id": [3],
+                "title": [None],
+                "l1_mappings": ["Medications"],
+                "keywords": [1.5],
+            }
+        ),
+    }
+    all_contents_mapped = {
+        content_category: (lambda df=df: df.copy())
+        for content_category, df in partitions.items()
+    }
+
+    dataset = StreamingParquetDataset(filepath=(tmp_path / "merged.parquet").as_posix())
+    merged_data, _ = merge_data(all_contents_mapped)
+    dataset.save(merged_data)
+
+    expected = pd.concat(partitions.values(), axis=0, ignore_index=True)
+    pd.testing.assert_frame_equal(dataset.load(), expected)
+
+
+@pytest.mark.parametrize("string_dtype", ["object", "string[pyarrow]"])
+def test_merge_data_loads(tmp_path, string_dtype: str):
+    """
+    A test function for `merge_data` that checks that every partition is loaded once for
+    both outputs.
+
+    Args:
+        tmp_path (Path): The temporary directory of the partitions.
+        string_dtype (str): The dtype of the text columns of the partitions.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the schemas of the partitions to be read from the Parquet metadata
+        2. Expects every partition to be loaded once
+        3. Expects the same tables in both outputs as loading the partitions
+    """
+
+    class CountingParquetDataset(TypedParquetDataset):
+        def _load(self) -> pd.DataFrame:
+            self.num_loads += 1
+            return super()._load()
+
+    partitions = {
+        "cost-and-financing": pd.DataFrame(
+            {"id": [1, 2], "title": ["A", "B"], "l1_mappings": [None, None]}
+        ),
+        "medications": pd.DataFrame(
+            {"id": [3], "title": [None], "l1_mappings": ["Medications"]}
+        ),
+    }
+    datasets = {}
+    for content_category, df in partitions.items():
+        datasets[content_category] = CountingParquetDataset(
+            filepath=(tmp_path / f"{content_category}.parquet").as_posix(),
+            column_types="content_optimization.pipelines.data_processing.schemas.EXTRACTED_COLUMN_TYPES",
+        )
+        datasets[content_category].save(
+            df.astype({"title": string_dtype, "l1_mappings": string_dtype})
+        )
+        datasets[content_category].num_loads = 0
+
+    merged_data, merged_data_partitioned = merge_data(
+        {
+            content_category: dataset.load
+            for content_category, dataset in datasets.items()
+        }
+    )
+    # Check if the schemas are read without loading the partitions
+    assert all(dataset.num_loads == 0 for dataset in datasets.values())
+
+    tables = list(merged_data())
+    assert list(merged_data_partitioned()) == tables
+    # Check if every partition is loaded once for both outputs
+    assert all(dataset.num_loads == 1 for dataset in datasets.values())
+
+    schema = tables[0].schema
+    for table, df in zip(tables, partitions.values()):
+        assert table.schema.equals(schema)
+        pd.testing.assert_frame_equal(
+            table.to_pandas(), df, check_dtype=False, check_index_type=False
+        )
+
+
 @pytest.mark.parametrize(
     "selected_content_category, missing_num_cols, num_cols",
     [
@@ -238,3 +616,61 @@ def test_standardize_columns_with_missing_column(
 
     # Check if the error message is as expected
     assert f"Length mismatch: Expected axis has {num_cols} elements" in str(error.value)
+
+
+def test_deduplicate_data():
+    """
+    A test function for `deduplicate_data` that checks the near duplicates flagged
+    across content categories.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the later article of a near-duplicate pair to be flagged as "Near Duplicate"
+        2. Expects whitelisted and already flagged articles to not be flagged
+        3. Expects every near-duplicate pair in the report
+    """
+    text = " ".join(f"word{i}" for i in range(200))
+    df_a = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "title": ["Original", "Unrelated", "Removed"],
+            "extracted_content_body": [text, "something else entirely", text],
+            "to_remove": [False, False, True],
+            "remove_type": [None, None, "Below Word Count"],
+        }
+    )
+    df_b = pd.DataFrame(
+        {
+            "id": [4, 5],
+            "title": ["Syndicated", "Whitelisted"],
+            "extracted_content_body": [text + " Read these next", text],
+            "to_remove": [False, False],
+            "remove_type": [None, None],
+        }
+    )
+    all_contents_extracted = {"a": lambda: df_a.copy(), "b": lambda: df_b.copy()}
+    near_duplicates_cfg = {"threshold": 0.9, "num_perm": 128, "bands": 16}
+
+    all_contents_deduplicated, near_duplicate_pairs = deduplicate_data(
+        all_contents_extracted, [5], near_duplicates_cfg
+    )
+
+    assert all_contents_deduplicated["a"]["remove_type"].tolist() == [
+        None,
+        None,
+        "Below Word Count",
+    ]
+    assert all_contents_deduplicated["b"]["remove_type"].tolist() == [
+        "Near Duplicate",
+        None,
+    ]
+    assert all_contents_deduplicated["b"]["to_remove"].tolist() == [True, False]
+    assert near_duplicate_pairs[["id", "near_duplicate_id", "flagged"]].to_dict(
+        "records"
+    ) == [
+        {"id": 1, "near_duplicate_id": 4, "flagged": True},
+        {"id": 1, "near_duplicate_id": 5, "flagged": False},
+        {"id": 4, "near_duplicate_id": 5, "flagged": False},
+    ]
@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.content_optimization.pipelines.data_processing.overrides import (
+    REPORT_COLUMNS,
+    Overrides,
+)
+from src.content_optimization.pipelines.data_processing.utils import (
+    convert_string_columns,
+)
+
+
+def _apply_overrides_by_scans(
+    df: pd.DataFrame,
+    excel_errors: dict[str, str],
+    new_urls: dict[int, str],
+) -> pd.DataFrame:
+    """
+    The previous implementation of the missing contents and updated URLs, which scans
+    the whole frame for every override. Used as the reference of `Overrides.apply`.
+    """
+    for friendly_url, text in excel_errors.items():
+        article_index = df.index[df["friendly_url"] == friendly_url]
+        if article_index.empty:
+            continue
+        df.loc[article_index, "content_body"] = text
+
+    for article_id, url in new_urls.items():
+        article_index = df.index[df["id"] == article_id]
+        if article_index.empty:
+            continue
+        df.loc[article_index, "full_url"] = url
+        df.loc[article_index, "full_url2"] = url
+
+    return df
+
+
+def _articles(seed: int, n: int = 500) -> pd.DataFrame:
+    """Returns `n` articles with a few duplicated IDs and friendly URLs."""
+    rng = np.random.default_rng(seed)
+    ids = rng.choice(np.arange(1000, 1000 + n), size=n)
+    friendly_urls = np.array([f"article-{i}" for i in ids], dtype=object)
+    friendly_urls[rng.choice(n, size=10, replace=False)] = None
+
+    return pd.DataFrame(
+        {
+            "id": ids,
+            "friendly_url": friendly_urls,
+            "content_body": [f"<p>Article {i}</p>" for i in range(n)],
+            "full_url": [f"https://www.healthhub.sg/a/{i}" for i in ids],
+            "full_url2": [f"https://www.healthhub.sg/a/{i}" for i in ids],
+        }
+    )
+
+
+@pytest.mark.parametrize("string_dtype", ["object", "string[pyarrow]"])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_overrides_apply(string_dtype: str, seed: int):
+    """
+    A test function for `Overrides.apply` that compares the overridden articles with
+    the implementation scanning the frame for every override.
+
+    Args:
+        string_dtype (str): The dtype of the text columns.
+        seed (int): The seed of the randomly generated articles.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the same `content_body`, `full_url` and `full_url2` columns
+        2. Expects the last override of a duplicated key to be applied
+        3. Expects every matched override to be reported with its source
+        4. Expects the updated URLs of other content categories to be ignored
+    """
+    df = _articles(seed)
+    rng = np.random.default_rng(seed)
+    ids = rng.choice(df["id"].unique(), size=60, replace=False).tolist()
+
+    missing_contents = {
+        f"medications/article-{i}": f"<p>Missing content {i}</p>" for i in ids[:20]
+    }
+    # The same friendly URL in another folder overrides the first one
+    missing_contents[f"other/article-{ids[0]}"] = "<p>Missing content again</p>"
+    # Unknown friendly URLs are ignored
+    missing_contents["medications/unknown"] = "<p>Unknown</p>"
+    updated_urls = {
+        "medications": {i: f"https://www.healthhub.sg/new/{i}" for i in ids[20:40]},
+        "diseases-and-conditions": {ids[40]: "https://www.healthhub.sg/elsewhere"},
+    }
+    whitelist = ids[40:50]
+    blacklist = {i: "Irrelevant Content" for i in ids[50:]}
+
+    overrides = Overrides.from_sources(
+        {
+            file_path: (lambda text=text: text)
+            for file_path, text in missing_contents.items()
+        },
+        updated_urls,
+        whitelist,
+        blacklist,
+    )
+    expected = _apply_overrides_by_scans(
+        df.copy(),
+        {
+            file_path.split("/")[-1]: text
+            for file_path, text in missing_contents.items()
+        },
+        updated_urls["medications"],
+    )
+    result, report = overrides.apply(
+        convert_string_columns(df.copy(), string_dtype), "medications"
+    )
+
+    for column in ["content_body", "full_url", "full_url2"]:
+        pd.testing.assert_series_equal(
+            result[column].astype(object), expected[column].astype(object)
+        )
+    assert (
+        result.loc[df["id"] == ids[0], "content_body"] == "<p>Missing content again</p>"
+    ).all()
+
+    assert report.columns.tolist() == REPORT_COLUMNS
+    assert (report["content_category"] == "medications").all()
+    counts = report["override"].value_counts().to_dict()
+    assert counts == {
+        "content_body": df["id"].isin(ids[:20]).sum(),
+        "full_url": df["id"].isin(ids[20:40]).sum(),
+        "whitelist": df["id"].isin(ids[40:50]).sum(),
+        "blacklist": df["id"].isin(ids[50:]).sum(),
+    }
+    sources = report.drop_duplicates("override").set_index("override")["source"]
+    assert sources["full_url"] == "params:updated_urls.medications"
+    assert sources["whitelist"] == "params:whitelist"
+    assert sources["blacklist"] == "params:blacklist"
+    assert report.loc[report["id"] == ids[0], "source"].tolist() == [
+        "missing_contents:other/article-" + str(ids[0])
+    ] * int((df["id"] == ids[0]).sum())
+
+
+def test_overrides_apply_empty():
+    """
+    A test function for `Overrides.apply` without any override.
+
+    Raises:
+        AssertionError: If the articles are changed or any override is reported.
+    """
+    df = _articles(0)
+    result, report = Overrides.from_sources({}, {}, [], {}).apply(
+        df.copy(), "medications"
+    )
+
+    pd.testing.assert_frame_equal(result, df)
+    assert report.empty
+    assert report.columns.tolist() == REPORT_COLUMNS
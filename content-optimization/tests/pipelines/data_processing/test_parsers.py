@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+from src.content_optimization.pipelines.data_processing.extractor import HTMLExtractor
+from src.content_optimization.pipelines.data_processing.parsers import compare_parsers
+from tests.benchmarks.corpus import generate_corpus
+
+
+@pytest.mark.parametrize(
+    "parser, package",
+    [("html.parser", None), ("lxml", "lxml"), ("lexbor", "selectolax")],
+)
+def test_compare_parsers(articles: pd.DataFrame, parser: str, package: str | None):
+    """
+    An equivalence harness for the parser backends of the `HTMLExtractor`. It runs the
+    parser backend over the test articles and a synthetic corpus with the edge cases of the
+    real exports, and compares the output against `html.parser`.
+
+    Args:
+        articles (pd.DataFrame): The articles to extract.
+        parser (str): The parser backend to compare against `html.parser`.
+        package (str | None): The optional package required by the parser backend.
+
+    Raises:
+        AssertionError: If the extracted data differs from the one extracted with `html.parser`.
+    """
+    if package is not None:
+        pytest.importorskip(package)
+
+    corpus = generate_corpus(200, ["medications", "live-healthy-articles"], seed=0)
+    html_contents = articles.query("not to_remove")["content_body"].to_list() + [
+        content_body
+        for export in corpus.values()
+        for content_body in export["content_body"]
+        if isinstance(content_body, str)
+    ]
+
+    report = compare_parsers(
+        html_contents,
+        lambda html_content, parser: HTMLExtractor(
+            "content_name", "content_category", "full_url", html_content, parser
+        ).extract_all(),
+        parsers=(parser,),
+    )
+
+    result = report.set_index("parser").loc[parser]
+    assert result["num_diffs"] == 0, f"Unexpected diffs in {result['diff_fields']}"
@@ -34,7 +34,11 @@ def test_data_processing_pipeline(caplog: LogCaptureFixture, catalog: DataCatalo
     """
     pipeline = (
         create_dp_pipeline()
-        .from_nodes("standardize_columns_node")
+        .from_nodes(
+            "standardize_columns_node",
+            "compile_overrides_node",
+            "compile_ia_mappings_node",
+        )
         .to_nodes("merge_data_node")
     )
 
@@ -0,0 +1,219 @@
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+import pytest
+from kedro_datasets.pandas import ParquetDataset
+from src.content_optimization.datasets.parquet import (
+    StreamingParquetDataset,
+    TypedParquetDataset,
+)
+from src.content_optimization.pipelines.data_processing.nodes import (
+    add_data,
+    compile_ia_mappings,
+    compile_overrides,
+    extract_data,
+    map_data,
+    merge_data,
+    standardize_columns,
+)
+from tests.benchmarks.corpus import generate_corpus
+
+pytest.importorskip("polars")
+
+CONTENT_CATEGORIES = ["diseases-and-conditions", "live-healthy-articles", "medications"]
+
+EXTRACTED_COLUMN_TYPES = (
+    "content_optimization.pipelines.data_processing.schemas.EXTRACTED_COLUMN_TYPES"
+)
+
+
+def _save_partitions(
+    partitions: dict[str, pd.DataFrame], path: Path, typed: bool = False
+) -> dict[str, Callable[[], Any]]:
+    """
+    Saves partitions as Parquet files, and returns their load functions as a
+    `PartitionedDataset` does.
+    """
+    path.mkdir(parents=True)
+    loaders = {}
+    for name, df in partitions.items():
+        filepath = str(path / f"{name}.parquet")
+        dataset = (
+            TypedParquetDataset(filepath=filepath, column_types=EXTRACTED_COLUMN_TYPES)
+            if typed
+            else ParquetDataset(filepath=filepath)
+        )
+        dataset.save(df)
+        loaders[name] = dataset.load
+
+    return loaders
+
+
+def _read_files(path: Path) -> dict[str, bytes]:
+    """Reads the saved Parquet files under a directory."""
+    return {file.name: file.read_bytes() for file in sorted(path.glob("*.parquet"))}
+
+
+@pytest.mark.parametrize("string_dtype", ["object", "string[pyarrow]"])
+def test_polars_engine(parameters: dict, tmp_path: Path, string_dtype: str):
+    """
+    A test function for the `polars` engine of `standardize_columns`, `add_data` and
+    `map_data` that compares the saved Parquet files with the `pandas` engine.
+
+    Args:
+        parameters (dict): The parameters in `conf/base`.
+        tmp_path (Path): The directory of the saved Parquet files.
+        string_dtype (str): The dtype of the text columns.
+
+    Raises:
+        AssertionError: If the outputs of the `pandas` and `polars` engines differ.
+
+    Note:
+        1. Expects the same standardized, added and mapped Parquet files byte for byte
+        2. Expects the same report of the applied overrides
+        3. Expects the same merged Parquet file byte for byte
+    """
+    corpus = generate_corpus(
+        30, CONTENT_CATEGORIES, parameters["columns_to_keep"], seed=0
+    )
+    medications = corpus["export-published-medications_2024"]
+    overrides = compile_overrides(
+        {
+            # The file name is the friendly URL of the article
+            f"missing_contents/{medications['Medication_FriendlyUrl'].iloc[3]}": (
+                lambda: "<p>Missing</p>"
+            ),
+            "missing_contents/unknown-article": lambda: "<p>Unknown</p>",
+        },
+        {"medications": {int(medications["id"].iloc[5]): "https://www.healthhub.sg"}},
+        [int(medications["id"].iloc[2])],
+        {int(medications["id"].iloc[4]): "Blacklisted"},
+    )
+    ia_mappings = compile_ia_mappings(
+        parameters["l1_mappings"], parameters["l2_mappings"]
+    )
+    all_contents = _save_partitions(corpus, tmp_path / "raw")
+
+    all_contents_added, applied_overrides = {}, {}
+    for engine in ["pandas", "polars"]:
+        path = tmp_path / engine
+        all_contents_standardized = _save_partitions(
+            standardize_columns(
+                all_contents,
+                parameters["columns_to_add"],
+                parameters["columns_to_keep"],
+                parameters["default_columns"],
+                string_dtype,
+                engine,
+            ),
+            path / "standardized",
+        )
+        added, applied_overrides[engine] = add_data(
+            all_contents_standardized, overrides, string_dtype, engine
+        )
+        all_contents_added[engine] = _save_partitions(added, path / "added")
+
+    # Map the same extracted data with both engines
+    all_contents_extracted = _save_partitions(
+        extract_data(
+            all_contents_added["pandas"],
+            parameters["word_count_cutoff"],
+            overrides,
+            {"cache": {"enabled": False}},
+            None,
+            string_dtype,
+        )[0],
+        tmp_path / "extracted",
+        typed=True,
+    )
+    for engine in ["pandas", "polars"]:
+        path = tmp_path / engine
+        all_contents_mapped = _save_partitions(
+            map_data(all_contents_extracted, ia_mappings, string_dtype, engine),
+            path / "mapped",
+            typed=True,
+        )
+        merged_data, _ = merge_data(all_contents_mapped)
+        StreamingParquetDataset(filepath=str(path / "merged.parquet")).save(merged_data)
+
+    for stage in ["standardized", "added", "mapped"]:
+        expected = _read_files(tmp_path / "pandas" / stage)
+        assert len(expected) == len(CONTENT_CATEGORIES)
+        assert _read_files(tmp_path / "polars" / stage) == expected, stage
+
+    # The missing content, the updated URL, the whitelist and the blacklist
+    assert len(applied_overrides["pandas"]) == 4  # noqa: PLR2004
+    pd.testing.assert_frame_equal(
+        applied_overrides["polars"], applied_overrides["pandas"]
+    )
+
+    assert _read_files(tmp_path / "polars") == _read_files(tmp_path / "pandas")
+    assert (
+        pd.read_parquet(tmp_path / "pandas" / "merged.parquet")["l1_mappings"]
+        .notna()
+        .any()
+    )
+
+
+@pytest.mark.parametrize("string_dtype", ["object", "string[pyarrow]"])
+def test_polars_engine_with_mixed_types(parameters: dict, string_dtype: str):
+    """
+    A test function for the `polars` engine of `standardize_columns`, `add_data` and
+    `map_data` on `object` columns of strings, integers and null values, as in raw Excel
+    exports.
+
+    Args:
+        parameters (dict): The parameters in `conf/base`.
+        string_dtype (str): The dtype of the text columns.
+
+    Raises:
+        AssertionError: If the outputs of the `pandas` and `polars` engines differ.
+
+    Note:
+        1. Expects the same standardized data, with the strings of a mixed column stripped
+        2. Expects the same added data and report with a mixed `content_body` column
+        3. Expects the same mapped data with a mixed `article_category_names` column
+    """
+    corpus = generate_corpus(10, ["medications"], parameters["columns_to_keep"], seed=0)
+    (filename, raw), *_ = corpus.items()
+    raw["Medication_ENKeywords"] = ([" x ", 5, None] * 4)[: len(raw)]
+    overrides = compile_overrides(
+        {}, parameters["updated_urls"], parameters["whitelist"], parameters["blacklist"]
+    )
+    ia_mappings = compile_ia_mappings(
+        parameters["l1_mappings"], parameters["l2_mappings"]
+    )
+
+    outputs = {}
+    for engine in ["pandas", "polars"]:
+        standardized = standardize_columns(
+            {filename: lambda: raw.copy()},
+            parameters["columns_to_add"],
+            parameters["columns_to_keep"],
+            parameters["default_columns"],
+            string_dtype,
+            engine,
+        )["medications"]
+        mixed = standardized.copy()
+        mixed["content_body"] = mixed["content_body"].astype(object)
+        mixed.loc[0, "content_body"] = 0
+        added, applied_overrides = add_data(
+            {"medications": lambda: mixed.copy()}, overrides, string_dtype, engine
+        )
+        mixed = added["medications"].copy()
+        mixed["article_category_names"] = mixed["article_category_names"].astype(object)
+        mixed.loc[0, "article_category_names"] = 0
+        mapped = map_data(
+            {"medications": lambda: mixed.copy()}, ia_mappings, string_dtype, engine
+        )
+        outputs[engine] = (
+            standardized,
+            added["medications"],
+            applied_overrides,
+            mapped["medications"],
+        )
+
+    assert outputs["pandas"][0]["keywords"].iloc[:3].tolist() == ["x", 5, None]
+    for polars_output, pandas_output in zip(outputs["polars"], outputs["pandas"]):
+        pd.testing.assert_frame_equal(polars_output, pandas_output)
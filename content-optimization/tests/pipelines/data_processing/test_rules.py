@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.content_optimization.pipelines.data_processing.rules import (
+    REPORT_COLUMNS,
+    apply_rules,
+    post_extraction_rules,
+)
+from src.content_optimization.pipelines.data_processing.utils import (
+    convert_string_columns,
+)
+from tests.pipelines.data_processing.test_utils import (
+    _flag_duplicated_by_row,
+    _flag_multilingual_content_by_row,
+    _flag_recipe_articles_by_row,
+)
+
+
+def _flag_articles_to_remove_after_extraction_by_row(
+    df: pd.DataFrame,
+    word_count_cutoff: int,
+    whitelist: list[int],
+    blacklist: dict[int, str],
+) -> pd.DataFrame:
+    """The sequential row-by-row implementation of the post-extraction flags used as reference."""
+    for index, row in df.iterrows():
+        if row["extracted_content_body"] == "" and row["id"] not in whitelist:
+            df.at[index, "to_remove"] = True
+            df.at[index, "remove_type"] = "No Extracted Content"
+    df = _flag_duplicated_by_row(
+        df, whitelist, "extracted_content_body", "Duplicated Content"
+    )
+    df = _flag_duplicated_by_row(df, whitelist, "full_url", "Duplicated URL")
+    df = _flag_recipe_articles_by_row(df, whitelist)
+    df = _flag_multilingual_content_by_row(df, whitelist)
+    for index, row in df.iterrows():
+        if row["to_remove"] or row["id"] in whitelist:
+            continue
+        if 0 < len(row["extracted_content_body"].split()) <= word_count_cutoff:
+            df.at[index, "to_remove"] = True
+            df.at[index, "remove_type"] = "Below Word Count"
+    for index, row in df.iterrows():
+        if row["id"] in blacklist:
+            df.at[index, "to_remove"] = True
+            df.at[index, "remove_type"] = blacklist[row["id"]]
+    return df
+
+
+def _extracted_articles(seed: int) -> pd.DataFrame:
+    """Returns randomly generated extracted articles that match several rules each."""
+    rng = np.random.default_rng(seed)
+    n = 300
+    templates = [
+        "",
+        "Short article {}",
+        "Short article {}",
+        "What you need: rice. How to cook this dish: boil the rice {}",
+        *["A longer article about the prevention and treatment of fever {0} {0}"] * 6,
+    ]
+    # About 1 in 10 articles share their content or URL with another article
+    numbers = rng.integers(0, 3000, n)
+    numbers[rng.random(n) < 0.1] = 7  # noqa: PLR2004
+    df = pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "title": rng.choice(
+                np.array(["Fever", "Rash", "Cough", "Rice Recipes"], dtype=object), n
+            ),
+            "keywords": rng.choice(
+                np.array([None, "fever", "rash", "rash", "recipe"], dtype=object), n
+            ),
+            "full_url": [
+                f"https://www.healthhub.sg/a/{i}" for i in rng.integers(0, 3000, n)
+            ],
+            "friendly_url": rng.choice(
+                np.array(
+                    ["fever", "rash", "fever-chinese", "rash_malay"], dtype=object
+                ),
+                n,
+            ),
+            "extracted_content_body": [
+                templates[i % len(templates)].format(i) for i in numbers
+            ],
+            "to_remove": rng.random(n) < 0.1,  # noqa: PLR2004
+        }
+    )
+    # Articles flagged before extraction are not extracted
+    df.loc[df["to_remove"], "extracted_content_body"] = None
+    df["remove_type"] = np.where(df["to_remove"], "No HTML Tags", None)
+
+    return df
+
+
+@pytest.mark.parametrize("string_dtype", ["object", "string[pyarrow]"])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_post_extraction_rules(string_dtype: str, seed: int):
+    """
+    A test function for `apply_rules` with the `post_extraction_rules` that compares the
+    flags with the sequential row-by-row implementation.
+
+    Args:
+        string_dtype (str): The dtype of the text columns.
+        seed (int): The seed of the randomly generated articles.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the same `to_remove` and `remove_type` columns for both string dtypes
+        2. Expects one row per rule in the report, in order of precedence
+        3. Expects the number of articles flagged by each rule to match the `remove_type`
+            of the articles flagged after extraction
+    """
+    df = _extracted_articles(seed)
+    whitelist = df["id"].sample(30, random_state=seed).tolist()
+    blacklist = {int(i): "Irrelevant Content" for i in df["id"].sample(10)}
+    word_count_cutoff = 10
+
+    expected = _flag_articles_to_remove_after_extraction_by_row(
+        df.copy(), word_count_cutoff, whitelist, blacklist
+    )
+    result, report = apply_rules(
+        convert_string_columns(df.copy(), string_dtype),
+        post_extraction_rules(word_count_cutoff, blacklist),
+        whitelist,
+    )
+
+    pd.testing.assert_series_equal(result["to_remove"], expected["to_remove"])
+    pd.testing.assert_series_equal(
+        result["remove_type"].astype(object).where(result["remove_type"].notna(), None),
+        expected["remove_type"],
+    )
+
+    assert report.columns.tolist() == REPORT_COLUMNS
+    assert report["rule"].tolist() == [
+        "no_extracted_content",
+        "duplicated_content",
+        "duplicated_url",
+        "recipe",
+        "multilingual",
+        "below_word_count",
+        "blacklist",
+    ]
+    assert report["flagged"].iloc[-1] == len(blacklist)
+    assert (report["matched"] >= report["flagged"]).all()
+
+    # Without the blacklist, every article flagged after extraction is flagged by one rule
+    result, report = apply_rules(
+        convert_string_columns(df.copy(), string_dtype),
+        post_extraction_rules(word_count_cutoff, {}),
+        whitelist,
+    )
+    flagged = result.loc[result["to_remove"] & ~df["to_remove"], "remove_type"]
+    assert report.set_index("remove_type")["flagged"].iloc[:-1].to_dict() == {
+        remove_type: (flagged == remove_type).sum()
+        for remove_type in report["remove_type"].iloc[:-1]
+    }
@@ -0,0 +1,167 @@
+import pyarrow as pa
+import pytest
+from bs4 import BeautifulSoup
+from src.content_optimization.pipelines.data_processing.extractor import HTMLExtractor
+from src.content_optimization.pipelines.data_processing.tables import (
+    parse_table,
+    table_to_arrow,
+)
+
+
+def _parse(html: str):
+    """Parses the first table of the HTML with the cleaning of the `HTMLExtractor`."""
+    table = BeautifulSoup(html, "html.parser").find("table")
+    return parse_table(table, HTMLExtractor.clean_text)
+
+
+@pytest.mark.parametrize(
+    "html, expected",
+    [
+        # Header cells in th and body cells in td
+        (
+            "<table><tr><th>Dose</th><th>Age</th></tr><tr><td>5 ml</td><td>1-5</td></tr></table>",
+            [["Dose", "Age"], ["5 ml", "1-5"]],
+        ),
+        # Header row spanning two columns
+        (
+            "<table><tr><th colspan='2'>Vaccine schedule</th></tr>"
+            "<tr><td>BCG</td><td>Birth</td></tr></table>",
+            [["Vaccine schedule", "Vaccine schedule"], ["BCG", "Birth"]],
+        ),
+        # Cell spanning the next rows in the first and the last column
+        (
+            "<table><tr><td rowspan='3'>Hepatitis B</td><td>1st dose</td><td rowspan='2'>Birth</td></tr>"
+            "<tr><td>2nd dose</td></tr>"
+            "<tr><td>3rd dose</td><td>6 months</td></tr></table>",
+            [
+                ["Hepatitis B", "1st dose", "Birth"],
+                ["Hepatitis B", "2nd dose", "Birth"],
+                ["Hepatitis B", "3rd dose", "6 months"],
+            ],
+        ),
+        # Cell spanning both rows and columns
+        (
+            "<table><tr><td rowspan='2' colspan='2'>A</td><td>B</td></tr>"
+            "<tr><td>C</td></tr><tr><td>D</td><td>E</td><td>F</td></tr></table>",
+            [["A", "A", "B"], ["A", "A", "C"], ["D", "E", "F"]],
+        ),
+        # Cell spanning the next columns across a cell spanning from the previous row
+        (
+            "<table><tr><td>A</td><td rowspan='2'>B</td><td>C</td></tr>"
+            "<tr><td colspan='3'>D</td></tr><tr><td>E</td><td>F</td><td>G</td></tr></table>",
+            [["A", "B", "C"], ["D", "B", "D"], ["E", "F", "G"]],
+        ),
+        # Ragged rows are padded, invalid spans are ignored
+        (
+            "<table><tr><td colspan='x'>A</td></tr><tr><td>B</td><td rowspan='0'>C</td></tr></table>",
+            [["A", ""], ["B", "C"]],
+        ),
+        # Rows in sections, excluding the rows of nested tables
+        (
+            "<table><thead><tr><th>Name</th><th>Notes</th></tr></thead>"
+            "<tbody><tr><td>Paracetamol</td><td><table><tr><td>Nested</td></tr></table></td></tr></tbody>"
+            "</table>",
+            [["Name", "Notes"], ["Paracetamol", "Nested"]],
+        ),
+        # Attributes, entities, comments and void elements are serialised as in `str(table)`
+        (
+            "<table class='schedule dosage' border=1 data-note='say \"hi\"'>"
+            '<tr><th style="width:50%">Dose &amp; Age</th><td>5 &lt; x<br>ml<!-- note --></td></tr>'
+            "<tr><td>Take <b>twice</b><img src='a.png' alt=''> daily</td></tr></table>",
+            [["Dose & Age", "5 < xml"], ["Take twice daily", ""]],
+        ),
+    ],
+)
+def test_parse_table(html: str, expected: list[list[str]]):
+    """
+    A test function for `parse_table` that checks the grid of tables with spanning cells.
+
+    Args:
+        html (str): The HTML of the table.
+        expected (list[list[str]]): The expected rows of the table.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the rows and columns spanned by a cell to repeat its value
+        2. Expects every row to have as many cells as the header
+        3. Expects the table in HTML format to be serialised with the grid
+    """
+    table = BeautifulSoup(html, "html.parser").find("table")
+    parsed = parse_table(table, HTMLExtractor.clean_text)
+
+    assert parsed.to_list() == expected
+    assert all(len(row) == len(parsed.header) for row in parsed.rows)
+    assert parsed.raw_html == str(table)
+
+
+def test_parse_empty_table():
+    """
+    A test function for `parse_table` with a table without rows.
+
+    Raises:
+        AssertionError: If the empty table is not None in both forms.
+    """
+    parsed = _parse("<table></table>")
+
+    assert parsed.to_list() is None
+    assert parsed.to_arrow() is None
+    assert parsed.raw_html == "<table></table>"
+
+
+def test_table_to_arrow():
+    """
+    A test function for `table_to_arrow` that checks the columns of the Arrow table.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects a string column per column, named by the header
+        2. Expects empty and duplicated column names to be made unique
+        3. Expects the same Arrow table from the parsed table and its list of rows
+    """
+    parsed = _parse(
+        "<table><tr><th>Age</th><th></th><th>Age</th></tr>"
+        "<tr><td>1</td><td>2</td><td>3</td></tr>"
+        "<tr><td>4</td><td>5</td><td>6</td></tr></table>"
+    )
+    arrow_table = parsed.to_arrow()
+
+    assert arrow_table.column_names == ["Age", "column_1", "Age_1"]
+    assert arrow_table.schema.types == [pa.string()] * 3
+    assert arrow_table.to_pydict() == {
+        "Age": ["1", "4"],
+        "column_1": ["2", "5"],
+        "Age_1": ["3", "6"],
+    }
+    assert table_to_arrow(parsed.to_list()).equals(arrow_table)
+
+
+def test_extract_arrow_tables():
+    """
+    A test function for `HTMLExtractor.extract_arrow_tables` that checks the Arrow tables
+    against the extracted tables.
+
+    Raises:
+        AssertionError: If the Arrow tables do not match the extracted tables.
+    """
+    html = (
+        "<p>Schedule</p>"
+        "<table><tr><th>Vaccine</th><th>Age</th></tr><tr><td>BCG</td><td>Birth</td></tr></table>"
+        "<table></table>"
+    )
+    extractor = HTMLExtractor(
+        "Schedule", "medications", "https://www.healthhub.sg", html
+    )
+    result = extractor.extract_all()
+    arrow_tables = extractor.extract_arrow_tables()
+
+    assert result.extracted_tables == [[["Vaccine", "Age"], ["BCG", "Birth"]], None]
+    assert result.extracted_raw_html_tables == [
+        "<table><tr><th>Vaccine</th><th>Age</th></tr><tr><td>BCG</td><td>Birth</td></tr></table>",
+        "<table></table>",
+    ]
+    assert arrow_tables[0].to_pydict() == {"Vaccine": ["BCG"], "Age": ["Birth"]}
+    assert arrow_tables[1] is None
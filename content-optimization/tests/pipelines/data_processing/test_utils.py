@@ -0,0 +1,396 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.content_optimization.pipelines.data_processing.utils import (
+    compile_ia_mappings_table,
+    convert_string_columns,
+    flag_articles_to_remove_before_extraction,
+    flag_duplicated,
+    flag_multilingual_content,
+    flag_recipe_articles,
+    invert_ia_mappings,
+    map_category_names,
+    strip_whitespace,
+)
+
+
+def _flag_duplicated_by_row(
+    df: pd.DataFrame, whitelist: list[int], column: str, value: str
+) -> pd.DataFrame:
+    """The row-by-row implementation of `flag_duplicated` used as reference."""
+    duplicated = df[column].duplicated() & df[column].notna() & ~df["to_remove"]
+    if column == "extracted_content_body":
+        duplicated &= df[column] != ""
+    duplicated_df = df[duplicated]
+    for i in range(len(duplicated_df)):
+        for j in df[df[column] == duplicated_df.iloc[i][column]].index:
+            if not df.iloc[j]["to_remove"] and df.iloc[j]["id"] not in whitelist:
+                df.at[j, "to_remove"] = True
+                df.at[j, "remove_type"] = value
+    return df
+
+
+def _map_category_names_by_row(
+    mappings: dict[str, dict[str, str]], df: pd.DataFrame, new_column_name: str
+) -> pd.DataFrame:
+    """The row-by-row implementation of `map_category_names` used as reference."""
+    df[new_column_name] = None
+    for index, row in df.iterrows():
+        category_string = row["article_category_names"]
+        category_map = mappings.get(row["content_category"], None)
+        if not isinstance(category_string, str):
+            continue
+        category_string = category_string.replace("&", "and")
+        df.at[index, "article_category_names"] = category_string
+        categories_list = [x for x in category_string.split(",") if len(x.strip()) > 0]
+        if category_map is not None:
+            results = [category_map.get(x, None) for x in categories_list]
+            unique = {x.strip() for x in results if x is not None}
+            joined = " | ".join(unique)
+            df.at[index, new_column_name] = joined.strip() if joined else None
+    return df
+
+
+def _flag_articles_to_remove_before_extraction_by_scans(
+    df: pd.DataFrame, regex: str = r"(<[div|p|h2].*?>)"
+) -> pd.DataFrame:
+    """The multi-scan implementation of `flag_articles_to_remove_before_extraction` used as reference."""
+    excel_error = "Value exceeded maximum cell size"
+
+    def apply_regex(x: str) -> bool:
+        pattern = re.compile(regex)
+        if pd.isna(x) or excel_error in str(x):
+            return True
+        return bool(pattern.search(str(x)))
+
+    df["to_remove"] = df["content_body"].apply(
+        lambda x: (False if pd.notna(x) and re.search(regex, str(x)) else True)
+    )
+    na_indexes = df[df["content_body"].isna()].index
+    excel_error_indexes = df.query(
+        f"content_body.str.contains('{excel_error}', na=False)"
+    ).index
+    no_tags_indexes = df[
+        ~df.query("content_category.notna()")["content_body"].apply(
+            lambda x: apply_regex(x)
+        )
+    ].index
+    df["remove_type"] = None
+    df.loc[na_indexes, "remove_type"] = "NaN"
+    df.loc[excel_error_indexes, "remove_type"] = "Excel Error"
+    df.loc[no_tags_indexes, "remove_type"] = "No HTML Tags"
+    return df
+
+
+def _flag_recipe_articles_by_row(
+    df: pd.DataFrame, whitelist: list[int]
+) -> pd.DataFrame:
+    """The row-by-row implementation of `flag_recipe_articles` used as reference."""
+    for index, row in df.iterrows():
+        title, keywords, content = (
+            row["title"],
+            row["keywords"],
+            row["extracted_content_body"],
+        )
+        is_recipe = (title is not None and re.search(r"[rR]ecipes?", title)) or (
+            keywords is not None and re.search(r"[rR]ecipes?", keywords)
+        )
+        is_recipe = is_recipe or (
+            content is not None
+            and re.search(r"what [do ]?you need", content.lower())
+            and re.search(r"how to cook [this dish]*", content.lower())
+        )
+        if is_recipe and not row["to_remove"] and row["id"] not in whitelist:
+            df.at[index, "to_remove"] = True
+            df.at[index, "remove_type"] = "Recipe"
+    return df
+
+
+def _flag_multilingual_content_by_row(
+    df: pd.DataFrame, whitelist: list[int]
+) -> pd.DataFrame:
+    """The row-by-row implementation of `flag_multilingual_content` used as reference."""
+    for index, row in df.iterrows():
+        friendly_url = row["friendly_url"]
+        if friendly_url is None or row["to_remove"] or row["id"] in whitelist:
+            continue
+        check_lang = friendly_url.split("_")[-1].split("-")[-1]
+        if re.search("(chinese|tamil|malay)", check_lang.lower()):
+            df.at[index, "to_remove"] = True
+            df.at[index, "remove_type"] = "Multilingual"
+    return df
+
+
+def _articles(seed: int) -> pd.DataFrame:
+    """Returns randomly generated articles with recipe and multilingual articles."""
+    rng = np.random.default_rng(seed)
+    n, flagged_ratio = 200, 0.2
+    titles = np.array(
+        [None, "Healthy Recipes", "A recipe for rest", "Fever", " Rash "], dtype=object
+    )
+    contents = np.array(
+        [
+            None,
+            "",
+            "What you need: rice. How to cook this dish: boil.",
+            "What do you need to know about fever?",
+            "How to cook safely",
+        ],
+        dtype=object,
+    )
+    friendly_urls = np.array(
+        [
+            None,
+            "fever-chinese",
+            "fever_malay-version",
+            "tamil_fever",
+            "chinese-new-year-tips",
+            "fever-in-children",
+            "FEVER_TAMIL",
+        ],
+        dtype=object,
+    )
+    df = pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "title": rng.choice(titles, size=n),
+            "keywords": rng.choice(titles, size=n),
+            "extracted_content_body": rng.choice(contents, size=n),
+            "friendly_url": rng.choice(friendly_urls, size=n),
+            "to_remove": rng.random(n) < flagged_ratio,
+        }
+    )
+    df["remove_type"] = np.where(df["to_remove"], "Below Word Count", None)
+
+    return df
+
+
+@pytest.mark.parametrize("string_dtype", ["object", "string[pyarrow]"])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_flag_articles_to_remove_before_extraction(string_dtype: str, seed: int):
+    """
+    A test function for `flag_articles_to_remove_before_extraction` that compares the
+    flags with the multi-scan implementation.
+
+    Args:
+        string_dtype (str): The dtype of the text columns.
+        seed (int): The seed of the randomly generated articles.
+
+    Raises:
+        AssertionError: If the flags differ from the multi-scan implementation.
+
+    Note:
+        1. Expects the same `to_remove` and `remove_type` columns for both string dtypes
+    """
+    rng = np.random.default_rng(seed)
+    n = 300
+    excel_error = "Value exceeded maximum cell size"
+    contents = np.array(
+        [
+            None,
+            "",
+            "Dummy content",
+            "<p>Fever</p>",
+            "<div class='content'>\n<h2>Rash</h2></div>",
+            "<h3>Cough</h3>",
+            "< p>Not a tag</p",
+            "<p\n>Tag across lines</p>",
+            excel_error,
+            f"<div>{excel_error}</div>",
+        ],
+        dtype=object,
+    )
+    df = pd.DataFrame(
+        {
+            "content_body": rng.choice(contents, size=n),
+            "content_category": "medications",
+        }
+    )
+
+    expected = _flag_articles_to_remove_before_extraction_by_scans(df.copy())
+    result = flag_articles_to_remove_before_extraction(
+        convert_string_columns(df.copy(), string_dtype)
+    )
+
+    pd.testing.assert_series_equal(result["to_remove"], expected["to_remove"])
+    pd.testing.assert_series_equal(result["remove_type"], expected["remove_type"])
+
+
+@pytest.mark.parametrize(
+    "flag_func, reference_func",
+    [
+        (flag_recipe_articles, _flag_recipe_articles_by_row),
+        (flag_multilingual_content, _flag_multilingual_content_by_row),
+    ],
+)
+@pytest.mark.parametrize("string_dtype", ["object", "string[pyarrow]"])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_flag_by_regex(flag_func, reference_func, string_dtype: str, seed: int):
+    """
+    A test function for the vectorised regex flags that compares the flags with the
+    row-by-row implementation.
+
+    Args:
+        flag_func (Callable): The vectorised flag function.
+        reference_func (Callable): The row-by-row implementation of the flag function.
+        string_dtype (str): The dtype of the text columns.
+        seed (int): The seed of the randomly generated articles.
+
+    Raises:
+        AssertionError: If the flags differ from the row-by-row implementation.
+
+    Note:
+        1. Expects the same `to_remove` and `remove_type` columns for both string dtypes
+    """
+    df = _articles(seed)
+    whitelist = df["id"].sample(20, random_state=seed).tolist()
+
+    expected = reference_func(df.copy(), whitelist)
+    result = flag_func(convert_string_columns(df.copy(), string_dtype), whitelist)
+
+    pd.testing.assert_series_equal(result["to_remove"], expected["to_remove"])
+    pd.testing.assert_series_equal(
+        result["remove_type"].astype(object).where(result["remove_type"].notna(), None),
+        expected["remove_type"],
+    )
+
+
+@pytest.mark.parametrize("string_dtype", ["object", "string[pyarrow]"])
+def test_strip_whitespace(string_dtype: str):
+    """
+    A test function for `strip_whitespace` that compares the stripped strings with
+    `str.strip` on every cell.
+
+    Args:
+        string_dtype (str): The dtype of the text columns.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects only the text columns to be converted to `string_dtype`
+        2. Expects the same values as `str.strip` on every cell
+    """
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "title": [" Fever ", "Rash\n", None, "\u3000Cough\t"],
+            "number_of_views": [" 1 ", 2, None, 3.0],
+            "keywords": [None, None, None, None],
+        }
+    )
+
+    expected = df.map(lambda x: x.strip() if isinstance(x, str) else x)
+    result = strip_whitespace(convert_string_columns(df.copy(), string_dtype))
+
+    assert result["title"].dtype == string_dtype
+    assert result.drop(columns="title").dtypes.equals(df.drop(columns="title").dtypes)
+    # Missing values are `pd.NA` in the `string[pyarrow]` columns
+    pd.testing.assert_frame_equal(
+        result.astype(object).where(result.notna(), None),
+        expected.astype(object).where(expected.notna(), None),
+    )
+
+
+@pytest.mark.parametrize(
+    "column, value",
+    [
+        ("extracted_content_body", "Duplicated Content"),
+        ("full_url", "Duplicated URL"),
+    ],
+)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_flag_duplicated(column: str, value: str, seed: int):
+    """
+    A test function for `flag_duplicated` that compares the vectorised flags with
+    the row-by-row implementation.
+
+    Args:
+        column (str): The column to check for duplicated values.
+        value (str): The `remove_type` of the duplicated rows.
+        seed (int): The seed of the randomly generated articles.
+
+    Raises:
+        AssertionError: If the flags differ from the row-by-row implementation.
+
+    Note:
+        1. Expects the same `to_remove` and `remove_type` columns
+    """
+    rng = np.random.default_rng(seed)
+    n, flagged_ratio = 200, 0.2
+    values = np.array(["", None, *[f"value {i}" for i in range(40)]], dtype=object)
+    df = pd.DataFrame(
+        {
+            "id": np.arange(n),
+            column: rng.choice(values, size=n),
+            "to_remove": rng.random(n) < flagged_ratio,
+        }
+    )
+    df["remove_type"] = np.where(df["to_remove"], "Below Word Count", None)
+    whitelist = rng.choice(n, size=20, replace=False).tolist()
+
+    expected = _flag_duplicated_by_row(df.copy(), whitelist, column, value)
+    result = flag_duplicated(df.copy(), whitelist, column)
+
+    pd.testing.assert_series_equal(result["to_remove"], expected["to_remove"])
+    pd.testing.assert_series_equal(result["remove_type"], expected["remove_type"])
+
+
+def test_map_category_names(parameters: dict):
+    """
+    A test function for `map_category_names` that compares the columnar IA mappings
+    with the row-by-row implementation.
+
+    Args:
+        parameters (dict): The parameters with the `l1_mappings` and `l2_mappings`.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the same `article_category_names` column with "&" replaced by "and"
+        2. Expects the same set of IA mappings of every level for every article
+    """
+    inverted_l1_mappings = invert_ia_mappings(parameters["l1_mappings"])
+    inverted_l2_mappings = invert_ia_mappings(parameters["l2_mappings"])
+    ia_mappings = compile_ia_mappings_table(
+        {"l1_mappings": inverted_l1_mappings, "l2_mappings": inverted_l2_mappings}
+    )
+
+    rng = np.random.default_rng(0)
+    content_categories = [*parameters["l1_mappings"], "unmapped-category", None]
+    category_names = sorted(
+        {name for mappings in inverted_l1_mappings.values() for name in mappings}
+        | {name for mappings in inverted_l2_mappings.values() for name in mappings}
+    )
+    category_names += ["Unknown Category", "Food & Nutrition", " ", ""]
+    df = pd.DataFrame(
+        {
+            "content_category": rng.choice(content_categories, size=300),
+            "article_category_names": [
+                ",".join(rng.choice(category_names, size=rng.integers(0, 5)))
+                for _ in range(300)
+            ],
+        }
+    )
+    df.loc[::25, "article_category_names"] = None
+
+    expected = _map_category_names_by_row(
+        inverted_l1_mappings, df.copy(), "l1_mappings"
+    )
+    expected = _map_category_names_by_row(inverted_l2_mappings, expected, "l2_mappings")
+    result = map_category_names(
+        ia_mappings, df.copy(), "content_category", "article_category_names"
+    )
+
+    pd.testing.assert_series_equal(
+        result["article_category_names"], expected["article_category_names"]
+    )
+    for column in ["l1_mappings", "l2_mappings"]:
+        # The row-by-row implementation joins the IA mappings in set order
+        pd.testing.assert_series_equal(
+            result[column].str.split(" | ", regex=False).map(set, na_action="ignore"),
+            expected[column].str.split(" | ", regex=False).map(set, na_action="ignore"),
+        )
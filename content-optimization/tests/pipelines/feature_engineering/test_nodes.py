@@ -11,7 +11,7 @@
     "model, top_n", [("all-MiniLM-L6-v2", 5), ("all-mpnet-base-v2", 2)]
 )
 def test_extract_keywords(catalog: DataCatalog, model: str, top_n: int):
-    merged_data = catalog.load("merged_data")
+    merged_data = catalog.load("merged_data_partitioned")
     cfg = catalog.load("params:cfg")
     only_confirmed_option = catalog.load("params:selection_options.only_confirmed")
     all_option = catalog.load("params:selection_options.all")
@@ -0,0 +1,131 @@
+import pyarrow as pa
+from src.content_optimization.pipelines.feature_engineering.text_index import (
+    TEXT_INDEX_SCHEMA,
+    build_text_index,
+    chunk_sentences,
+    split_sentences,
+)
+
+TEXT = (
+    "What is Rubella?\nRubella is a viral infection. It spreads fast! See Dr. Tan "
+    "(e.g. at 2.5pm).\n- Fever\n- Rash  \nRest well."
+)
+
+
+class WhitespaceTokenizer:
+    """A tokenizer with the call signature of Hugging Face tokenizers, one token per word."""
+
+    def __call__(self, sentences: list[str], **kwargs) -> dict[str, list[list[str]]]:
+        return {"input_ids": [sentence.split() for sentence in sentences]}
+
+
+def test_split_sentences():
+    """
+    A test function for `split_sentences` that checks the sentences of an extracted content body.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects a sentence to end at sentence-final punctuation or at the end of its line
+        2. Expects abbreviations and decimals not to end a sentence
+        3. Expects the whitespace around the sentences to be excluded
+    """
+    sentences = [TEXT[start:end] for start, end in split_sentences(TEXT)]
+
+    assert sentences == [
+        "What is Rubella?",
+        "Rubella is a viral infection.",
+        "It spreads fast!",
+        "See Dr. Tan (e.g. at 2.5pm).",
+        "- Fever",
+        "- Rash",
+        "Rest well.",
+    ]
+    assert split_sentences("") == []
+    assert split_sentences(" \n ") == []
+
+
+def test_build_text_index():
+    """
+    A test function for `build_text_index` that checks the text index of a batch of articles.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the `TEXT_INDEX_SCHEMA`
+        2. Expects the word counts of the sentences to add up to the words of the text
+        3. Expects the token counts to be counted by the tokenizer, or null without one
+        4. Expects null lists and counts for articles without an extracted content body
+    """
+    ids = [1, 2, 3]
+    content_categories = ["diseases-and-conditions"] * len(ids)
+    texts = [TEXT, None, ""]
+
+    text_index = build_text_index(ids, content_categories, texts)
+    assert text_index.schema == TEXT_INDEX_SCHEMA
+
+    article, missing, empty = text_index.to_pylist()
+    assert article["id"] == ids[0]
+    assert list(zip(article["sentence_starts"], article["sentence_ends"])) == (
+        split_sentences(TEXT)
+    )
+    assert sum(article["sentence_word_counts"]) == article["word_count"]
+    assert article["word_count"] == len(TEXT.split())
+    assert article["sentence_token_counts"] is None
+    assert article["token_count"] is None
+
+    assert all(
+        value is None
+        for key, value in missing.items()
+        if key not in ("id", "content_category")
+    )
+    assert empty["sentence_starts"] == []
+    assert empty["word_count"] == 0
+
+    text_index = build_text_index(ids, content_categories, texts, WhitespaceTokenizer())
+    article = text_index.to_pylist()[0]
+    assert article["sentence_token_counts"] == article["sentence_word_counts"]
+    assert article["token_count"] == article["word_count"]
+
+    assert build_text_index([], [], []).equals(
+        pa.Table.from_pylist([], schema=TEXT_INDEX_SCHEMA)
+    )
+
+
+def test_chunk_sentences():
+    """
+    A test function for `chunk_sentences` that checks the chunks of an article.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects consecutive sentences to be grouped up to the maximum number of tokens
+        2. Expects a sentence longer than the maximum to be a chunk of its own
+        3. Expects the chunks to cover all the sentences in order
+    """
+    article = build_text_index([1], ["medications"], [TEXT], WhitespaceTokenizer())
+    article = article.to_pylist()[0]
+    max_tokens = max(article["sentence_token_counts"]) + 1
+
+    chunks = chunk_sentences(
+        article["sentence_starts"],
+        article["sentence_ends"],
+        article["sentence_token_counts"],
+        max_tokens,
+    )
+    assert all(len(TEXT[start:end].split()) <= max_tokens for start, end in chunks)
+    assert " ".join(TEXT[start:end] for start, end in chunks).split() == TEXT.split()
+    assert chunks[0][0] == article["sentence_starts"][0]
+    assert chunks[-1][1] == article["sentence_ends"][-1]
+
+    chunks = chunk_sentences(
+        article["sentence_starts"],
+        article["sentence_ends"],
+        article["sentence_token_counts"],
+        max_tokens=1,
+    )
+    assert chunks == split_sentences(TEXT)
+    assert chunk_sentences([], [], [], max_tokens) == []
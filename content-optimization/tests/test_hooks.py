@@ -0,0 +1,126 @@
+from collections.abc import Iterator
+
+import pandas as pd
+import pytest
+from kedro.framework.hooks import _create_hook_manager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro.runner import SequentialRunner
+from kedro_datasets.pandas import CSVDataset, ParquetDataset
+from kedro_datasets.partitions import PartitionedDataset
+from src.content_optimization.hooks import (
+    NODE_METRICS_COLUMNS,
+    NodeInstrumentationHooks,
+)
+
+
+def _double(df: pd.DataFrame) -> pd.DataFrame:
+    return pd.concat([df, df], ignore_index=True)
+
+
+def _split(df: pd.DataFrame) -> Iterator[dict[str, pd.DataFrame]]:
+    for content_category, group in df.groupby("content_category"):
+        yield {content_category: group}
+
+
+def _run(tmp_path, hooks: NodeInstrumentationHooks) -> DataCatalog:
+    """Runs a pipeline with a regular node and a generator node with the hooks."""
+    catalog = DataCatalog(
+        {
+            "articles": ParquetDataset(filepath=(tmp_path / "articles.pq").as_posix()),
+            "doubled": MemoryDataset(),
+            "partitions": PartitionedDataset(
+                path=(tmp_path / "partitions").as_posix(),
+                dataset="pandas.ParquetDataset",
+            ),
+            "node_metrics": CSVDataset(
+                filepath=(tmp_path / "node_metrics.csv").as_posix(),
+                save_args={"index": False},
+            ),
+        }
+    )
+    catalog.save(
+        "articles",
+        pd.DataFrame(
+            {
+                "id": [1, 2, 3],
+                "content_category": ["medications", "medications", "live-healthy"],
+            }
+        ),
+    )
+    test_pipeline = pipeline(
+        [
+            node(_double, "articles", "doubled", name="double_node"),
+            node(_split, "doubled", "partitions", name="split_node"),
+        ]
+    )
+
+    hook_manager = _create_hook_manager()
+    hook_manager.register(hooks)
+    hook_manager.hook.before_pipeline_run(
+        run_params={}, pipeline=test_pipeline, catalog=catalog
+    )
+    SequentialRunner().run(test_pipeline, catalog, hook_manager)
+    hook_manager.hook.after_pipeline_run(
+        run_params={}, run_result={}, pipeline=test_pipeline, catalog=catalog
+    )
+
+    return catalog
+
+
+def test_node_instrumentation_hooks(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """
+    A test function for `NodeInstrumentationHooks` that checks the metrics of the nodes.
+
+    Args:
+        tmp_path (Path): The temporary directory of the datasets.
+        monkeypatch (pytest.MonkeyPatch): The fixture to set the environment variable.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the metrics of every node in the order the nodes ran
+        2. Expects the rows of every chunk of a generator node to be counted
+        3. Expects the bytes of file-based datasets only
+        4. Expects the metrics to be saved to the metrics dataset
+    """
+    monkeypatch.setenv("NODE_METRICS", "1")
+    catalog = _run(tmp_path, NodeInstrumentationHooks())
+
+    metrics = catalog.load("node_metrics")
+    assert metrics.columns.tolist() == NODE_METRICS_COLUMNS
+    assert metrics["node"].tolist() == ["double_node", "split_node"]
+    assert metrics["input_rows"].tolist() == [3, 6]
+    assert metrics["output_rows"].tolist() == [6, 6]
+    assert (metrics["wall_time_s"] >= 0).all()
+    assert (metrics["cpu_time_s"] >= 0).all()
+    assert (metrics["peak_rss_delta_mb"] >= 0).all()
+
+    articles_size = (tmp_path / "articles.pq").stat().st_size
+    partitions_size = sum(
+        path.stat().st_size for path in (tmp_path / "partitions").iterdir()
+    )
+    assert metrics["bytes_read"].tolist()[0] == articles_size
+    assert pd.isna(metrics["bytes_written"].tolist()[0])
+    assert pd.isna(metrics["bytes_read"].tolist()[1])
+    assert metrics["bytes_written"].tolist()[1] == partitions_size
+
+
+def test_node_instrumentation_hooks_disabled(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """
+    A test function for `NodeInstrumentationHooks` without the environment variable.
+
+    Args:
+        tmp_path (Path): The temporary directory of the datasets.
+        monkeypatch (pytest.MonkeyPatch): The fixture to unset the environment variable.
+
+    Raises:
+        AssertionError: If any metrics are recorded.
+    """
+    monkeypatch.delenv("NODE_METRICS", raising=False)
+    hooks = NodeInstrumentationHooks()
+    _run(tmp_path, hooks)
+
+    assert hooks.to_frame().empty
+    assert not (tmp_path / "node_metrics.csv").exists()